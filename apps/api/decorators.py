@@ -0,0 +1,107 @@
+# Core
+from functools import wraps
+
+# Libs
+from django.db import transaction
+from django.core.validators import ValidationError
+
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.exceptions import APIException
+
+# Apps
+from apps.api.models import IdempotencyRecord, KEY_MAX_LENGTH
+from apps.api.services import idempotency as sv
+
+# Global
+from common.metrics import CACHE_REQUESTS
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+class IdempotencyConflict(APIException):
+    """A request with the same idempotency key is being processed."""
+
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "A request with this idempotency key is already in progress."
+    default_code = "idempotency_conflict"
+
+
+class _KeyTaken(Exception):
+    """A concurrent request stored the key first."""
+
+
+def _replay(record: IdempotencyRecord, fingerprint: str) -> Response:
+    """Return the stored response of a record."""
+
+    if record.fingerprint != fingerprint:
+        msg = "Key already used for a different request."
+        raise ValidationError({IDEMPOTENCY_HEADER: msg})
+    return Response(
+        data=record.body,
+        status=record.status_code,
+        headers={REPLAYED_HEADER: "true"},
+    )
+
+
+def idempotent(view):
+    """
+    Make a write API view replayable through an `Idempotency-Key` header.
+
+    A successful response is stored together with the view writes, in the
+    same transaction. Retries carrying the same key get the stored
+    response back after a single lookup, without running the view again.
+    Requests without the header are not affected.
+
+    Must be placed below `api_view` and `permission_required`, so the key
+    is scoped to the authenticated user.
+    """
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if key is None:
+            return view(request, *args, **kwargs)
+
+        key = key.strip()
+        if not key or len(key) > KEY_MAX_LENGTH:
+            msg = f"Must be between 1 and {KEY_MAX_LENGTH} characters."
+            raise ValidationError({IDEMPOTENCY_HEADER: msg})
+
+        fingerprint = sv.fingerprint_request(
+            method=request.method,
+            path=request.path,
+            body=request.body,
+        )
+
+        record = sv.get_idempotency_record(user=request.user, key=key)
+        CACHE_REQUESTS.inc(
+            cache="idempotency",
+            result="miss" if record is None else "hit",
+        )
+        if record is not None:
+            return _replay(record, fingerprint)
+
+        try:
+            with transaction.atomic():
+                response = view(request, *args, **kwargs)
+                if status.is_success(response.status_code):
+                    saved = sv.save_idempotency_record(
+                        user=request.user,
+                        key=key,
+                        fingerprint=fingerprint,
+                        status_code=response.status_code,
+                        body=getattr(response, "data", None),
+                    )
+                    if not saved:
+                        # Roll back this request's writes, the first one wins.
+                        raise _KeyTaken()
+        except _KeyTaken:
+            record = sv.get_idempotency_record(user=request.user, key=key)
+            if record is None:
+                raise IdempotencyConflict()
+            return _replay(record, fingerprint)
+        return response
+
+    return wrapper
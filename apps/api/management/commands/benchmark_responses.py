@@ -0,0 +1,115 @@
+# Core
+import json
+from statistics import median
+from time import perf_counter
+
+# Libs
+from django.urls import resolve, reverse
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework import renderers
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+# Apps
+from apps.users.models import User
+
+# Global
+from common import renderers as fast_renderers
+from common.middleware import compress, supported_encodings
+
+# (URL name, query params) of the benchmarked list endpoints.
+ENDPOINTS = (
+    ("api:products:product:list", {}),
+    ("api:products:category:list", {}),
+    ("api:tables:table:list", {}),
+    ("api:orders:order:search", {"close": "true"}),
+    ("api:payments:payment:list", {}),
+)
+
+
+class Command(BaseCommand):
+    """Compare response sizes and render times of the list endpoints."""
+
+    help = (
+        "Render the main list endpoints with the DRF JSON renderer and the "
+        "application one, and report their render time and their size "
+        "uncompressed and with every supported encoding."
+    )
+
+    def add_arguments(self, parser):
+        """Define command arguments."""
+
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Renders per endpoint and renderer, the median is reported.",
+        )
+        parser.add_argument(
+            "--username",
+            help="User of the requests, the first superuser by default.",
+        )
+
+    def handle(self, *args, **options):
+        """Run the benchmark."""
+
+        user = self._get_user(options["username"])
+        factory = APIRequestFactory()
+        before, after = renderers.JSONRenderer(), fast_renderers.JSONRenderer()
+        encoder = "orjson" if fast_renderers.orjson is not None else "json"
+        encodings = supported_encodings()
+
+        header = [f"{'endpoint':<28}", f"{'rows':>6}", f"{'identity':>10}"]
+        header += [f"{encoding:>10}" for encoding in encodings]
+        header += [f"{'drf ms':>8}", f"{encoder + ' ms':>10}"]
+        self.stdout.write(" ".join(header))
+        for name, params in ENDPOINTS:
+            path = reverse(name)
+            request = factory.get(path, params)
+            force_authenticate(request, user=user)
+            response = resolve(path).func(request)
+            if response.status_code != 200:
+                self.stderr.write(f"{name}: HTTP {response.status_code}, skipped.")
+                continue
+
+            if response.streaming:
+                # Streamed by chunks, read the content sent and render its
+                # rows again.
+                content = b"".join(response.streaming_content)
+                response.close()
+                data = json.loads(content)
+            else:
+                data = response.data
+                content = after.render(data)
+            sizes = [len(content)]
+            sizes += [len(compress(content, encoding)) for encoding in encodings]
+            timings = [
+                self._time(renderer, data, options["repeat"])
+                for renderer in (before, after)
+            ]
+
+            row = [f"{name.removeprefix('api:'):<28}", f"{len(data):>6}"]
+            row += [f"{size:>10}" for size in sizes]
+            row += [f"{timings[0]:>8.2f}", f"{timings[1]:>10.2f}"]
+            self.stdout.write(" ".join(row))
+
+    def _get_user(self, username: str | None) -> User:
+        """Return the requests user."""
+
+        users = User.objects.filter(is_superuser=True).order_by("pk")
+        if username:
+            users = User.objects.filter(username=username)
+        user = users.first()
+        if user is None:
+            raise CommandError("User not found, create a superuser first.")
+        return user
+
+    @staticmethod
+    def _time(renderer: renderers.JSONRenderer, data, repeat: int) -> float:
+        """Return the median render time of some data, in milliseconds."""
+
+        timings = []
+        for _ in range(max(repeat, 1)):
+            start = perf_counter()
+            renderer.render(data)
+            timings.append(perf_counter() - start)
+        return median(timings) * 1000
@@ -0,0 +1,215 @@
+# Core
+import os
+import sys
+import time
+import socket
+import subprocess
+from http.client import HTTPConnection
+from statistics import median, quantiles
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
+
+# Libs
+from django.conf import settings
+from django.urls import reverse
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import AccessToken
+
+# Apps
+from apps.users.models import User
+from apps.tables.models import Table
+
+# (URL name, needs a table code, query params) of the benchmarked endpoints.
+ORDER_ENDPOINTS = (
+    ("api:orders:order:search", False, {"close": "false"}),
+    ("api:orders:order:count", True, {}),
+    ("api:orders:order:state", True, {}),
+)
+
+
+class Command(BaseCommand):
+    """Measure the throughput of the pre-fork server per number of workers."""
+
+    help = (
+        "Start the `serve` pre-fork server with an increasing number of "
+        "workers and load the order endpoints with concurrent clients, "
+        "reporting the throughput and its gain per added worker (core)."
+    )
+
+    def add_arguments(self, parser):
+        """Define command arguments."""
+
+        cpus = os.cpu_count() or 1
+        parser.add_argument(
+            "--workers",
+            type=lambda value: [int(item) for item in value.split(",")],
+            default=[n for n in (1, 2, 4, 8, 16, 32) if n <= cpus] or [1],
+            help="Comma separated worker counts, powers of 2 up to the CPUs.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=2 * cpus,
+            help="Concurrent client connections.",
+        )
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=10,
+            help="Load duration per worker count, in seconds.",
+        )
+        parser.add_argument(
+            "--username",
+            help="User of the requests, the first superuser by default.",
+        )
+
+    def handle(self, *args, **options):
+        """Run the benchmark."""
+
+        headers = {"Authorization": f"Bearer {self._get_token(options['username'])}"}
+        paths = self._get_paths()
+        self.stdout.write(f"Endpoints: {', '.join(paths)}")
+        self.stdout.write(
+            f"{options['concurrency']} connections, {options['duration']:g} s "
+            f"per run, {os.cpu_count()} CPUs.\n"
+        )
+        self.stdout.write(
+            f"{'workers':>7} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} "
+            f"{'errors':>7} {'speedup':>8} {'gain/worker':>12}"
+        )
+
+        baseline = None
+        for workers in options["workers"]:
+            rate, latencies, errors = self._run(workers, paths, headers, options)
+            baseline = baseline or (workers, rate)
+            added = workers - baseline[0]
+            gain = f"{(rate - baseline[1]) / added:>12.1f}" if added else f"{'-':>12}"
+            p50 = median(latencies) if latencies else 0
+            p99 = quantiles(latencies, n=100)[-1] if len(latencies) > 1 else p50
+            self.stdout.write(
+                f"{workers:>7} {rate:>9.1f} {p50:>8.1f} {p99:>8.1f} "
+                f"{errors:>7} {rate / baseline[1]:>7.2f}x {gain}"
+            )
+
+    def _get_token(self, username: str | None) -> AccessToken:
+        """Return an access token of the requests user."""
+
+        users = User.objects.filter(is_superuser=True)
+        if username:
+            users = User.objects.filter(username=username)
+        user = users.order_by("pk").first()
+        if user is None:
+            raise CommandError("No user to authenticate the requests with.")
+        return AccessToken.for_user(user)
+
+    def _get_paths(self) -> list[str]:
+        """Return the paths of the benchmarked endpoints."""
+
+        table_code = Table.objects.values_list("code", flat=True).first()
+        paths = []
+        for name, by_table, params in ORDER_ENDPOINTS:
+            if by_table and table_code is None:
+                continue
+            path = reverse(name, args=[table_code] if by_table else [])
+            paths.append(f"{path}?{urlencode(params)}" if params else path)
+        return paths
+
+    def _run(
+        self, workers: int, paths: list[str], headers: dict, options: dict
+    ) -> tuple[float, list[float], int]:
+        """Serve with a number of workers, return `(req/s, latencies, errors)`."""
+
+        port = self._free_port()
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                "manage.py",
+                "serve",
+                f"--bind=127.0.0.1:{port}",
+                f"--workers={workers}",
+                "--max-requests=0",
+            ],
+            cwd=settings.BASE_DIR,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            self._wait_ready(port, server)
+            # Warm up every worker before measuring.
+            self._load(port, paths, headers, options["concurrency"], 1)
+            start = time.perf_counter()
+            results = self._load(
+                port, paths, headers, options["concurrency"], options["duration"]
+            )
+            elapsed = time.perf_counter() - start
+        finally:
+            server.terminate()
+            server.wait()
+
+        latencies = [latency for result in results for latency in result[0]]
+        errors = sum(result[1] for result in results)
+        return len(latencies) / elapsed, latencies, errors
+
+    def _load(
+        self, port: int, paths: list[str], headers: dict, concurrency: int, duration
+    ) -> list[tuple[list[float], int]]:
+        """Send requests from concurrent clients for a duration."""
+
+        deadline = time.perf_counter() + duration
+        with ThreadPoolExecutor(concurrency) as executor:
+            futures = [
+                executor.submit(self._client, port, paths, headers, deadline, offset)
+                for offset in range(concurrency)
+            ]
+            return [future.result() for future in futures]
+
+    def _client(
+        self, port: int, paths: list[str], headers: dict, deadline: float, offset: int
+    ) -> tuple[list[float], int]:
+        """Request the paths in turn until the deadline, return the latencies."""
+
+        latencies, errors = [], 0
+        index = offset
+        while (start := time.perf_counter()) < deadline:
+            # The server closes the connections, as its workers are not threaded.
+            connection = HTTPConnection("127.0.0.1", port, timeout=30)
+            try:
+                connection.request("GET", paths[index % len(paths)], headers=headers)
+                response = connection.getresponse()
+                response.read()
+                if response.status == 200:
+                    latencies.append((time.perf_counter() - start) * 1000)
+                else:
+                    errors += 1
+            except OSError:
+                errors += 1
+            finally:
+                connection.close()
+            index += 1
+        return latencies, errors
+
+    def _wait_ready(self, port: int, server: subprocess.Popen) -> None:
+        """Wait for the server health check to pass."""
+
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise CommandError("The server exited on start.")
+            connection = HTTPConnection("127.0.0.1", port, timeout=5)
+            try:
+                connection.request("GET", reverse("api:health"))
+                if connection.getresponse().status == 200:
+                    return
+            except OSError:
+                pass
+            finally:
+                connection.close()
+            time.sleep(0.2)
+        raise CommandError("The server did not become healthy in time.")
+
+    def _free_port(self) -> int:
+        """Return a free local port."""
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
@@ -0,0 +1,21 @@
+# Libs
+from django.core.management.base import BaseCommand
+
+# Apps
+from apps.api.services.schema import build_schema
+
+
+class Command(BaseCommand):
+    """Generate the API schema files served by the schema view."""
+
+    help = (
+        "Generate the OpenAPI schema in YAML and JSON. Run it at build or "
+        "deploy time, the schema endpoint then serves these files instead "
+        "of introspecting the views on each request."
+    )
+
+    def handle(self, *args, **options):
+        """Build the schema."""
+
+        for path in build_schema():
+            self.stdout.write(self.style.SUCCESS(f"{path} written."))
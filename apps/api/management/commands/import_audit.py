@@ -0,0 +1,170 @@
+# Core
+import re
+import sys
+import subprocess
+from statistics import median
+from time import perf_counter
+from collections import defaultdict
+
+# Libs
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+PROJECT_PACKAGES = ("apps", "common", "config")
+
+# Sets Django up and serves a single request, the way a fresh worker does.
+FIRST_REQUEST_SCRIPT = """
+import os, sys
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+import django
+django.setup()
+from django.conf import settings
+from django.test import Client
+hosts = [h for h in settings.ALLOWED_HOSTS if h != "*" and not h.startswith(".")]
+Client().get(sys.argv[1], SERVER_NAME=hosts[0] if hosts else "localhost")
+"""
+
+_IMPORT_TIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def _parse_import_times(output: str) -> list[tuple[str, int, int]]:
+    """Return the `(module, self us, cumulative us)` of an `-X importtime` log."""
+
+    modules = []
+    for line in output.splitlines():
+        match = _IMPORT_TIME.match(line)
+        if match:
+            modules.append((match[4], int(match[1]), int(match[2])))
+    return modules
+
+
+class Command(BaseCommand):
+    """Report the import cost of the project and its cold start times."""
+
+    help = (
+        "Measure the cold start of `manage.py check` and of the first request "
+        "of a fresh process, and report the most expensive imports (from "
+        "`python -X importtime`) of the first request."
+    )
+
+    def add_arguments(self, parser):
+        """Define command arguments."""
+
+        parser.add_argument(
+            "--path",
+            default="/api/tables/table/list/",
+            help="Path of the first request.",
+        )
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=3,
+            help="Cold starts per scenario, the median is reported.",
+        )
+        parser.add_argument(
+            "--sort",
+            choices=("self", "cumulative"),
+            default="cumulative",
+            help="Modules sort key.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=25,
+            help="Number of modules to report.",
+        )
+        parser.add_argument(
+            "--project",
+            action="store_true",
+            help="Only report the project modules.",
+        )
+        parser.add_argument(
+            "--check-target",
+            type=float,
+            default=settings.STARTUP_TARGETS["CHECK_MS"],
+            help="Max. `manage.py check` time, in milliseconds.",
+        )
+        parser.add_argument(
+            "--request-target",
+            type=float,
+            default=settings.STARTUP_TARGETS["FIRST_REQUEST_MS"],
+            help="Max. first request time, in milliseconds.",
+        )
+
+    def handle(self, *args, **options):
+        """Run the audit."""
+
+        check = [sys.executable, "manage.py", "check"]
+        first_request = [sys.executable, "-c", FIRST_REQUEST_SCRIPT, options["path"]]
+
+        output = self._run([sys.executable, "-X", "importtime", *first_request[1:]])
+        self._report_modules(_parse_import_times(output), options)
+
+        over = []
+        for name, command, target in (
+            ("manage.py check", check, options["check_target"]),
+            (
+                f"first request {options['path']}",
+                first_request,
+                options["request_target"],
+            ),
+        ):
+            elapsed = median(
+                self._time(command) for _ in range(max(options["runs"], 1))
+            )
+            style = self.style.SUCCESS
+            if elapsed > target:
+                style = self.style.ERROR
+                over.append(name)
+            self.stdout.write(
+                style(f"{name}: {elapsed:.0f} ms (target {target:.0f} ms)")
+            )
+
+        if over:
+            raise CommandError(f"Cold start over target: {', '.join(over)}.")
+
+    def _run(self, command: list[str]) -> str:
+        """Run a command from the project directory, return its error output."""
+
+        result = subprocess.run(
+            command,
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode:
+            raise CommandError(f"`{' '.join(command)}` failed:\n{result.stderr}")
+        return result.stderr
+
+    def _time(self, command: list[str]) -> float:
+        """Return the run time of a command, in milliseconds."""
+
+        start = perf_counter()
+        self._run(command)
+        return (perf_counter() - start) * 1000
+
+    def _report_modules(self, modules: list, options: dict) -> None:
+        """Write the most expensive modules and packages."""
+
+        packages = defaultdict(int)
+        for name, own, _ in modules:
+            packages[name.split(".")[0]] += own
+        total = sum(packages.values())
+
+        if options["project"]:
+            modules = [m for m in modules if m[0].split(".")[0] in PROJECT_PACKAGES]
+        key = 1 if options["sort"] == "self" else 2
+        modules = sorted(modules, key=lambda m: m[key], reverse=True)
+
+        self.stdout.write(
+            f"{len(packages)} packages imported in {total / 1000:.1f} ms."
+        )
+        self.stdout.write(f"{'self ms':>9} {'cumul. ms':>9}  module")
+        for name, own, cumulative in modules[: options["limit"]]:
+            self.stdout.write(f"{own / 1000:>9.1f} {cumulative / 1000:>9.1f}  {name}")
+
+        self.stdout.write(f"\n{'self ms':>9}  package")
+        top = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+        for name, own in top[: options["limit"]]:
+            self.stdout.write(f"{own / 1000:>9.1f}  {name}")
+        self.stdout.write("")
@@ -0,0 +1,93 @@
+# Core
+import io
+import pstats
+from pathlib import Path
+from datetime import datetime
+
+# Libs
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+SORT_KEYS = ("cumulative", "tottime", "ncalls")
+
+
+class Command(BaseCommand):
+    """List and render the captured request profiles."""
+
+    help = (
+        "List the captured request profiles, or render the hot functions of "
+        "a profile (or of all the profiles of an endpoint)."
+    )
+
+    def add_arguments(self, parser):
+        """Define command arguments."""
+
+        parser.add_argument(
+            "profile",
+            nargs="?",
+            help="Profile file name to render.",
+        )
+        parser.add_argument(
+            "--endpoint",
+            help="Endpoint name filter, e.g. `api:tables:table:order_statuses`.",
+        )
+        parser.add_argument(
+            "--aggregate",
+            action="store_true",
+            help="Render the combined profiles of the listed files.",
+        )
+        parser.add_argument(
+            "--sort",
+            choices=SORT_KEYS,
+            default="cumulative",
+            help="Hot functions sort key.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=25,
+            help="Number of hot functions to render.",
+        )
+
+    def handle(self, *args, **options):
+        """List or render profiles."""
+
+        directory = Path(settings.PROFILING["DIR"])
+
+        if options["profile"]:
+            path = directory / options["profile"]
+            if not path.is_file():
+                raise CommandError(f"Profile '{options['profile']}' not found.")
+            return self._render([path], options)
+
+        pattern = "*.prof"
+        if options["endpoint"]:
+            pattern = f"{options['endpoint'].replace(':', '.')}-*.prof"
+        paths = sorted(
+            directory.glob(pattern),
+            key=lambda item: item.stat().st_mtime,
+            reverse=True,
+        )
+        if not paths:
+            self.stdout.write("No profiles found.")
+            return
+
+        if options["aggregate"]:
+            return self._render(paths, options)
+
+        for path in paths:
+            modified = datetime.fromtimestamp(path.stat().st_mtime)
+            self.stdout.write(
+                f"{modified:%Y-%m-%d %H:%M:%S}  {path.stat().st_size:>9}  {path.name}"
+            )
+
+    def _render(self, paths: list[Path], options: dict) -> None:
+        """Write the hot functions of one or more profiles."""
+
+        output = io.StringIO()
+        stats = pstats.Stats(str(paths[0]), stream=output)
+        for path in paths[1:]:
+            stats.add(str(path))
+        stats.strip_dirs().sort_stats(options["sort"]).print_stats(options["limit"])
+        self.stdout.write(f"{len(paths)} profile(s)")
+        self.stdout.write(output.getvalue())
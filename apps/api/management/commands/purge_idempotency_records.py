@@ -0,0 +1,17 @@
+# Libs
+from django.core.management.base import BaseCommand
+
+# Apps
+from apps.api.services.idempotency import purge_idempotency_records
+
+
+class Command(BaseCommand):
+    """Delete expired `Idempotency-Key` responses."""
+
+    help = "Delete expired idempotency records."
+
+    def handle(self, *args, **options):
+        """Purge expired records."""
+
+        deleted = purge_idempotency_records()
+        self.stdout.write(self.style.SUCCESS(f"{deleted} expired record(s) deleted."))
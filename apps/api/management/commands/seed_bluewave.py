@@ -0,0 +1,343 @@
+# Core
+import io
+import time
+import random
+from datetime import datetime, timedelta
+
+# Libs
+from PIL import Image
+from django.db import transaction
+from django.utils.timezone import localdate, make_aware, now
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+
+# Apps
+from apps.users.models import User
+from apps.tables.models import Table
+from apps.products.models import Category, Product
+from apps.products.models.product import MAX_PRICE, MIN_PRICE
+from apps.tables.models.table import CODE_LENGTH as TABLE_CODE_LENGTH
+from apps.transactions.models.order import CODE_LENGTH as ORDER_CODE_LENGTH
+from apps.transactions.models.payment import CODE_LENGTH as PAYMENT_CODE_LENGTH
+
+from apps.transactions.models import (
+    Order,
+    OrderStatus,
+    Payment,
+    PaymentStatus,
+    PaymentType,
+    MAX_QUANTITY,
+    MIN_QUANTITY,
+)
+
+_BASE62 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+_ADJECTIVES = ("Classic", "Spicy", "Sweet", "Grilled", "Fresh", "Smoked", "Iced")
+_NOUNS = ("burger", "salad", "taco", "coffee", "juice", "pizza", "soup", "cake")
+
+# Table sessions open between 8:00 and 23:00 and last up to 2 hours.
+_OPENING_SECONDS = 8 * 3600
+_CLOSING_SECONDS = 23 * 3600
+_MAX_SESSION_SECONDS = 2 * 3600
+
+_CODES_PER_SEED = 62**4
+_SEEDS = 62**2
+
+_CANCEL_RATE = 0.05
+_MAX_ORDERS_PER_SESSION = 6
+
+
+def _base62(number: int, length: int) -> str:
+    """Return a fixed length base 62 code of a number."""
+
+    digits = []
+    for _ in range(length):
+        number, digit = divmod(number, 62)
+        digits.append(_BASE62[digit])
+    if number:
+        raise CommandError("Codes space exhausted.")
+    return "".join(reversed(digits))
+
+
+def _first_code_number(seed: int) -> int:
+    """
+    Return the first order and payment code number of a seed.
+
+    Each seed owns its own block of sequential codes, so seeds can be stacked
+    on the same database. Random codes of regular orders and payments
+    seldom fall in a block.
+    """
+
+    if not 0 <= seed < _SEEDS:
+        raise CommandError(f"The seed must be between 0 and {_SEEDS - 1}.")
+    return seed * _CODES_PER_SEED
+
+
+def _placeholder_image(rng: random.Random, name: str) -> str:
+    """Store a small solid color PNG image and return its name."""
+
+    color = tuple(rng.randrange(256) for _ in range(3))
+    content = io.BytesIO()
+    Image.new("RGB", (16, 16), color).save(content, format="PNG")
+    return default_storage.save(name, ContentFile(content.getvalue()))
+
+
+class Command(BaseCommand):
+    """Generate load fixtures at scale."""
+
+    help = (
+        "Generate tables, categories, products and months of closed orders"
+        " and paid payments. The same seed on the same database generates the"
+        " same data."
+    )
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+
+        parser.add_argument("--tables", type=int, default=50)
+        parser.add_argument("--categories", type=int, default=10)
+        parser.add_argument("--products", type=int, default=200)
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=90,
+            help="Days of history, ending yesterday.",
+        )
+        parser.add_argument(
+            "--sessions-per-day",
+            type=int,
+            default=300,
+            help="Paid table sessions per day, of about 3.5 orders each.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=20000,
+            help="Orders inserted per transaction.",
+        )
+        parser.add_argument(
+            "--username",
+            help="Audit user of the generated rows, the first superuser by default.",
+        )
+
+    def handle(self, *args, **options):
+        """Seed the database."""
+
+        rng = random.Random(options["seed"])
+        first_code = _base62(_first_code_number(options["seed"]), ORDER_CODE_LENGTH)
+        if Payment.objects.filter(code=first_code).exists():
+            raise CommandError(f"Seed {options['seed']} was already used.")
+
+        self.user = self._get_user(options["username"])
+        self.batch_size = options["batch_size"]
+        started = time.perf_counter()
+
+        with transaction.atomic():
+            tables = self._seed_tables(options["tables"])
+            categories = self._seed_categories(rng, options["categories"])
+            products = self._seed_products(rng, options["products"], categories)
+
+        if not tables or not products:
+            raise CommandError("At least one table and one product are required.")
+
+        orders, payments = self._seed_history(
+            rng,
+            first_code_number=_first_code_number(options["seed"]),
+            tables=tables,
+            products=products,
+            days=options["days"],
+            sessions_per_day=options["sessions_per_day"],
+        )
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(tables)} tables, {len(categories)} categories,"
+                f" {len(products)} products, {orders} orders and {payments}"
+                f" payments generated in {elapsed:.1f}s."
+            )
+        )
+
+    def _get_user(self, username: str | None) -> User:
+        """Return the audit user."""
+
+        users = User.objects.filter(is_superuser=True).order_by("pk")
+        if username:
+            users = User.objects.filter(username=username)
+        user = users.first()
+        if user is None:
+            raise CommandError("Audit user not found, create a superuser first.")
+        return user
+
+    def _audit(self, timestamp: datetime) -> dict:
+        """Return the audit fields of a generated row."""
+
+        return {
+            "created_at": timestamp,
+            "created_by": self.user,
+            "updated_at": timestamp,
+            "updated_by": self.user,
+        }
+
+    def _seed_tables(self, count: int) -> list[Table]:
+        """Create tables numbered after the existing ones."""
+
+        codes = Table.objects.values_list("code", flat=True)
+        start = max((int(code) for code in codes if code.isnumeric()), default=0) + 1
+        if start + count > 10**TABLE_CODE_LENGTH:
+            raise CommandError("Not enough table codes left.")
+
+        audit = self._audit(now())
+        return Table.objects.bulk_create(
+            [
+                Table(code=str(number).zfill(TABLE_CODE_LENGTH), **audit)
+                for number in range(start, start + count)
+            ],
+            batch_size=self.batch_size,
+        )
+
+    def _seed_categories(self, rng: random.Random, count: int) -> list[Category]:
+        """Create categories with placeholder images."""
+
+        start = Category.objects.count() + 1
+        audit = self._audit(now())
+        return Category.objects.bulk_create(
+            [
+                Category(
+                    name=f"Category {number}",
+                    image=_placeholder_image(rng, f"categories/seed_{number}.png"),
+                    **audit,
+                )
+                for number in range(start, start + count)
+            ],
+            batch_size=self.batch_size,
+        )
+
+    def _seed_products(
+        self,
+        rng: random.Random,
+        count: int,
+        categories: list[Category],
+    ) -> list[Product]:
+        """Create products with placeholder images."""
+
+        if not categories:
+            categories = list(Category.objects.all())
+        if not categories:
+            return []
+
+        start = Product.objects.count() + 1
+        audit = self._audit(now())
+        products = []
+        for number in range(start, start + count):
+            name = f"{rng.choice(_ADJECTIVES)} {rng.choice(_NOUNS)} {number}"
+            products.append(
+                Product(
+                    name=name,
+                    description=f"{name} description.",
+                    price=rng.randrange(MIN_PRICE, MAX_PRICE // 4, 50),
+                    image=_placeholder_image(rng, f"products/seed_{number}.png"),
+                    category=rng.choice(categories),
+                    **audit,
+                )
+            )
+        return Product.objects.bulk_create(products, batch_size=self.batch_size)
+
+    def _seed_history(
+        self,
+        rng: random.Random,
+        *,
+        first_code_number: int,
+        tables: list[Table],
+        products: list[Product],
+        days: int,
+        sessions_per_day: int,
+    ) -> tuple[int, int]:
+        """
+        Create closed orders and their paid payments, day by day.
+
+        Rows are accumulated and inserted with `bulk_create`, one transaction
+        per batch, instead of one `save` (and one transaction) per row.
+        """
+
+        order_number = payment_number = first_code_number
+        orders: list[Order] = []
+        payments: list[Payment] = []
+        total_orders = total_payments = 0
+
+        today = localdate()
+        for day in range(days, 0, -1):
+            midnight = make_aware(
+                datetime.combine(today - timedelta(days=day), datetime.min.time())
+            )
+            for _ in range(sessions_per_day):
+                table = rng.choice(tables)
+                opened_at = midnight + timedelta(
+                    seconds=rng.randrange(_OPENING_SECONDS, _CLOSING_SECONDS)
+                )
+                closed_at = opened_at + timedelta(
+                    seconds=rng.randrange(600, _MAX_SESSION_SECONDS)
+                )
+
+                payment = Payment(
+                    code=_base62(payment_number, PAYMENT_CODE_LENGTH),
+                    table=table,
+                    type=rng.choice(PaymentType.values),
+                    status=PaymentStatus.PAID,
+                    total=0,
+                    **self._audit(closed_at),
+                )
+
+                session_size = rng.randint(1, _MAX_ORDERS_PER_SESSION)
+                session_orders = []
+                for product in rng.sample(products, min(session_size, len(products))):
+                    quantity = rng.randint(MIN_QUANTITY, MAX_QUANTITY)
+                    status = (
+                        OrderStatus.CANCELED
+                        if rng.random() < _CANCEL_RATE
+                        else OrderStatus.DELIVERED
+                    )
+                    order = Order(
+                        code=_base62(order_number, ORDER_CODE_LENGTH),
+                        table=table,
+                        product=product,
+                        quantity=quantity,
+                        unit_price=product.price,
+                        line_total=product.price * quantity,
+                        status=status,
+                        is_closed=True,
+                        payment=payment,
+                        **self._audit(opened_at),
+                    )
+                    order.updated_at = closed_at
+                    order_number += 1
+                    session_orders.append(order)
+                    if status != OrderStatus.CANCELED:
+                        payment.total += order.line_total
+
+                if payment.total:
+                    payment_number += 1
+                    payments.append(payment)
+                else:
+                    # Fully canceled sessions are closed without payment.
+                    for order in session_orders:
+                        order.payment = None
+                orders.extend(session_orders)
+
+            if len(orders) >= self.batch_size or day == 1:
+                self._flush(orders, payments)
+                total_orders += len(orders)
+                total_payments += len(payments)
+                self.stdout.write(f"{midnight.date()}: {total_orders} orders.")
+                orders, payments = [], []
+
+        return total_orders, total_payments
+
+    def _flush(self, orders: list[Order], payments: list[Payment]) -> None:
+        """Insert a batch of payments and their orders."""
+
+        with transaction.atomic():
+            Payment.objects.bulk_create(payments, batch_size=self.batch_size)
+            Order.objects.bulk_create(orders, batch_size=self.batch_size)
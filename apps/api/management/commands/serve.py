@@ -0,0 +1,91 @@
+# Core
+import os
+
+# Libs
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Global
+from common.metrics import clear_metrics_dir
+from common.server import LISTEN_FD_ENV, PreforkServer, preload_application
+
+
+class Command(BaseCommand):
+    """Run the production pre-fork server."""
+
+    help = (
+        "Serve the application with a pre-fork server: the master imports "
+        "the application once and forks the workers, sharing its memory. "
+        "SIGHUP reloads the code with no downtime, SIGTERM and SIGINT stop "
+        "gracefully."
+    )
+
+    def add_arguments(self, parser):
+        """Define command arguments."""
+
+        parser.add_argument(
+            "--bind",
+            default=settings.SERVER["BIND"],
+            help="Listening `host:port`.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.SERVER["WORKERS"],
+            help="Number of worker processes.",
+        )
+        parser.add_argument(
+            "--max-requests",
+            type=int,
+            default=settings.SERVER["MAX_REQUESTS"],
+            help="Requests served by a worker before it is replaced, 0 never.",
+        )
+        parser.add_argument(
+            "--max-requests-jitter",
+            type=int,
+            default=settings.SERVER["MAX_REQUESTS_JITTER"],
+            help="Max. random requests added to `--max-requests` per worker.",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=settings.SERVER["TIMEOUT"],
+            help="Seconds a worker may hang before it is killed.",
+        )
+        parser.add_argument(
+            "--read-timeout",
+            type=float,
+            default=settings.SERVER["READ_TIMEOUT"],
+            help="Seconds a connection may stay idle before it is closed.",
+        )
+        parser.add_argument(
+            "--graceful-timeout",
+            type=float,
+            default=settings.SERVER["GRACEFUL_TIMEOUT"],
+            help="Seconds given to stopped workers to finish their requests.",
+        )
+
+    def handle(self, *args, **options):
+        """Preload the application and serve it."""
+
+        if LISTEN_FD_ENV not in os.environ:
+            # Fresh start, and not a reload: reset the metrics of old workers,
+            # before the warm-up of the preload records its own.
+            clear_metrics_dir()
+        application = preload_application()
+
+        self.stdout.write(
+            f"Serving on http://{options['bind']}/ with {options['workers']} "
+            f"workers (master PID {os.getpid()})."
+        )
+        PreforkServer(
+            application,
+            bind=options["bind"],
+            workers=max(options["workers"], 1),
+            max_requests=options["max_requests"],
+            max_requests_jitter=options["max_requests_jitter"],
+            timeout=options["timeout"],
+            read_timeout=options["read_timeout"],
+            graceful_timeout=options["graceful_timeout"],
+            backlog=settings.SERVER["BACKLOG"],
+        ).run()
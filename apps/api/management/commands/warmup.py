@@ -0,0 +1,118 @@
+# Core
+import io
+from statistics import median
+from time import perf_counter
+
+# Libs
+from django.conf import settings
+from django.core.wsgi import get_wsgi_application
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import AccessToken
+
+# Apps
+from apps.users.models import User
+
+# Global
+from common.warmup import run_warmup
+
+
+class Command(BaseCommand):
+    """Run the warm-up tasks and report their time."""
+
+    help = (
+        "Run the warm-up tasks of a server process (`WARMUP` setting) and "
+        "report the time of each. With `--path`, then compare the first "
+        "request of the process to the following ones."
+    )
+    # The checks would warm the process up, e.g. the URL patterns.
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        """Define command arguments."""
+
+        parser.add_argument(
+            "--task",
+            action="append",
+            dest="tasks",
+            help="Dotted path of a task to run instead of the configured ones.",
+        )
+        parser.add_argument(
+            "--cold",
+            action="store_true",
+            help="Skip the warm-up, to measure cold requests.",
+        )
+        parser.add_argument(
+            "--path",
+            action="append",
+            dest="paths",
+            default=[],
+            help="GET path to request after the warm-up.",
+        )
+        parser.add_argument(
+            "--user",
+            help="Username the requests are authenticated as.",
+        )
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=10,
+            help="Requests per path after the first, the median is reported.",
+        )
+
+    def handle(self, *args, **options):
+        """Warm up, then time the requests."""
+
+        headers = {}
+        if options["user"]:
+            user = User.objects.filter(username=options["user"]).first()
+            if user is None:
+                raise CommandError(f"User {options['user']!r} not found.")
+            headers["HTTP_AUTHORIZATION"] = f"Bearer {AccessToken.for_user(user)}"
+
+        if not options["cold"]:
+            durations = run_warmup(options["tasks"] or settings.WARMUP["TASKS"])
+            self.stdout.write(f"{'ms':>9}  task")
+            for task, duration in durations.items():
+                if duration is None:
+                    self.stdout.write(self.style.ERROR(f"{'failed':>9}  {task}"))
+                else:
+                    self.stdout.write(f"{duration * 1000:>9.1f}  {task}")
+            total = sum(filter(None, durations.values()))
+            self.stdout.write(f"{total * 1000:>9.1f}  total\n")
+
+        if not options["paths"]:
+            return
+        application = get_wsgi_application()
+        self.stdout.write(f"{'first ms':>9} {'next ms':>9}  path")
+        for path in options["paths"]:
+            first = self._request(application, path, headers)
+            following = median(
+                self._request(application, path, headers)
+                for _ in range(max(options["runs"], 1))
+            )
+            style = self.style.SUCCESS if first <= following * 1.5 else self.style.ERROR
+            self.stdout.write(style(f"{first:>9.1f} {following:>9.1f}  {path}"))
+
+    @staticmethod
+    def _request(application, path: str, headers: dict) -> float:
+        """Serve a GET request, return its time in milliseconds."""
+
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": path,
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "HTTP_HOST": "localhost",
+            "REMOTE_ADDR": "127.0.0.1",
+            "wsgi.url_scheme": "http",
+            "wsgi.input": io.BytesIO(),
+            **headers,
+        }
+        start = perf_counter()
+        response = application(environ, lambda status, response_headers: None)
+        try:
+            for _ in response:
+                pass
+        finally:
+            response.close()
+        return (perf_counter() - start) * 1000
@@ -0,0 +1,68 @@
+# Generated by Django 5.0.3 on 2026-10-19 15:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdempotencyRecord",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=64, verbose_name="Key")),
+                (
+                    "fingerprint",
+                    models.CharField(max_length=32, verbose_name="Request fingerprint"),
+                ),
+                (
+                    "status_code",
+                    models.PositiveSmallIntegerField(verbose_name="Status code"),
+                ),
+                ("body", models.JSONField(null=True, verbose_name="Response body")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created"),
+                ),
+                (
+                    "expires_at",
+                    models.DateTimeField(db_index=True, verbose_name="Expires"),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="idempotency_records",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Idempotency record",
+                "verbose_name_plural": "Idempotency records",
+                "default_permissions": (),
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="idempotencyrecord",
+            constraint=models.UniqueConstraint(
+                fields=("user", "key"), name="api_idempotencyrecord_user_key_unique"
+            ),
+        ),
+    ]
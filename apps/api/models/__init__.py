@@ -0,0 +1 @@
+from apps.api.models.idempotency import IdempotencyRecord, KEY_MAX_LENGTH  # noqa
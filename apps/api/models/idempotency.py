@@ -0,0 +1,55 @@
+# Libs
+from django.db import models
+
+KEY_MAX_LENGTH = 64
+FINGERPRINT_LENGTH = 32
+
+
+class IdempotencyRecord(models.Model):
+    """
+    A stored API response for an `Idempotency-Key`.
+
+    Only the minimum required to replay a response is persisted: the
+    status code, the (usually empty) body and a request fingerprint used
+    to reject a key being reused with a different payload.
+    """
+
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="idempotency_records",
+    )
+    key = models.CharField(
+        verbose_name="Key",
+        max_length=KEY_MAX_LENGTH,
+    )
+    fingerprint = models.CharField(
+        verbose_name="Request fingerprint",
+        max_length=FINGERPRINT_LENGTH,
+    )
+    status_code = models.PositiveSmallIntegerField(
+        verbose_name="Status code",
+    )
+    body = models.JSONField(
+        verbose_name="Response body",
+        null=True,
+    )
+    created_at = models.DateTimeField(
+        verbose_name="Created",
+        auto_now_add=True,
+    )
+    expires_at = models.DateTimeField(
+        verbose_name="Expires",
+        db_index=True,
+    )
+
+    class Meta:
+        verbose_name = "Idempotency record"
+        verbose_name_plural = "Idempotency records"
+        default_permissions = ()
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "key"],
+                name="%(app_label)s_%(class)s_user_key_unique",
+            ),
+        ]
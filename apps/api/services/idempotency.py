@@ -0,0 +1,77 @@
+# Core
+import hashlib
+
+# Libs
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils.timezone import now
+
+# Apps
+from apps.users.models import User
+from apps.api.models import IdempotencyRecord
+from apps.api.models.idempotency import FINGERPRINT_LENGTH
+
+
+def fingerprint_request(*, method: str, path: str, body: bytes) -> str:
+    """Return a short digest identifying a request payload."""
+
+    digest = hashlib.sha256()
+    for part in (method.encode(), path.encode(), body):
+        digest.update(part)
+        digest.update(b"\0")
+    return digest.hexdigest()[:FINGERPRINT_LENGTH]
+
+
+def get_idempotency_record(*, user: User, key: str) -> IdempotencyRecord | None:
+    """Return the live record stored for a key, if any."""
+
+    record = IdempotencyRecord.objects.filter(user_id=user.id, key=key).first()
+    if record is None or record.expires_at <= now():
+        return None
+    return record
+
+
+def save_idempotency_record(
+    *,
+    user: User,
+    key: str,
+    fingerprint: str,
+    status_code: int,
+    body,
+) -> bool:
+    """
+    Store a response for a key.
+
+    Return False if a concurrent request already stored the key, so the
+    caller can roll back its own work.
+    """
+
+    current_timestamp = now()
+
+    # An expired record must not block the key from being reused.
+    IdempotencyRecord.objects.filter(
+        user_id=user.id,
+        key=key,
+        expires_at__lte=current_timestamp,
+    ).delete()
+
+    try:
+        with transaction.atomic():
+            IdempotencyRecord.objects.create(
+                user_id=user.id,
+                key=key,
+                fingerprint=fingerprint,
+                status_code=status_code,
+                body=body,
+                expires_at=current_timestamp + settings.IDEMPOTENCY_KEY_TTL,
+            )
+    except IntegrityError:
+        return False
+    return True
+
+
+def purge_idempotency_records() -> int:
+    """Delete expired records and return how many were removed."""
+
+    deleted, _ = IdempotencyRecord.objects.filter(expires_at__lte=now()).delete()
+    return deleted
@@ -0,0 +1,74 @@
+# Core
+import hashlib
+from pathlib import Path
+
+# Libs
+from django.conf import settings
+from drf_spectacular import generators
+from drf_spectacular.settings import spectacular_settings
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+
+# Apps
+from apps.tables import schema as tables_schema  # noqa: F401
+
+# Global
+from common.schema import apply_deferred_schemas
+
+SCHEMA_RENDERERS = {
+    "yaml": OpenApiYamlRenderer,
+    "json": OpenApiJsonRenderer,
+}
+
+# Loaded schema files by format: `(modification time, content, ETag)`.
+_loaded: dict[str, tuple[int, bytes, str]] = {}
+
+
+class SchemaGenerator(generators.SchemaGenerator):
+    """Schema generator applying the deferred view schemas first."""
+
+    def get_schema(self, request=None, public=False):
+        """Extend to apply the deferred view schemas."""
+
+        apply_deferred_schemas()
+        return super().get_schema(request=request, public=public)
+
+
+def schema_path(schema_format: str) -> Path:
+    """Return the path of a built schema file."""
+
+    return Path(settings.API_SCHEMA["DIR"]) / f"schema.{schema_format}"
+
+
+def build_schema() -> list[Path]:
+    """Generate the API schema and write it in every format."""
+
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    schema = generator.get_schema(request=None, public=True)
+
+    paths = []
+    for schema_format, renderer_class in SCHEMA_RENDERERS.items():
+        path = schema_path(schema_format)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(renderer_class().render(schema, renderer_context={}))
+        paths.append(path)
+    return paths
+
+
+def load_schema(schema_format: str) -> tuple[bytes, str] | None:
+    """
+    Return the content and ETag of a built schema file, if any.
+
+    The file is read once per process, and again only when rebuilt.
+    """
+
+    try:
+        modified = schema_path(schema_format).stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    loaded = _loaded.get(schema_format)
+    if loaded is None or loaded[0] != modified:
+        content = schema_path(schema_format).read_bytes()
+        etag = f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+        loaded = _loaded[schema_format] = (modified, content, etag)
+    return loaded[1], loaded[2]
@@ -1,59 +1,149 @@
 from django.urls import include, path
 
-
-# Apps urls
-from apps.users.urls import urlpatterns as users_api
-from apps.products.urls.product import api_patterns as product
-from apps.products.urls.category import api_patterns as category
-from apps.tables.urls.table import api_patterns as table
-from apps.transactions.urls.order import api_patterns as order
-from apps.transactions.urls.payment import api_patterns as payment
-
-# Forms urls
-from apps.users.urls.form import users_form_patterns as users_form
-from apps.products.urls.form import products_form_patterns as products_form
-from apps.tables.urls.form import tables_form_patterns as tables_form
-from apps.transactions.urls.form import orders_form_patterns as orders_form
-
-from apps.api.views import APISchemaView, APISpecsView
+from common.urls import lazy_include, lazy_view
 
 
 app_name = "api"
 
-# <entity>_api = [path(".../", include((..., app_name), namespace=""))]
+# App URL modules are imported when first resolved, see `lazy_include`.
+# <entity>_api = [
+#     path(".../", lazy_include("<module>", "<patterns>", app_name=..., namespace=""))
+# ]
 forms_api = [
-    path("user/", include((users_form, app_name), namespace="user")),
-    path("product/", include((products_form, app_name), namespace="product")),
-    path("table/", include((tables_form, app_name), namespace="table")),
-    path("order/", include((orders_form, app_name), namespace="order")),
+    path(
+        "user/",
+        lazy_include(
+            "apps.users.urls.form",
+            "users_form_patterns",
+            app_name=app_name,
+            namespace="user",
+        ),
+    ),
+    path(
+        "product/",
+        lazy_include(
+            "apps.products.urls.form",
+            "products_form_patterns",
+            app_name=app_name,
+            namespace="product",
+        ),
+    ),
+    path(
+        "table/",
+        lazy_include(
+            "apps.tables.urls.form",
+            "tables_form_patterns",
+            app_name=app_name,
+            namespace="table",
+        ),
+    ),
+    path(
+        "order/",
+        lazy_include(
+            "apps.transactions.urls.form",
+            "orders_form_patterns",
+            app_name=app_name,
+            namespace="order",
+        ),
+    ),
 ]
 
 products_api = [
-    path("product/", include((product, app_name), namespace="product")),
-    path("category/", include((category, app_name), namespace="category")),
+    path(
+        "product/",
+        lazy_include(
+            "apps.products.urls.product",
+            "api_patterns",
+            app_name=app_name,
+            namespace="product",
+        ),
+    ),
+    path(
+        "category/",
+        lazy_include(
+            "apps.products.urls.category",
+            "api_patterns",
+            app_name=app_name,
+            namespace="category",
+        ),
+    ),
 ]
 
 tables_api = [
-    path("table/", include((table, app_name), namespace="table")),
+    path(
+        "table/",
+        lazy_include(
+            "apps.tables.urls.table",
+            "api_patterns",
+            app_name=app_name,
+            namespace="table",
+        ),
+    ),
 ]
 
 orders_api = [
-    path("order/", include((order, app_name), namespace="order")),
+    path(
+        "order/",
+        lazy_include(
+            "apps.transactions.urls.order",
+            "api_patterns",
+            app_name=app_name,
+            namespace="order",
+        ),
+    ),
 ]
 
 payments_api = [
-    path("payment/", include((payment, app_name), namespace="payment")),
+    path(
+        "payment/",
+        lazy_include(
+            "apps.transactions.urls.payment",
+            "api_patterns",
+            app_name=app_name,
+            namespace="payment",
+        ),
+    ),
+]
+
+events_api = [
+    path(
+        "event/",
+        lazy_include(
+            "apps.transactions.urls.event",
+            "api_patterns",
+            app_name=app_name,
+            namespace="event",
+        ),
+    ),
+]
+
+reports_api = [
+    path(
+        "report/",
+        lazy_include(
+            "apps.transactions.urls.report",
+            "api_patterns",
+            app_name=app_name,
+            namespace="report",
+        ),
+    ),
 ]
 
 
 urlpatterns = [
-    path("schema/", APISchemaView.as_view(), name="schema"),
-    path("specs/", APISpecsView.as_view(), name="specs"),
-    path("users/", include((users_api, app_name), namespace="users")),
+    path("schema/", lazy_view("apps.api.views.APISchemaView"), name="schema"),
+    path("specs/", lazy_view("apps.api.views.APISpecsView"), name="specs"),
+    path("metrics/", lazy_view("apps.api.views.metrics_view"), name="metrics"),
+    path("health/", lazy_view("apps.api.views.health_view"), name="health"),
+    path(
+        "users/", lazy_include("apps.users.urls", app_name=app_name, namespace="users")
+    ),
     path("products/", include((products_api, app_name), namespace="products")),
     path("tables/", include((tables_api, app_name), namespace="tables")),
     path("orders/", include((orders_api, app_name), namespace="orders")),
     path("payments/", include((payments_api, app_name), namespace="payments")),
+    path("events/", include((events_api, app_name), namespace="events")),
+    path("reports/", include((reports_api, app_name), namespace="reports")),
     path(
         "forms/",
         include(
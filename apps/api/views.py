@@ -1,11 +1,85 @@
+# Libs
+from django.conf import settings
+from django.utils.http import parse_etags
+from django.db import connection
+from django.http import Http404, HttpResponse, HttpResponseNotModified, JsonResponse
 from drf_spectacular import views
+from drf_spectacular.utils import extend_schema
+
+# Apps
+from apps.transactions import metrics as transactions_metrics  # noqa: F401
+from apps.api.services.schema import load_schema
+
+# Global
+from common.metrics import render_metrics
 
 
 class APISchemaView(views.SpectacularAPIView):
-    """API schema view."""
+    """
+    API schema view.
+
+    Serves the schema files generated by the `build_schema` command, with
+    their ETag. Without them, the schema is generated on each request.
+    """
+
+    @extend_schema(**views.SCHEMA_KWARGS)
+    def get(self, request, *args, **kwargs):
+        """Extend to serve the built schema."""
+        schema_format = request.accepted_renderer.format
+        built = load_schema(schema_format)
+        if built is None:
+            return super().get(request, *args, **kwargs)
+
+        content, etag = built
+        # Compared weakly, compressed responses carry a weak ETag.
+        if_none_match = request.headers.get("If-None-Match", "")
+        matches = {tag.removeprefix("W/") for tag in parse_etags(if_none_match)}
+        if etag in matches or "*" in matches:
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(
+                content,
+                content_type=f"{request.accepted_media_type}; charset=utf-8",
+            )
+            response["Content-Disposition"] = (
+                f'inline; filename="schema.{schema_format}"'
+            )
+        response["ETag"] = etag
+        response["Cache-Control"] = "no-cache"
+        return response
 
 
 class APISpecsView(views.SpectacularRedocView):
     """API specifications view."""
 
     url_name = "api:schema"
+
+
+def metrics_view(request) -> HttpResponse:
+    """
+    Return the application metrics in the Prometheus text format.
+
+    Internal endpoint: only served to `INTERNAL_IPS` clients.
+    """
+
+    if request.META.get("REMOTE_ADDR") not in settings.INTERNAL_IPS:
+        raise Http404()
+    return HttpResponse(
+        render_metrics(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+def health_view(request) -> JsonResponse:
+    """
+    Return the health of the serving worker, for load balancers.
+
+    Healthy when the worker is serving and its database answers.
+    """
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+    except Exception:
+        return JsonResponse({"status": "unavailable"}, status=503)
+    return JsonResponse({"status": "ok"})
@@ -1,7 +1,26 @@
-# from django.contrib import admin
-# from apps.products.models import Category
-#
-#
-# @admin.register(Category)
-# class CategoryAdmin(admin.ModelAdmin):
-#     pass
+from django.contrib import admin
+
+from apps.products.models import Category, Product
+from apps.users.admin import AuditModelAdmin
+
+
+@admin.register(Category)
+class CategoryAdmin(AuditModelAdmin):
+    """Register category admin."""
+
+    list_display = ("name", "is_active", "created_at", "created_by_name")
+    list_filter = ("is_active",)
+    search_fields = ("name",)
+    ordering = ("name",)
+
+
+@admin.register(Product)
+class ProductAdmin(AuditModelAdmin):
+    """Register product admin."""
+
+    list_display = ("name", "category", "price", "is_active", "created_by_name")
+    list_select_related = ("category",)
+    list_filter = ("is_active",)
+    search_fields = ("name",)
+    ordering = ("name",)
+    raw_id_fields = ("category",)
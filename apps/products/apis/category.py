@@ -6,16 +6,24 @@ from rest_framework.response import Response
 from rest_framework.decorators import api_view
 from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED
 
-from drf_spectacular.utils import OpenApiResponse, extend_schema, OpenApiParameter
+from drf_spectacular.utils import OpenApiResponse, OpenApiParameter
 
 # Apps
 from apps.products.services import category as sv
 from apps.products.serializers import category as srz
 
 # Global
+from common.schema import extend_schema
 from common import functions as fn
-from common.api import filter_parameter_spec
+from common.api import (
+    filter_parameter_spec,
+    import_request_spec,
+    selection_parameter_specs,
+)
+from common.serializers import ImportResultSerializer
+from common.imports import parse_import_rows, validate_import_rows
 from common.decorators import permission_required
+from common.streaming import stream_list_response
 
 
 _category_api_schema = partial(extend_schema, tags=["Categories"])
@@ -51,7 +59,11 @@ def get_category(request, category_id: int) -> Response:
 # noinspection PyUnusedLocal
 @_category_api_schema(
     summary="List categories",
-    parameters=[filter_parameter_spec(scope="categories"), _category_id_params],
+    parameters=[
+        filter_parameter_spec(scope="categories"),
+        _category_id_params,
+        *selection_parameter_specs(),
+    ],
     responses=OpenApiResponse(
         response=srz.CategoryInfoSerializer(many=True),
         description="Categories successfully retrieved.",
@@ -63,11 +75,17 @@ def list_categories(request) -> Response:
     """Return a list of categories."""
 
     filter_by = fn.validate_filter_query_param(request.query_params)
-    output = srz.CategoryInfoSerializer(
+    selection = fn.validate_selection_query_params(request.query_params)
+    categories = srz.CategoryInfoSerializer.shape_queryset(
         sv.list_categories(filter_by=filter_by),
-        many=True,
+        **selection,
+    )
+    return stream_list_response(
+        request,
+        categories,
+        serializer_class=srz.CategoryInfoSerializer,
+        **selection,
     )
-    return Response(data=output.data, status=HTTP_200_OK)
 
 
 # noinspection PyUnusedLocal
@@ -85,11 +103,11 @@ def list_product_by_category(request, category_id: int) -> Response:
     """Return a list of products by category."""
 
     filter_by = fn.validate_filter_query_param(request.query_params)
-    output = srz.CategoryProductsInfoSerializer(
+    return stream_list_response(
+        request,
         sv.get_products_by_category(category_id, filter_by),
-        many=True,
+        serializer_class=srz.CategoryProductsInfoSerializer,
     )
-    return Response(data=output.data, status=HTTP_200_OK)
 
 
 @_category_api_schema(
@@ -137,3 +155,29 @@ def update_category(request, category_id: int) -> Response:
     )
     output = srz.CategoryInfoSerializer(category)
     return Response(data=output.data, status=HTTP_200_OK)
+
+
+@_category_api_schema(
+    summary="Import categories",
+    description=(
+        "Create categories, or update them when the row has an `id`, from a"
+        " JSON list of rows or a CSV `file`. Nothing is saved unless every row"
+        " is valid, errors are reported by row number."
+    ),
+    request=import_request_spec(srz.CategoryImportSerializer),
+    responses=OpenApiResponse(
+        response=ImportResultSerializer,
+        description="Categories successfully imported.",
+    ),
+)
+@api_view(["POST"])
+@permission_required(["products.create_category", "products.change_category"])
+def import_categories(request) -> Response:
+    """Create and update categories in bulk."""
+
+    rows = validate_import_rows(
+        srz.CategoryImportSerializer, parse_import_rows(request)
+    )
+    result = sv.import_categories(user=request.user, rows=rows)
+    output = ImportResultSerializer(result)
+    return Response(data=output.data, status=HTTP_200_OK)
@@ -6,7 +6,7 @@ from django.forms import model_to_dict
 from rest_framework.response import Response
 from rest_framework.status import HTTP_200_OK
 
-from drf_spectacular.utils import OpenApiResponse, extend_schema
+from drf_spectacular.utils import OpenApiResponse
 
 from rest_framework.decorators import api_view, authentication_classes
 
@@ -16,6 +16,7 @@ from apps.products.services.product import get_product
 from apps.products.services.category import get_category
 
 # Global
+from common.schema import extend_schema
 from common.functions import form_to_api_schema
 
 
@@ -30,8 +31,8 @@ _product_form_api_schema = partial(extend_schema, tags=["Forms"])
         description="Create category form successfully retrieved.",
     ),
 )
-@authentication_classes(None)
 @api_view(["GET"])
+@authentication_classes([])
 def get_create_category_form(request) -> Response:
     """Return a category create form schema."""
 
@@ -46,8 +47,8 @@ def get_create_category_form(request) -> Response:
         description="Update category form successfully retrieved.",
     ),
 )
-@authentication_classes(None)
 @api_view(["GET"])
+@authentication_classes([])
 def get_update_category_form(request, category_id: int) -> Response:
     """Return a category update form schema."""
 
@@ -66,8 +67,8 @@ def get_update_category_form(request, category_id: int) -> Response:
         description="Filter products form successfully retrieved.",
     ),
 )
-@authentication_classes(None)
 @api_view(["GET"])
+@authentication_classes([])
 def get_filter_products_form(request) -> Response:
     """Return a filter products form schema."""
 
@@ -83,8 +84,8 @@ def get_filter_products_form(request) -> Response:
         description="Create product form successfully retrieved.",
     ),
 )
-@authentication_classes(None)
 @api_view(["GET"])
+@authentication_classes([])
 def get_create_product_form(request) -> Response:
     """Return a product create form schema."""
 
@@ -100,8 +101,8 @@ def get_create_product_form(request) -> Response:
         description="Update product form successfully retrieved.",
     ),
 )
-@authentication_classes(None)
 @api_view(["GET"])
+@authentication_classes([])
 def get_update_product_form(request, product_id: int) -> Response:
     """Return a product update form schema."""
 
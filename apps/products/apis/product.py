@@ -4,22 +4,33 @@ from typing import NotRequired, TypedDict
 
 # Libs
 from django.http import QueryDict
+from django.core.validators import ValidationError
 
 from rest_framework.response import Response
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, authentication_classes
 from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED
 
-from drf_spectacular.utils import OpenApiResponse, extend_schema, OpenApiParameter
+from drf_spectacular.utils import OpenApiResponse, OpenApiParameter
 
 # Apps
 from apps.products.services import product as sv
+from apps.products.services.search import search_products as search
 from apps.products.serializers import product as srz
 from apps.products.services.category import get_category
+from apps.tables.authentication import TABLE_SESSION_AUTHENTICATION
 
 # Global
+from common.schema import extend_schema
 from common import functions as fn
-from common.api import filter_parameter_spec
+from common.api import (
+    filter_parameter_spec,
+    import_request_spec,
+    selection_parameter_specs,
+)
+from common.serializers import ImportResultSerializer
+from common.imports import parse_import_rows, validate_import_rows
 from common.decorators import permission_required
+from common.streaming import stream_list_response
 
 
 _product_api_schema = partial(extend_schema, tags=["Products"])
@@ -84,6 +95,7 @@ def get_product(request, product_id: int) -> Response:
             description="Category ID",
             type=int,
         ),
+        *selection_parameter_specs(),
     ],
     responses=OpenApiResponse(
         response=srz.ProductInfoSerializer(many=True),
@@ -91,15 +103,100 @@ def get_product(request, product_id: int) -> Response:
     ),
 )
 @api_view(["GET"])
-@permission_required("product.list_product")
+@authentication_classes(TABLE_SESSION_AUTHENTICATION)
+@permission_required("products.list_product")
 def list_products(request) -> Response:
     """Return a list of products."""
 
     params = process_product_query_params(request.query_params)
-    output = srz.ProductInfoSerializer(
+    selection = fn.validate_selection_query_params(request.query_params)
+    products = srz.ProductInfoSerializer.shape_queryset(
         sv.list_products(**params),
-        many=True,
+        **selection,
+    )
+    return stream_list_response(
+        request,
+        products,
+        serializer_class=srz.ProductInfoSerializer,
+        **selection,
     )
+
+
+SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+
+class _ProductTextSearchT(_ProductSearchT):
+    """A product text search type."""
+
+    query: str
+    limit: int
+
+
+def process_product_search_query_params(query_params: QueryDict) -> _ProductTextSearchT:
+    """Return serialized and validated search query parameters."""
+
+    params: _ProductTextSearchT = {
+        **process_product_query_params(query_params),
+        "query": query_params.get("q", "").strip(),
+        "limit": SEARCH_LIMIT,
+    }
+    if not params["query"]:
+        raise ValidationError({"q": "This field is required."})
+
+    limit = query_params.get("limit")
+    if limit is not None:
+        try:
+            params["limit"] = int(limit)
+        except ValueError:
+            raise ValidationError({"limit": "Invalid value."})
+        if not 1 <= params["limit"] <= MAX_SEARCH_LIMIT:
+            raise ValidationError({"limit": "Out of range."})
+
+    return params
+
+
+# noinspection PyUnusedLocal
+@_product_api_schema(
+    summary="Search products",
+    description=(
+        "Return the products whose name or description match every word of"
+        " `q`, as word prefixes, regardless of case and accents. Best matches"
+        " first, name matches ranking higher."
+    ),
+    parameters=[
+        OpenApiParameter("q", description="Searched words.", required=True),
+        OpenApiParameter(
+            "limit",
+            description=f"Max. number of products, up to {MAX_SEARCH_LIMIT}.",
+            type=int,
+        ),
+        filter_parameter_spec(scope="products"),
+        OpenApiParameter(
+            "category",
+            description="Category ID",
+            type=int,
+        ),
+        *selection_parameter_specs(),
+    ],
+    responses=OpenApiResponse(
+        response=srz.ProductInfoSerializer(many=True),
+        description="Products successfully retrieved.",
+    ),
+)
+@api_view(["GET"])
+@permission_required("products.list_product")
+def search_products(request) -> Response:
+    """Return the products matching a text search."""
+
+    params = process_product_search_query_params(request.query_params)
+    limit = params.pop("limit")
+    selection = fn.validate_selection_query_params(request.query_params)
+    products = srz.ProductInfoSerializer.shape_queryset(
+        search(**params),
+        **selection,
+    )
+    output = srz.ProductInfoSerializer(products[:limit], many=True, **selection)
     return Response(data=output.data, status=HTTP_200_OK)
 
 
@@ -112,7 +209,7 @@ def list_products(request) -> Response:
     ),
 )
 @api_view(["GET"])
-@permission_required("product.list_product")
+@permission_required("products.list_product")
 def list_latest_products(request) -> Response:
     """Return a list of five latest products."""
 
@@ -171,3 +268,27 @@ def update_product(request, product_id: int) -> Response:
     )
     output = srz.ProductInfoSerializer(product)
     return Response(data=output.data, status=HTTP_200_OK)
+
+
+@_product_api_schema(
+    summary="Import products",
+    description=(
+        "Create products, or update them when the row has an `id`, from a JSON"
+        " list of rows or a CSV `file`. Nothing is saved unless every row is"
+        " valid, errors are reported by row number."
+    ),
+    request=import_request_spec(srz.ProductImportSerializer),
+    responses=OpenApiResponse(
+        response=ImportResultSerializer,
+        description="Products successfully imported.",
+    ),
+)
+@api_view(["POST"])
+@permission_required(["products.create_product", "products.change_product"])
+def import_products(request) -> Response:
+    """Create and update products in bulk."""
+
+    rows = validate_import_rows(srz.ProductImportSerializer, parse_import_rows(request))
+    result = sv.import_products(user=request.user, rows=rows)
+    output = ImportResultSerializer(result)
+    return Response(data=output.data, status=HTTP_200_OK)
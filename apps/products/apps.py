@@ -9,8 +9,18 @@ class ProductsConfig(AppConfig):
     verbose_name = "Products"
 
     def ready(self):
-        """Extend to register custom query lookup."""
+        """Extend to register custom query lookup and the search index."""
         from django.db.models import Field
+        from django.db.models.signals import post_migrate
         from common.models import NotEqual
 
         Field.register_lookup(NotEqual)
+        post_migrate.connect(_install_search_index, sender=self)
+
+
+# noinspection PyUnusedLocal
+def _install_search_index(sender, using: str, **kwargs) -> None:
+    """Install the products search index, see `install_search_index`."""
+    from apps.products.services.search import install_search_index
+
+    install_search_index(using)
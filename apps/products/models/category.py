@@ -68,3 +68,8 @@ class Category(BaseModel):
         """Clean category fields."""
 
         self.name = clean_spaces(self.name.capitalize())
+
+    def __str__(self) -> str:
+        """Return instance name."""
+
+        return self.name
@@ -7,7 +7,7 @@ from rest_framework import serializers as srz
 from apps.products.types import IMAGE_EXTENSION
 
 # Global
-from common.serializers import Serializer
+from common.serializers import ImportRowSerializer, Serializer
 
 
 class CategoryInfoSerializer(Serializer):
@@ -85,3 +85,21 @@ class CategoryUpdateSerializer(CategoryCreateSerializer):
         super().__init__(*args, **kwargs)
         for field in self.fields:
             self.fields[field].required = False
+
+
+class CategoryImportSerializer(ImportRowSerializer):
+    """A category bulk import row input serializer."""
+
+    name = srz.CharField(
+        max_length=50,
+        help_text="Category name.",
+    )
+    is_active = srz.BooleanField(
+        help_text="Is the category active?",
+    )
+    image = srz.CharField(
+        max_length=100,
+        help_text="Name of an already uploaded image, e.g. `categories/drinks.png`.",
+    )
+
+    create_required = ("name", "image")
@@ -11,9 +11,10 @@ from rest_framework import serializers as srz
 from apps.products.types import IMAGE_EXTENSION
 from apps.products.models import MIN_PRICE, MAX_PRICE
 from apps.products.serializers.category import CategoryInfoSerializer
+from apps.transactions.models import MAX_QUANTITY, MIN_QUANTITY
 
 # Global
-from common.serializers import Serializer
+from common.serializers import ImportRowSerializer, Serializer
 
 
 class ProductInfoSerializer(Serializer):
@@ -42,9 +43,11 @@ class ProductInfoSerializer(Serializer):
     )
     max_qty = srz.IntegerField(
         help_text="Max. quantity of product in an order.",
+        default=MAX_QUANTITY,
     )
     min_qty = srz.IntegerField(
         help_text="Min. quantity of product in an order.",
+        default=MIN_QUANTITY,
     )
     created_at = srz.DateTimeField(help_text="Created at time.")
     updated_at = srz.DateTimeField(help_text="Updated at time.")
@@ -106,3 +109,33 @@ class ProductUpdateSerializer(ProductCreateSerializer):
         super().__init__(*args, **kwargs)
         for field in self.fields:
             self.fields[field].required = False
+
+
+class ProductImportSerializer(ImportRowSerializer):
+    """A product bulk import row input serializer."""
+
+    name = srz.CharField(
+        max_length=50,
+        help_text="Product name.",
+    )
+    description = srz.CharField(
+        help_text="Product description.",
+        allow_blank=True,
+    )
+    price = srz.IntegerField(
+        help_text="Price in whole dollar cents.",
+        validators=[MinValueValidator(MIN_PRICE), MaxValueValidator(MAX_PRICE)],
+    )
+    is_active = srz.BooleanField(
+        help_text="Is product active?",
+    )
+    image = srz.CharField(
+        max_length=100,
+        help_text="Name of an already uploaded image, e.g. `products/coffee.png`.",
+    )
+    category = srz.IntegerField(
+        help_text="Category ID.",
+        validators=[MinValueValidator(1)],
+    )
+
+    create_required = ("name", "price", "image", "category")
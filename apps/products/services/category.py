@@ -13,6 +13,19 @@ from apps.users.models import User
 from apps.products.models import Category, Product
 from apps.transactions.models import Order, MAX_QUANTITY, MIN_QUANTITY
 
+# Global
+from common.imports import (
+    RowErrors,
+    build_import_instances,
+    check_unique_values,
+    save_import_instances,
+)
+
+PENDING_TRANSACTION_EDIT_MSG = (
+    "This category cannot be edited because one of your "
+    "products is currently in a pending transaction."
+)
+
 
 def get_category(category_id: int) -> Category:
     """Return a category."""
@@ -72,11 +85,7 @@ def update_category(*, category: Category, user: User, **fields: dict) -> Catego
     )
 
     if in_process_transaction:
-        msg = (
-            "This category cannot be edited because one of your "
-            "products is currently in a pending transaction."
-        )
-        raise ValidationError({"category": msg})
+        raise ValidationError({"category": PENDING_TRANSACTION_EDIT_MSG})
 
     existing_image = category.image.name
     with transaction.atomic():
@@ -88,3 +97,44 @@ def update_category(*, category: Category, user: User, **fields: dict) -> Catego
             category.full_clean()
             category.save(user.id)
         return category
+
+
+@transaction.atomic
+def import_categories(*, user: User, rows: list[dict]) -> dict[str, list[int]]:
+    """
+    Create and update categories in bulk.
+
+    Every row is validated before saving anything, with one query per check
+    for all the rows. Errors are reported by row number.
+    """
+
+    errors = RowErrors()
+    categories, updated_fields = build_import_instances(
+        Category, rows=rows, errors=errors
+    )
+
+    check_unique_values(Category, field="name", instances=categories, errors=errors)
+    check_unique_values(Category, field="image", instances=categories, errors=errors)
+
+    busy_category_ids = set(
+        Order.objects.not_closed()
+        .filter(
+            product__category_id__in=[c.pk for c in categories.values() if c.pk],
+        )
+        .values_list("product__category_id", flat=True)
+    )
+    for number, category in categories.items():
+        if category.pk in busy_category_ids:
+            errors.add(number, "category", PENDING_TRANSACTION_EDIT_MSG)
+        if "image" in rows[number - 1] and not default_storage.exists(
+            category.image.name
+        ):
+            errors.add(number, "image", "File not found.")
+
+    errors.raise_if_any()
+    return save_import_instances(
+        Category,
+        user_id=user.id,
+        instances=categories,
+        updated_fields=updated_fields,
+    )
@@ -10,12 +10,25 @@ from django.core.files.storage import default_storage
 
 # Apps
 from apps.users.models import User
-from apps.products.models import Product
+from apps.products.models import Category, Product
 from apps.transactions.models import (
+    Order,
     MAX_QUANTITY,
     MIN_QUANTITY,
 )
 
+# Global
+from common.imports import (
+    RowErrors,
+    build_import_instances,
+    check_unique_values,
+    save_import_instances,
+)
+
+PENDING_TRANSACTION_EDIT_MSG = (
+    "This product can't be edited because it is currently in a pending transaction."
+)
+
 
 def _add_qty_props(product: Product) -> Product:
     """Add quantity properties to product."""
@@ -65,6 +78,14 @@ def list_latest_products() -> QuerySet[Product]:
     return products
 
 
+def warm_catalogue() -> None:
+    """Read the active catalogue, a warm-up task (see `common.warmup`)."""
+
+    list(list_products(filter_by="actives"))
+    list(list_latest_products())
+    list(Category.objects.filter(is_active=True).order_by("id"))
+
+
 def create_product(*, user: User, **fields: dict) -> Product:
     """Create a product."""
 
@@ -82,11 +103,7 @@ def update_product(*, product: Product, user: User, **fields: dict) -> Product:
 
     in_process_transaction = product.orders.not_closed().exists()
     if in_process_transaction:
-        msg = (
-            "This product can't be edited because it is currently "
-            "in a pending transaction."
-        )
-        raise ValidationError({"product": msg})
+        raise ValidationError({"product": PENDING_TRANSACTION_EDIT_MSG})
 
     with transaction.atomic():
         changed_fields = product.update_fields(**fields)
@@ -98,3 +115,54 @@ def update_product(*, product: Product, user: User, **fields: dict) -> Product:
             product.save(user.id, update_fields=changed_fields)
         product = _add_qty_props(product)
         return product
+
+
+@transaction.atomic
+def import_products(*, user: User, rows: list[dict]) -> dict[str, list[int]]:
+    """
+    Create and update products in bulk.
+
+    Every row is validated before saving anything, with one query per check
+    for all the rows. Errors are reported by row number.
+    """
+
+    errors = RowErrors()
+    rows = [
+        {
+            ("category_id" if key == "category" else key): value
+            for key, value in row.items()
+        }
+        for row in rows
+    ]
+    products, updated_fields = build_import_instances(Product, rows=rows, errors=errors)
+
+    check_unique_values(Product, field="name", instances=products, errors=errors)
+    check_unique_values(Product, field="image", instances=products, errors=errors)
+
+    category_ids = set(
+        Category.objects.filter(
+            id__in={product.category_id for product in products.values()}
+        ).values_list("id", flat=True)
+    )
+    busy_product_ids = set(
+        Order.objects.not_closed()
+        .filter(product_id__in=[p.pk for p in products.values() if p.pk])
+        .values_list("product_id", flat=True)
+    )
+    for number, product in products.items():
+        if product.category_id not in category_ids:
+            errors.add(number, "category", "Not found.")
+        if product.pk in busy_product_ids:
+            errors.add(number, "product", PENDING_TRANSACTION_EDIT_MSG)
+        if "image" in rows[number - 1] and not default_storage.exists(
+            product.image.name
+        ):
+            errors.add(number, "image", "File not found.")
+
+    errors.raise_if_any()
+    return save_import_instances(
+        Product,
+        user_id=user.id,
+        instances=products,
+        updated_fields=updated_fields,
+    )
@@ -0,0 +1,160 @@
+# Core
+import re
+from typing import Literal
+
+# Libs
+from django.db import connections
+from django.db.models import F, FloatField, Func, Q, QuerySet, Value
+from django.db.models.expressions import RawSQL
+
+# Apps
+from apps.products.models import Product
+from apps.products.services.product import list_products
+
+# Full-text index of the products name and description (SQLite FTS5).
+#
+# An external content table: the index only stores the tokens, the text is
+# read from the products table. Triggers keep it in sync with every write,
+# including the bulk ones. Diacritics are removed from the indexed and the
+# searched tokens, and 2 and 3 characters prefixes are indexed, for the
+# prefix searches of partially typed words.
+SEARCH_TABLE = "products_product_fts"
+
+_INSTALL_SQL = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        name,
+        description,
+        content='products_product',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_insert
+    AFTER INSERT ON products_product BEGIN
+        INSERT INTO {SEARCH_TABLE} (rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_delete
+    AFTER DELETE ON products_product BEGIN
+        INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_update
+    AFTER UPDATE OF name, description ON products_product BEGIN
+        INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+        INSERT INTO {SEARCH_TABLE} (rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}) VALUES ('rebuild')",
+)
+
+# Ranking weights of the name and description columns.
+_RANK = f"bm25({SEARCH_TABLE}, 10.0, 1.0)"
+
+MAX_SEARCH_TERMS = 8
+
+_TERM = re.compile(r"[^\W_]+")
+
+# Whether the search index exists, by database alias.
+_indexed: dict[str, bool] = {}
+
+
+class _SearchRank(Func):
+    """
+    The rank of a product in a full-text search, lower is better.
+
+    Takes the search query and the product id, and runs `bm25` in a
+    subquery matching the product row of the index.
+    """
+
+    # `MATCH <query> AND rowid = <id>`, the expressions joined.
+    template = (
+        f"(SELECT {_RANK} FROM {SEARCH_TABLE} "
+        f"WHERE {SEARCH_TABLE} MATCH %(expressions)s)"
+    )
+    arg_joiner = f" AND {SEARCH_TABLE}.rowid = "
+    arity = 2
+    output_field = FloatField()
+
+
+def _matching_ids(match: str) -> RawSQL:
+    """Return the ids of the products matching a full-text search."""
+
+    return RawSQL(
+        f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s", [match]
+    )
+
+
+def install_search_index(using: str = "default") -> bool:
+    """
+    Create the search index and its triggers if missing, and rebuild it.
+
+    Run after every migration: rebuilding the products table, as SQLite
+    migrations do, drops its triggers. Return False when the database has
+    no full-text search.
+    """
+
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        if not cursor.fetchone()[0]:
+            return False
+        for sql in _INSTALL_SQL:
+            cursor.execute(sql)
+    _indexed[using] = True
+    return True
+
+
+def _has_search_index(using: str = "default") -> bool:
+    """Return True if the search index exists, checked once per process."""
+
+    if using not in _indexed:
+        tables = connections[using].introspection.table_names()
+        _indexed[using] = SEARCH_TABLE in tables
+    return _indexed[using]
+
+
+def search_products(
+    query: str,
+    *,
+    filter_by: Literal["all", "actives", "inactives"] = "all",
+    category: int | None = None,
+) -> QuerySet[Product]:
+    """
+    Return the products whose name or description match a query, best first.
+
+    Every word of the query must match the beginning of a word, regardless
+    of case and accents. Name matches rank higher. Without the search index,
+    e.g. on other databases, words are matched anywhere, unranked.
+    """
+
+    products = list_products(filter_by=filter_by, category=category)
+    terms = _TERM.findall(query)[:MAX_SEARCH_TERMS]
+    if not terms:
+        return products.none()
+
+    if not _has_search_index(products.db):
+        for term in terms:
+            products = products.filter(
+                Q(name__icontains=term) | Q(description__icontains=term)
+            )
+        return products.order_by("name")
+
+    # Quoted, the terms are only tokenized: no FTS5 query syntax applies.
+    match = " ".join(f'"{term}"*' for term in terms)
+    return (
+        products.filter(id__in=_matching_ids(match))
+        .annotate(rank=_SearchRank(Value(match), F("id")))
+        .order_by("rank", "id")
+    )
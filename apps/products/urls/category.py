@@ -7,6 +7,7 @@ import apps.products.apis.category as api
 api_patterns = [
     path("list/", api.list_categories, name="list"),
     path("create/", api.create_category, name="create"),
+    path("import/", api.import_categories, name="import"),
     path(
         "<int:category_id>/",
         include(
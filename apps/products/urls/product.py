@@ -7,7 +7,9 @@ import apps.products.apis.product as api
 api_patterns = [
     path("list/", api.list_products, name="list"),
     path("list/latest/", api.list_latest_products, name="latest"),
+    path("search/", api.search_products, name="search"),
     path("create/", api.create_product, name="create"),
+    path("import/", api.import_products, name="import"),
     path(
         "<int:product_id>/",
         include(
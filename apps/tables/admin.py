@@ -0,0 +1,14 @@
+from django.contrib import admin
+
+from apps.tables.models import Table
+from apps.users.admin import AuditModelAdmin
+
+
+@admin.register(Table)
+class TableAdmin(AuditModelAdmin):
+    """Register table admin."""
+
+    list_display = ("code", "is_active", "created_at", "created_by_name")
+    list_filter = ("is_active",)
+    search_fields = ("code",)
+    ordering = ("code",)
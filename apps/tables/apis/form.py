@@ -8,13 +8,14 @@ from rest_framework.status import HTTP_200_OK
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, authentication_classes
 
-from drf_spectacular.utils import OpenApiResponse, extend_schema
+from drf_spectacular.utils import OpenApiResponse
 
 # Apps
 from apps.tables import forms as fr
 from apps.tables.services.table import get_table
 
 # Global
+from common.schema import extend_schema
 from common.functions import form_to_api_schema
 
 
@@ -29,8 +30,8 @@ _table_form_api_schema = partial(extend_schema, tags=["Forms"])
         description="Create table form successfully retrieved.",
     ),
 )
-@authentication_classes(None)
 @api_view(["GET"])
+@authentication_classes([])
 def get_create_table_form(request) -> Response:
     """Return a table create form schema."""
     form = form_to_api_schema(form=fr.TableCreateForm)
@@ -44,8 +45,8 @@ def get_create_table_form(request) -> Response:
         description="Login table form successfully retrieved.",
     ),
 )
-@authentication_classes(None)
 @api_view(["GET"])
+@authentication_classes([])
 def get_login_table_form(request) -> Response:
     """Return a login form schema."""
 
@@ -60,8 +61,8 @@ def get_login_table_form(request) -> Response:
         description="Update table form successfully retrieved.",
     ),
 )
-@authentication_classes(None)
 @api_view(["GET"])
+@authentication_classes([])
 def get_update_table_form(request, table_id: int) -> Response:
     """Return a table update form schema."""
 
@@ -5,15 +5,20 @@ from functools import partial
 from rest_framework.response import Response
 from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED
 from rest_framework.decorators import api_view, authentication_classes
-from drf_spectacular.utils import OpenApiResponse, extend_schema, OpenApiParameter
+from drf_spectacular.utils import OpenApiResponse, OpenApiParameter
 
 # Apps
 from apps.tables.services import table as sv
 from apps.tables.serializers import table as srz
 
 # Global
+from common.schema import extend_schema
 from common import functions as fn
+from common.api import import_request_spec, selection_parameter_specs
 from common.decorators import permission_required
+from common.streaming import stream_list_response
+from common.serializers import ImportResultSerializer
+from common.imports import parse_import_rows, validate_import_rows
 
 _table_api_schema = partial(extend_schema, tags=["Tables"])
 
@@ -53,8 +58,8 @@ def get_table(request, table_id: int) -> Response:
         description="Table login successfully.",
     ),
 )
-@authentication_classes(None)
 @api_view(["POST"])
+@authentication_classes([])
 def login_table(request) -> Response:
     """Login table for clients app."""
 
@@ -69,6 +74,7 @@ def login_table(request) -> Response:
 # noinspection PyUnusedLocal
 @_table_api_schema(
     summary="List tables",
+    parameters=selection_parameter_specs(),
     responses=OpenApiResponse(
         response=srz.TableInfoSerializer(many=True),
         description="Tables successfully retrieved.",
@@ -80,11 +86,17 @@ def list_tables(request) -> Response:
     """Return a list of tables."""
 
     filter_by = fn.validate_filter_query_param(request.query_params)
-    output = srz.TableInfoSerializer(
+    selection = fn.validate_selection_query_params(request.query_params)
+    tables = srz.TableInfoSerializer.shape_queryset(
         sv.list_tables(filter_by=filter_by),
-        many=True,
+        **selection,
+    )
+    return stream_list_response(
+        request,
+        tables,
+        serializer_class=srz.TableInfoSerializer,
+        **selection,
     )
-    return Response(data=output.data, status=HTTP_200_OK)
 
 
 # noinspection PyUnusedLocal
@@ -152,3 +164,27 @@ def update_table(request, table_id: int) -> Response:
     )
     output = srz.TableInfoSerializer(table)
     return Response(data=output.data, status=HTTP_200_OK)
+
+
+@_table_api_schema(
+    summary="Import tables",
+    description=(
+        "Create tables, or update them when the row has an `id`, from a JSON"
+        " list of rows or a CSV `file`. Nothing is saved unless every row is"
+        " valid, errors are reported by row number."
+    ),
+    request=import_request_spec(srz.TableImportSerializer),
+    responses=OpenApiResponse(
+        response=ImportResultSerializer,
+        description="Tables successfully imported.",
+    ),
+)
+@api_view(["POST"])
+@permission_required(["tables.create_table", "tables.change_table"])
+def import_tables(request) -> Response:
+    """Create and update tables in bulk."""
+
+    rows = validate_import_rows(srz.TableImportSerializer, parse_import_rows(request))
+    result = sv.import_tables(user=request.user, rows=rows)
+    output = ImportResultSerializer(result)
+    return Response(data=output.data, status=HTTP_200_OK)
@@ -0,0 +1,125 @@
+# Core
+import hmac
+
+# Libs
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+# Table sessions.
+#
+# A table logs in for a signed session token holding its table code and the
+# permissions of the customer-facing endpoints (`scope`), e.g. listing the
+# products or registering orders for its own table. The token alone
+# authorizes these endpoints: verifying it is a signature check, and its
+# permissions and table are compared in constant time, without any query.
+# A session ends when its token expires.
+
+TABLE_CLAIM = "table"
+SCOPE_CLAIM = "scope"
+
+
+def _constant_time_in(value: str, values: list[str]) -> bool:
+    """Return whether a value is in a list, comparing every item."""
+
+    found = False
+    for item in values:
+        found |= hmac.compare_digest(item.encode(), value.encode())
+    return found
+
+
+class TableSessionToken(Token):
+    """A table session token."""
+
+    token_type = "table_session"
+    lifetime = settings.TABLE_SESSION["LIFETIME"]
+
+    @classmethod
+    def for_table(cls, table_code: str, *, user_id: int) -> "TableSessionToken":
+        """
+        Return a new session token of a table.
+
+        `user_id` is the table client user, recorded in the audit fields of
+        the table writes.
+        """
+
+        token = cls()
+        token["user_id"] = user_id
+        token[TABLE_CLAIM] = table_code
+        token[SCOPE_CLAIM] = list(settings.TABLE_SESSION["SCOPE"])
+        return token
+
+
+class TableSessionUser(TokenUser):
+    """
+    The user of a table session, read from its token.
+
+    Has the permissions of the token scope only.
+    """
+
+    @property
+    def table_code(self) -> str:
+        """Return the table code of the session."""
+
+        return self.token[TABLE_CLAIM]
+
+    @property
+    def is_active(self) -> bool:
+        """Return True, the token is only issued to an active client."""
+
+        return True
+
+    def get_all_permissions(self, obj=None) -> set:
+        """Return the token scope."""
+
+        return set(self.token.get(SCOPE_CLAIM, ()))
+
+    def has_perm(self, perm: str, obj=None) -> bool:
+        """Return whether a permission is in the token scope."""
+
+        return _constant_time_in(perm, self.token.get(SCOPE_CLAIM, []))
+
+    def has_perms(self, perm_list, obj=None) -> bool:
+        """Return whether all the permissions are in the token scope."""
+
+        return all([self.has_perm(perm, obj) for perm in perm_list])
+
+
+class TableSessionAuthentication(JWTAuthentication):
+    """
+    Authenticate table session tokens, without any query.
+
+    Other tokens are left to the next authentication classes. Only enabled
+    on the customer-facing endpoints, see `TABLE_SESSION_AUTHENTICATION`.
+    """
+
+    def authenticate(self, request):
+        """Return the session user and token, None if not a table session."""
+
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        try:
+            token = TableSessionToken(raw_token)
+        except TokenError:
+            return None
+        return TableSessionUser(token), token
+
+
+# Authentication classes of the endpoints open to table sessions.
+TABLE_SESSION_AUTHENTICATION = [TableSessionAuthentication, JWTAuthentication]
+
+
+def check_table_session(user, table_code: str) -> None:
+    """Deny a table session access to the orders of another table."""
+
+    if isinstance(user, TableSessionUser) and not hmac.compare_digest(
+        user.table_code.encode(), str(table_code).encode()
+    ):
+        raise PermissionDenied("Not allowed for this table.")
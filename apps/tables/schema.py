@@ -0,0 +1,19 @@
+# Libs
+from drf_spectacular.extensions import OpenApiAuthenticationExtension
+from drf_spectacular.plumbing import build_bearer_security_scheme_object
+
+# API schema extensions, imported by the schema generator only.
+
+
+class TableSessionScheme(OpenApiAuthenticationExtension):
+    """The API schema of the table session authentication."""
+
+    target_class = "apps.tables.authentication.TableSessionAuthentication"
+    name = "tableSessionAuth"
+
+    def get_security_definition(self, auto_schema):
+        """Return a bearer token scheme."""
+
+        return build_bearer_security_scheme_object(
+            header_name="Authorization", token_prefix="Bearer", bearer_format="JWT"
+        )
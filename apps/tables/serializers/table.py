@@ -5,7 +5,7 @@ from rest_framework import serializers as srz
 from apps.tables.models import CODE_LENGTH
 
 # Global
-from common.serializers import Serializer
+from common.serializers import ImportRowSerializer, Serializer
 
 
 class TableInfoSerializer(Serializer):
@@ -28,7 +28,7 @@ class TableLoginTokenSerializer(Serializer):
     """A table info output serializer."""
 
     access = srz.CharField(
-        help_text="Authentication access token.",
+        help_text="Table session access token.",
     )
     code = srz.CharField(
         help_text="Table code",
@@ -88,3 +88,19 @@ class TableUpdateSerializer(TableCreateSerializer):
         super().__init__(*args, **kwargs)
         for field in self.fields:
             self.fields[field].required = False
+
+
+class TableImportSerializer(ImportRowSerializer):
+    """A table bulk import row input serializer."""
+
+    code = srz.CharField(
+        help_text=(
+            f"The table code must contain {CODE_LENGTH} numeric characters and "
+            "follow a sequence pattern like '000X'."
+        ),
+    )
+    is_active = srz.BooleanField(
+        help_text="Is the table active?",
+    )
+
+    create_required = ("code",)
@@ -1,9 +1,9 @@
 # Core
-import envtoml
 from typing import Literal
 
 # Libs
-from django.contrib.auth import authenticate
+from django.conf import settings
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from django.core.validators import ValidationError
 from django.db.models import (
@@ -17,13 +17,24 @@ from django.db.models import (
     BooleanField,
 )
 
-from rest_framework_simplejwt.tokens import AccessToken
-
 # Apps
 from apps.tables.models import Table
+from apps.tables.authentication import TableSessionToken
 from apps.users.models import User
 from apps.transactions.models import OrderStatus, Order, Payment, PaymentStatus
 
+# Global
+from common.imports import (
+    RowErrors,
+    build_import_instances,
+    check_unique_values,
+    save_import_instances,
+)
+
+PROCESSING_ORDERS_EDIT_MSG = (
+    "This table can't be edited because it is currently processing orders."
+)
+
 
 def get_table(table_id: int) -> Table:
     """Return a table."""
@@ -45,14 +56,11 @@ def login_table(table_code: str) -> dict:
     if not table_exists:
         raise ValidationError({"table": "Table not found."})
 
-    # User auth & token generation.
-    envs = envtoml.load(open("./env.toml"))
-    user = authenticate(
-        username="bluewave",
-        password=envs["core"]["user_client_password"],
+    # Session token of the table, for the client user.
+    user_id = User.objects.values_list("id", flat=True).get(
+        username=settings.TABLE_CLIENT["USERNAME"], is_active=True
     )
-    access = AccessToken.for_user(user)
-    access["code"] = table_code
+    access = TableSessionToken.for_table(table_code, user_id=user_id)
     return {"access": access, "code": table_code}
 
 
@@ -136,6 +144,13 @@ def list_table_order_statuses() -> dict:
     return tables
 
 
+def warm_tables() -> None:
+    """Read the active tables and their statuses, a warm-up task."""
+
+    list(list_tables(filter_by="actives"))
+    list(list_table_order_statuses())
+
+
 def create_table(*, user: User, **fields: dict) -> Table:
     """Create a table."""
 
@@ -150,11 +165,42 @@ def update_table(*, table: Table, user: User, **fields: dict) -> Table:
 
     processing_orders = table.orders.not_closed().exists()
     if processing_orders:
-        msg = "This table can't be edited because it is currently processing orders."
-        raise ValidationError({"table": msg})
+        raise ValidationError({"table": PROCESSING_ORDERS_EDIT_MSG})
 
     changed_fields = table.update_fields(**fields)
     if changed_fields:
         table.full_clean()
         table.save(user.id, update_fields=changed_fields)
     return table
+
+
+@transaction.atomic
+def import_tables(*, user: User, rows: list[dict]) -> dict[str, list[int]]:
+    """
+    Create and update tables in bulk.
+
+    Every row is validated before saving anything, with one query per check
+    for all the rows. Errors are reported by row number.
+    """
+
+    errors = RowErrors()
+    tables, updated_fields = build_import_instances(Table, rows=rows, errors=errors)
+
+    check_unique_values(Table, field="code", instances=tables, errors=errors)
+
+    busy_table_ids = set(
+        Order.objects.not_closed()
+        .filter(table_id__in=[t.pk for t in tables.values() if t.pk])
+        .values_list("table_id", flat=True)
+    )
+    for number, table in tables.items():
+        if table.pk in busy_table_ids:
+            errors.add(number, "table", PROCESSING_ORDERS_EDIT_MSG)
+
+    errors.raise_if_any()
+    return save_import_instances(
+        Table,
+        user_id=user.id,
+        instances=tables,
+        updated_fields=updated_fields,
+    )
@@ -0,0 +1,102 @@
+from django.contrib import admin
+
+from apps.transactions.models import ArchivedOrder, Event, Order, Payment
+from apps.users.admin import AuditModelAdmin
+
+from common.admin import ModelAdmin
+
+
+class ReadOnlyAdminMixin:
+    """
+    Make an admin read only.
+
+    Orders and payments are written by the transactions services only,
+    which validate them and record their events.
+    """
+
+    def has_add_permission(self, request) -> bool:
+        """Deny additions."""
+        return False
+
+    def has_change_permission(self, request, obj=None) -> bool:
+        """Deny changes."""
+        return False
+
+    def has_delete_permission(self, request, obj=None) -> bool:
+        """Deny deletions."""
+        return False
+
+
+@admin.register(Order)
+class OrderAdmin(ReadOnlyAdminMixin, AuditModelAdmin):
+    """Register order admin."""
+
+    list_display = (
+        "code",
+        "table",
+        "product",
+        "quantity",
+        "line_total",
+        "status",
+        "is_closed",
+        "created_at",
+        "created_by_name",
+    )
+    list_select_related = ("table", "product")
+    list_filter = ("status",)
+    # Exact primary key lookups, a `LIKE` scans the table.
+    search_fields = ("code__exact", "payment__code__exact")
+    date_hierarchy = "created_at"
+    ordering = ("-created_at",)
+    raw_id_fields = ("table", "product", "payment")
+
+
+@admin.register(ArchivedOrder)
+class ArchivedOrderAdmin(ReadOnlyAdminMixin, AuditModelAdmin):
+    """Register archived order admin."""
+
+    list_display = (
+        "code",
+        "table",
+        "product",
+        "quantity",
+        "line_total",
+        "status",
+        "created_at",
+        "archived_at",
+    )
+    list_select_related = ("table", "product")
+    search_fields = ("code__exact", "payment__code__exact")
+    date_hierarchy = "created_at"
+    ordering = ("-created_at",)
+    raw_id_fields = ("table", "product", "payment")
+
+
+@admin.register(Payment)
+class PaymentAdmin(ReadOnlyAdminMixin, AuditModelAdmin):
+    """Register payment admin."""
+
+    list_display = (
+        "code",
+        "table",
+        "type",
+        "status",
+        "total",
+        "created_at",
+        "created_by_name",
+    )
+    list_select_related = ("table",)
+    list_filter = ("status", "type")
+    search_fields = ("code__exact",)
+    date_hierarchy = "created_at"
+    ordering = ("-created_at",)
+    raw_id_fields = ("table",)
+
+
+@admin.register(Event)
+class EventAdmin(ReadOnlyAdminMixin, ModelAdmin):
+    """Register event admin."""
+
+    list_display = ("id", "type", "code", "created_at")
+    date_hierarchy = "created_at"
+    ordering = ("-id",)
@@ -0,0 +1,113 @@
+# Core
+from functools import partial
+from typing import NotRequired, TypedDict
+
+# Libs
+from django.conf import settings
+from django.http import QueryDict
+from django.core.validators import ValidationError
+
+from rest_framework.response import Response
+from rest_framework.decorators import api_view
+from rest_framework.status import HTTP_200_OK
+
+from drf_spectacular.utils import OpenApiResponse, OpenApiParameter
+
+# Apps
+from apps.transactions.models import EventType
+from apps.transactions.services import event as sv
+from apps.transactions.serializers import event as srz
+
+# Global
+from common.schema import extend_schema
+from common.decorators import permission_required
+
+_event_api_schema = partial(extend_schema, tags=["Events"])
+
+event_read_params_specs = [
+    OpenApiParameter(
+        "after",
+        description="Sequence ID of the last processed event, 0 to start over.",
+        type=int,
+    ),
+    OpenApiParameter(
+        "limit",
+        description="Max. number of events, up to {}.".format(
+            settings.TRANSACTION_EVENTS["MAX_BATCH_SIZE"]
+        ),
+        type=int,
+    ),
+    OpenApiParameter(
+        "types",
+        description="Comma separated event types, all by default: {}.".format(
+            ", ".join(f"`{item}`" for item in EventType)
+        ),
+    ),
+]
+
+
+class _EventReadT(TypedDict):
+    """An events read type."""
+
+    after: NotRequired[int]
+    limit: NotRequired[int]
+    types: NotRequired[list[str]]
+
+
+def process_event_query_params(query_params: QueryDict) -> _EventReadT:
+    """Return serialized and validated event query parameters."""
+
+    params: _EventReadT = {}
+
+    for name, minimum, maximum in (
+        ("after", 0, None),
+        ("limit", 1, settings.TRANSACTION_EVENTS["MAX_BATCH_SIZE"]),
+    ):
+        value = query_params.get(name)
+        if value is None:
+            continue
+        try:
+            value = int(value)
+        except ValueError:
+            raise ValidationError({name: "Invalid value."})
+        if value < minimum or (maximum is not None and value > maximum):
+            raise ValidationError({name: "Out of range."})
+        params[name] = value
+
+    types = query_params.get("types")
+    if types is not None:
+        types = [item.strip() for item in types.split(",") if item.strip()]
+        if not types or not set(types).issubset(EventType.values):
+            raise ValidationError({"types": "Invalid value."})
+        params["types"] = types
+
+    return params
+
+
+@_event_api_schema(
+    summary="Read events",
+    description=(
+        "Return the order and payment changes following a sequence ID, oldest"
+        " first. Consumers keep the `next` sequence ID of each batch and read"
+        " after it."
+    ),
+    parameters=event_read_params_specs,
+    responses=OpenApiResponse(
+        response=srz.EventBatchSerializer,
+        description="Events successfully retrieved.",
+    ),
+)
+@api_view(["GET"])
+@permission_required("transactions.list_event")
+def read_events(request) -> Response:
+    """Retrieve a batch of events."""
+
+    params = process_event_query_params(request.query_params)
+    events, has_more = sv.read_events(**params)
+    data = {
+        "events": events,
+        "next": events[-1]["id"] if events else params.get("after", 0),
+        "has_more": has_more,
+    }
+    output = srz.EventBatchSerializer(data)
+    return Response(data=output.data, status=HTTP_200_OK)
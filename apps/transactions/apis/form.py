@@ -6,12 +6,13 @@ from rest_framework.response import Response
 from rest_framework.status import HTTP_200_OK
 from rest_framework.decorators import api_view, authentication_classes
 
-from drf_spectacular.utils import OpenApiResponse, extend_schema
+from drf_spectacular.utils import OpenApiResponse
 
 # Apps
 from apps.transactions import forms as fr
 
 # Global
+from common.schema import extend_schema
 from common.functions import form_to_api_schema
 
 
@@ -25,8 +26,8 @@ _transaction_form_api_schema = partial(extend_schema, tags=["Forms"])
         description="Register order form successfully retrieved.",
     ),
 )
-@authentication_classes(None)
 @api_view(["GET"])
+@authentication_classes([])
 def get_register_order_form(request, table_code: str) -> Response:
     """Return an order register form schema."""
 
@@ -41,8 +42,8 @@ def get_register_order_form(request, table_code: str) -> Response:
         description="Register payment form successfully retrieved.",
     ),
 )
-@authentication_classes(None)
 @api_view(["GET"])
+@authentication_classes([])
 def get_register_payment_form(request) -> Response:
     """Return a payment register form schema."""
 
@@ -57,8 +58,8 @@ def get_register_payment_form(request) -> Response:
         description="Search payment form successfully retrieved.",
     ),
 )
-@authentication_classes(None)
 @api_view(["GET"])
+@authentication_classes([])
 def get_search_payment_form(request) -> Response:
     """Return a payment search form schema."""
 
@@ -1,16 +1,18 @@
 # Core
 from functools import partial
+from datetime import datetime, timedelta, timezone
 from typing import NotRequired, TypedDict
 
 # Libs
 from django.http import QueryDict
+from django.core.exceptions import PermissionDenied
 from django.core.validators import ValidationError
 
 from rest_framework.response import Response
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, authentication_classes
 from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED
 
-from drf_spectacular.utils import OpenApiResponse, OpenApiParameter, extend_schema
+from drf_spectacular.utils import OpenApiResponse, OpenApiParameter
 
 # Apps
 from apps.transactions.models import OrderStatus
@@ -18,10 +20,22 @@ from apps.transactions.services import order as sv
 from apps.transactions.serializers import order as srz
 from apps.products.services.product import get_product
 from apps.tables.services.table import get_table_by_code
+from apps.tables.authentication import (
+    TABLE_SESSION_AUTHENTICATION,
+    check_table_session,
+)
+from apps.api.decorators import idempotent
 
 # Global
-from common.api import empty_response_spec
+from common.schema import extend_schema
+from common import functions as fn
+from common.api import (
+    empty_response_spec,
+    idempotency_key_parameter_spec,
+    selection_parameter_specs,
+)
 from common.decorators import permission_required
+from common.streaming import stream_list_response
 
 _order_api_schema = partial(extend_schema, tags=["Orders"])
 
@@ -33,6 +47,7 @@ order_search_params_specs = [
         enum=[item for item in OrderStatus],
     ),
     OpenApiParameter("close", description="Order close", type=bool),
+    *selection_parameter_specs(),
 ]
 
 _order_code_params = OpenApiParameter(
@@ -81,6 +96,28 @@ def process_order_query_params(query_params: QueryDict) -> _OrderSearchT:
     return params
 
 
+_CURSOR_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_CURSOR_UNIT = timedelta(microseconds=1)
+
+
+def encode_kitchen_cursor(cursor: datetime) -> str:
+    """Return a kitchen queue cursor, in microseconds since the epoch."""
+
+    return str((cursor - _CURSOR_EPOCH) // _CURSOR_UNIT)
+
+
+def process_kitchen_cursor_param(query_params: QueryDict) -> datetime | None:
+    """Return the validated kitchen queue `cursor` query parameter."""
+
+    cursor = query_params.get("cursor")
+    if not cursor:
+        return None
+    try:
+        return _CURSOR_EPOCH + int(cursor) * _CURSOR_UNIT
+    except (ValueError, OverflowError):
+        raise ValidationError({"cursor": "Invalid value."})
+
+
 # noinspection PyUnusedLocal
 @_order_api_schema(
     summary="Get order state",
@@ -91,10 +128,12 @@ def process_order_query_params(query_params: QueryDict) -> _OrderSearchT:
     ),
 )
 @api_view(["GET"])
+@authentication_classes(TABLE_SESSION_AUTHENTICATION)
 @permission_required("transactions.view_order")
 def get_order_state(request, table_code: str) -> Response:
     """Get order state information."""
 
+    check_table_session(request.user, table_code)
     data = sv.get_order_state(table_code)
     output = srz.OrderStateInfoSerializer(data)
     return Response(data=output.data, status=HTTP_200_OK)
@@ -119,6 +158,74 @@ def get_order_count(request, table_code: str) -> Response:
     return Response(data=output.data, status=HTTP_200_OK)
 
 
+# Permission of each table dashboard payload, the one of its own endpoint.
+DASHBOARD_PERMISSIONS = {
+    "state": "transactions.view_order",
+    "count": "transactions.view_order",
+    "products": "transactions.list_order",
+    # As `get_payment`.
+    "payment": "transaction.view_payment",
+}
+
+
+def process_dashboard_fields_param(query_params: QueryDict, user) -> list[str]:
+    """
+    Return the validated table dashboard `fields` query parameter.
+
+    By default, the payloads the user has the permission of. Requesting
+    another payload is denied.
+    """
+
+    fields = query_params.get("fields")
+    if fields is None:
+        return [
+            field
+            for field in sv.DASHBOARD_FIELDS
+            if user.has_perm(DASHBOARD_PERMISSIONS[field])
+        ]
+
+    fields = [field.strip() for field in fields.split(",") if field.strip()]
+    if not fields or not set(fields).issubset(sv.DASHBOARD_FIELDS):
+        raise ValidationError({"fields": "Invalid value."})
+    for field in fields:
+        if not user.has_perm(DASHBOARD_PERMISSIONS[field]):
+            raise PermissionDenied(f"Not allowed to read the {field} of a table.")
+    return fields
+
+
+# noinspection PyUnusedLocal
+@_order_api_schema(
+    summary="Get table dashboard",
+    description=(
+        "Return the order state, order count, order products and pending"
+        " payment of a table in one request."
+    ),
+    parameters=[
+        _table_code_params,
+        OpenApiParameter(
+            "fields",
+            description=(
+                "Comma separated payloads to return, all the allowed ones by"
+                " default: {}."
+            ).format(", ".join(f"`{field}`" for field in sv.DASHBOARD_FIELDS)),
+        ),
+    ],
+    responses=OpenApiResponse(
+        response=srz.TableDashboardSerializer,
+        description="Table dashboard successfully retrieved.",
+    ),
+)
+@api_view(["GET"])
+@permission_required("transactions.view_order")
+def get_table_dashboard(request, table_code: str) -> Response:
+    """Get the order and payment information of a table."""
+
+    fields = process_dashboard_fields_param(request.query_params, request.user)
+    data = sv.get_table_dashboard(table_code, fields=fields)
+    output = srz.TableDashboardSerializer(data, fields=fields)
+    return Response(data=output.data, status=HTTP_200_OK)
+
+
 # noinspection PyUnusedLocal
 @_order_api_schema(
     summary="Search orders",
@@ -134,8 +241,45 @@ def search_orders(request) -> Response:
     """Retrieve a table's orders."""
 
     params = process_order_query_params(request.query_params)
-    orders = sv.search_orders(**params)
-    output = srz.OrderInfoSerializer(orders, many=True)
+    selection = fn.validate_selection_query_params(request.query_params)
+    orders = sv.search_orders(
+        **params,
+        shape=partial(srz.OrderInfoSerializer.shape_queryset, **selection),
+    )
+    return stream_list_response(
+        request,
+        orders,
+        serializer_class=srz.OrderInfoSerializer,
+        **selection,
+    )
+
+
+@_order_api_schema(
+    summary="Get kitchen queue",
+    description=(
+        "Return the pending orders of all the tables, oldest first. Pass the"
+        " `cursor` of the previous response to only get the changes since."
+    ),
+    parameters=[
+        OpenApiParameter(
+            "cursor",
+            description="Cursor of the previous response.",
+        ),
+    ],
+    responses=OpenApiResponse(
+        response=srz.KitchenQueueSerializer,
+        description="Kitchen queue successfully retrieved.",
+    ),
+)
+@api_view(["GET"])
+@permission_required("transactions.list_order")
+def get_kitchen_queue(request) -> Response:
+    """Retrieve the kitchen queue, or its changes since a cursor."""
+
+    since = process_kitchen_cursor_param(request.query_params)
+    data = sv.get_kitchen_queue(since)
+    data["cursor"] = encode_kitchen_cursor(data["cursor"])
+    output = srz.KitchenQueueSerializer(data)
     return Response(data=output.data, status=HTTP_200_OK)
 
 
@@ -160,11 +304,13 @@ def list_order_products(request, table_code: str) -> Response:
 
 @_order_api_schema(
     summary="Register order",
+    parameters=[idempotency_key_parameter_spec()],
     request=srz.OrderRegisterSerializer,
     responses=empty_response_spec("Order successfully registered."),
 )
 @api_view(["POST"])
 @permission_required("transactions.create_order")
+@idempotent
 def register_order(request) -> Response:
     """Register a new order."""
 
@@ -179,17 +325,21 @@ def register_order(request) -> Response:
 
 @_order_api_schema(
     summary="Register bulk orders",
+    parameters=[idempotency_key_parameter_spec()],
     request=srz.OrderBulkRegisterSerializer,
     responses=empty_response_spec("Orders successfully registered."),
 )
 @api_view(["POST"])
+@authentication_classes(TABLE_SESSION_AUTHENTICATION)
 @permission_required("transactions.create_order")
+@idempotent
 def register_bulk_orders(request) -> Response:
     """Register bulk orders/transactions."""
 
     payload = srz.OrderBulkRegisterSerializer(data=request.data)
     payload.check_data()
     data = payload.validated_data
+    check_table_session(request.user, data["table"])
     data["table"] = get_table_by_code(table_code=data["table"])
     sv.register_bulk_orders(user=request.user, fields=data)
     return Response(status=HTTP_201_CREATED)
@@ -232,6 +382,38 @@ def update_order(request, order_code: str) -> Response:
     return Response(status=HTTP_200_OK)
 
 
+@_order_api_schema(
+    summary="Update orders status (bulk)",
+    request=srz.OrderBulkStatusUpdateSerializer,
+    responses=OpenApiResponse(
+        response=srz.OrderStatusResultSerializer(many=True),
+        description="Orders status transitions processed.",
+    ),
+)
+@api_view(["PUT"])
+@permission_required("transactions.change_order")
+def update_orders_status_bulk(request) -> Response:
+    """
+    Update the status of several orders at once.
+
+    Orders are selected either by a list of `codes`, or by a `table` code,
+    in which case all its pending orders are updated.
+
+    The same constraints as the single order update apply. Each order code is
+    reported individually: orders that can't be updated are left unchanged
+    and returned with an `error`.
+    """
+
+    payload = srz.OrderBulkStatusUpdateSerializer(data=request.data)
+    payload.check_data()
+    data = payload.validated_data
+    if "table" in data:
+        data["table"] = get_table_by_code(table_code=data["table"])
+    results = sv.update_orders_status_bulk(user=request.user, **data)
+    output = srz.OrderStatusResultSerializer(results, many=True)
+    return Response(data=output.data, status=HTTP_200_OK)
+
+
 @_order_api_schema(
     summary="Close all orders",
     parameters=[_table_code_params],
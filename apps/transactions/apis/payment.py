@@ -10,18 +10,25 @@ from django.core.validators import ValidationError
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
 from rest_framework.status import HTTP_201_CREATED, HTTP_200_OK
-from drf_spectacular.utils import OpenApiResponse, OpenApiParameter, extend_schema
+from drf_spectacular.utils import OpenApiResponse, OpenApiParameter
 
 # Apps
 from apps.transactions.services import payment as sv
 from apps.transactions.serializers import payment as srz
 from apps.tables.services.table import get_table_by_code
 from apps.transactions.models.payment import PaymentType
+from apps.api.decorators import idempotent
 
 # Global
+from common.schema import extend_schema
 from common import functions as fn
-from common.api import empty_response_spec
+from common.api import (
+    empty_response_spec,
+    idempotency_key_parameter_spec,
+    selection_parameter_specs,
+)
 from common.decorators import permission_required
+from common.streaming import stream_list_response
 
 _payment_api_schema = partial(extend_schema, tags=["Payments"])
 
@@ -47,6 +54,7 @@ payment_search_params_specs = [
     OpenApiParameter("code", description="Table code"),
     OpenApiParameter("since", description="Payment since date"),
     OpenApiParameter("until", description="Payment until date"),
+    *selection_parameter_specs(),
 ]
 
 
@@ -159,18 +167,28 @@ def list_payments_history(request) -> Response:
     """Retrieve a list of payments."""
 
     params = process_payment_query_params(request.query_params)
-    payments = sv.search_payments(**params)
-    output = srz.PaymentInfoSerializer(payments, many=True)
-    return Response(data=output.data, status=HTTP_200_OK)
+    selection = fn.validate_selection_query_params(request.query_params)
+    payments = srz.PaymentInfoSerializer.shape_queryset(
+        sv.search_payments(**params),
+        **selection,
+    )
+    return stream_list_response(
+        request,
+        payments,
+        serializer_class=srz.PaymentInfoSerializer,
+        **selection,
+    )
 
 
 @_payment_api_schema(
     summary="Register payment",
+    parameters=[idempotency_key_parameter_spec()],
     request=srz.PaymentRegisterSerializer,
     responses=empty_response_spec("Payment successfully registered."),
 )
 @api_view(["POST"])
 @permission_required("transactions.create_payment")
+@idempotent
 def register_payment(request) -> Response:
     """Register a payment."""
 
@@ -0,0 +1,127 @@
+# Core
+from datetime import timedelta
+from functools import partial
+from typing import NotRequired, TypedDict
+
+# Libs
+from django.conf import settings
+from django.http import QueryDict
+from django.utils.timezone import localdate
+from django.core.validators import ValidationError
+
+from rest_framework.response import Response
+from rest_framework.decorators import api_view
+from rest_framework.status import HTTP_200_OK
+
+from drf_spectacular.utils import OpenApiResponse, OpenApiParameter
+
+# Apps
+from apps.transactions.services import report as sv
+from apps.transactions.serializers import report as srz
+
+# Global
+from common.schema import extend_schema
+from common import functions as fn
+from common.decorators import permission_required
+
+_report_api_schema = partial(extend_schema, tags=["Reports"])
+
+DEFAULT_REPORT_DAYS = 30
+MAX_TOP_PRODUCTS = 100
+
+sales_report_params_specs = [
+    OpenApiParameter(
+        "since",
+        description=f"First day (YYYY-MM-DD), {DEFAULT_REPORT_DAYS} days ago by default.",
+    ),
+    OpenApiParameter("until", description="Last day (YYYY-MM-DD), today by default."),
+    OpenApiParameter(
+        "reports",
+        description="Comma separated reports to return, all by default: {}.".format(
+            ", ".join(f"`{report}`" for report in sv.SALES_REPORTS)
+        ),
+    ),
+    OpenApiParameter(
+        "top",
+        description=f"Number of top products, up to {MAX_TOP_PRODUCTS}.",
+        type=int,
+    ),
+]
+
+
+class _SalesReportT(TypedDict):
+    """A sales report query type."""
+
+    since: NotRequired[str]
+    until: NotRequired[str]
+    reports: NotRequired[list[str]]
+    top: NotRequired[int]
+
+
+def process_sales_report_query_params(query_params: QueryDict) -> _SalesReportT:
+    """Return serialized and validated sales report query parameters."""
+
+    params: _SalesReportT = {}
+
+    try:
+        until = query_params.get("until")
+        params["until"] = fn.parse_date(until) if until else localdate()
+        since = query_params.get("since")
+        params["since"] = (
+            fn.parse_date(since)
+            if since
+            else params["until"] - timedelta(days=DEFAULT_REPORT_DAYS - 1)
+        )
+    except ValueError:
+        raise ValidationError({"since": "Invalid date, expected YYYY-MM-DD."})
+
+    if params["since"] > params["until"]:
+        raise ValidationError({"until": "It can't be before the start."})
+    max_days = settings.SALES_REPORTS["MAX_DAYS"]
+    if (params["until"] - params["since"]).days >= max_days:
+        raise ValidationError({"since": f"The range can't exceed {max_days} days."})
+
+    reports = query_params.get("reports")
+    if reports is not None:
+        reports = [report.strip() for report in reports.split(",") if report.strip()]
+        if not reports or not set(reports).issubset(sv.SALES_REPORTS):
+            raise ValidationError({"reports": "Invalid value."})
+        params["reports"] = reports
+
+    top = query_params.get("top")
+    if top is not None:
+        try:
+            params["top"] = int(top)
+        except ValueError:
+            raise ValidationError({"top": "Invalid value."})
+        if not 1 <= params["top"] <= MAX_TOP_PRODUCTS:
+            raise ValidationError({"top": "Out of range."})
+
+    return params
+
+
+@_report_api_schema(
+    summary="Get sales report",
+    description=(
+        "Return the revenue by hour of day, the payment type mix, the top"
+        " products and the basket size distribution of the payments paid"
+        " between two dates."
+    ),
+    parameters=sales_report_params_specs,
+    responses=OpenApiResponse(
+        response=srz.SalesReportSerializer,
+        description="Sales report successfully retrieved.",
+    ),
+)
+@api_view(["GET"])
+@permission_required("transactions.list_payment")
+def get_sales_report(request) -> Response:
+    """Get the sales analytics of a date range."""
+
+    params = process_sales_report_query_params(request.query_params)
+    data = sv.get_sales_report(**params)
+    reports = params.get("reports", sv.SALES_REPORTS)
+    output = srz.SalesReportSerializer(
+        data, fields=["since", "until", "payments", "revenue", *reports]
+    )
+    return Response(data=output.data, status=HTTP_200_OK)
@@ -0,0 +1,50 @@
+# Core
+import time
+
+# Libs
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Apps
+from apps.transactions.services.archive import archive_orders
+
+
+class Command(BaseCommand):
+    """Move the orders of old paid payments to the archive."""
+
+    help = "Archive the orders of payments paid more than N days ago."
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.ORDER_ARCHIVE["AFTER_DAYS"],
+            help="Archive the orders of payments paid more than N days ago.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.ORDER_ARCHIVE["BATCH_SIZE"],
+            help="Payments archived per transaction.",
+        )
+        parser.add_argument(
+            "--every",
+            type=int,
+            metavar="SECONDS",
+            help="Keep running, archiving every N seconds.",
+        )
+
+    def handle(self, *args, **options):
+        """Archive orders, once or on schedule."""
+
+        while True:
+            archived = archive_orders(
+                days=options["days"],
+                batch_size=options["batch_size"],
+            )
+            self.stdout.write(self.style.SUCCESS(f"{archived} order(s) archived."))
+            if not options["every"]:
+                return
+            time.sleep(options["every"])
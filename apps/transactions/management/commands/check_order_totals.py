@@ -0,0 +1,59 @@
+# Libs
+from django.core.management.base import BaseCommand
+
+# Apps
+from apps.transactions.services.totals import (
+    ORDER_MODELS,
+    fix_line_totals,
+    inconsistent_line_totals,
+    inconsistent_payment_totals,
+)
+
+
+class Command(BaseCommand):
+    """Check the orders price snapshots against their payments."""
+
+    help = (
+        "Report orders whose line total is not unit price times quantity, and"
+        " paid payments whose total differs from their orders line totals."
+    )
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Recompute the inconsistent line totals.",
+        )
+
+    def handle(self, *args, **options):
+        """Run the checks."""
+
+        for model in ORDER_MODELS:
+            for code, line_total, unit_price, quantity in inconsistent_line_totals(
+                model
+            ).values_list("code", "line_total", "unit_price", "quantity"):
+                self.stdout.write(
+                    f"{model._meta.verbose_name} {code}: line total {line_total}"
+                    f" != {unit_price} x {quantity}"
+                )
+
+        if options["fix"]:
+            fixed = fix_line_totals()
+            self.stdout.write(self.style.SUCCESS(f"{fixed} line total(s) fixed."))
+
+        # Payment totals are historical records, they are reported only.
+        mismatches = 0
+        for code, total, orders_total in inconsistent_payment_totals().values_list(
+            "code", "total", "orders_total"
+        ):
+            mismatches += 1
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Payment {code}: total {total} != orders total {orders_total}"
+                )
+            )
+
+        if not mismatches:
+            self.stdout.write(self.style.SUCCESS("Payment totals are consistent."))
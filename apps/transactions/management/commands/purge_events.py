@@ -0,0 +1,28 @@
+# Libs
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Apps
+from apps.transactions.services.event import purge_events
+
+
+class Command(BaseCommand):
+    """Delete the old transaction events."""
+
+    help = "Delete the order and payment events older than N days."
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.TRANSACTION_EVENTS["RETENTION_DAYS"],
+            help="Delete the events older than N days.",
+        )
+
+    def handle(self, *args, **options):
+        """Purge old events."""
+
+        deleted = purge_events(days=options["days"])
+        self.stdout.write(self.style.SUCCESS(f"{deleted} event(s) deleted."))
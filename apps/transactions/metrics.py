@@ -0,0 +1,44 @@
+# Apps
+from apps.tables.models import Table
+from apps.transactions.models import Order, OrderStatus
+
+# Global
+from common.metrics import Counter, GaugeCollector
+
+ORDERS_CREATED = Counter(
+    "bluewave_orders_created_total",
+    "Orders registered.",
+)
+PAYMENTS_REGISTERED = Counter(
+    "bluewave_payments_registered_total",
+    "Payments registered by payment type.",
+    ["type"],
+)
+PAYMENTS_CLOSED = Counter(
+    "bluewave_payments_closed_total",
+    "Payments closed (paid).",
+)
+
+
+def _count_open_tables() -> int:
+    """Return the number of tables with open orders."""
+
+    return Table.objects.filter(orders__is_closed=False).distinct().count()
+
+
+def _count_pending_orders() -> int:
+    """Return the number of orders waiting to be delivered."""
+
+    return Order.objects.not_closed().filter(status=OrderStatus.PENDING).count()
+
+
+OPEN_TABLES = GaugeCollector(
+    "bluewave_open_tables",
+    "Tables with open orders.",
+    _count_open_tables,
+)
+PENDING_ORDERS = GaugeCollector(
+    "bluewave_pending_orders",
+    "Orders waiting to be delivered.",
+    _count_pending_orders,
+)
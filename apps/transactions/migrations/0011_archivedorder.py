@@ -0,0 +1,109 @@
+# Generated by Django 5.0.3 on 2026-10-19 15:38
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0008_alter_product_price"),
+        ("tables", "0002_alter_table_code"),
+        ("transactions", "0010_order_payment"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedOrder",
+            fields=[
+                (
+                    "created_at",
+                    models.DateTimeField(editable=False, verbose_name="Created"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(editable=False, verbose_name="Updated"),
+                ),
+                (
+                    "code",
+                    models.CharField(max_length=6, primary_key=True, serialize=False),
+                ),
+                ("quantity", models.IntegerField(verbose_name="Quantity")),
+                (
+                    "status",
+                    models.TextField(
+                        choices=[
+                            ("PENDING", "Pending"),
+                            ("DELIVERED", "Delivered"),
+                            ("CANCELED", "Canceled"),
+                        ],
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "is_closed",
+                    models.BooleanField(
+                        default=True, verbose_name="Is the order close?"
+                    ),
+                ),
+                (
+                    "archived_at",
+                    models.DateTimeField(editable=False, verbose_name="Archived"),
+                ),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        editable=False,
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="%(app_label)s_%(class)s_created_by",
+                        related_query_name="%(app_label)s_%(class)s_created_by",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Created by",
+                    ),
+                ),
+                (
+                    "payment",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="archived_orders",
+                        to="transactions.payment",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="archived_orders",
+                        to="products.product",
+                    ),
+                ),
+                (
+                    "table",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="archived_orders",
+                        to="tables.table",
+                    ),
+                ),
+                (
+                    "updated_by",
+                    models.ForeignKey(
+                        editable=False,
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="%(app_label)s_%(class)s_updated_by",
+                        related_query_name="%(app_label)s_%(class)s_updated_by",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Updated by",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Archived order",
+                "verbose_name_plural": "Archived orders",
+                "abstract": False,
+                "default_permissions": (),
+            },
+        ),
+    ]
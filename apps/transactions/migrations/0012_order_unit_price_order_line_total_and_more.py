@@ -0,0 +1,41 @@
+# Generated by Django 5.0.3 on 2026-10-19 15:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0011_archivedorder"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="unit_price",
+            field=models.IntegerField(
+                help_text="The product price when the order was placed.",
+                null=True,
+                verbose_name="Unit price",
+            ),
+        ),
+        migrations.AddField(
+            model_name="order",
+            name="line_total",
+            field=models.IntegerField(
+                help_text="The unit price times the quantity.",
+                null=True,
+                verbose_name="Line total",
+            ),
+        ),
+        migrations.AddField(
+            model_name="archivedorder",
+            name="unit_price",
+            field=models.IntegerField(null=True, verbose_name="Unit price"),
+        ),
+        migrations.AddField(
+            model_name="archivedorder",
+            name="line_total",
+            field=models.IntegerField(null=True, verbose_name="Line total"),
+        ),
+    ]
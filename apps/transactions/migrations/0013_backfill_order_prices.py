@@ -0,0 +1,36 @@
+# Generated by Django 5.0.3 on 2026-10-19 15:52
+
+from django.db import migrations
+from django.db.models import F, OuterRef, Subquery
+
+
+def backfill_prices(apps, schema_editor):
+    """
+    Snapshot the current product price on the existing orders.
+
+    The price at order time is not recorded anywhere, the current price is
+    the best approximation.
+    """
+
+    Product = apps.get_model("products", "Product")
+    product_price = Subquery(
+        Product.objects.filter(pk=OuterRef("product_id")).values("price")[:1]
+    )
+    for model_name in ("Order", "ArchivedOrder"):
+        model = apps.get_model("transactions", model_name)
+        model.objects.filter(unit_price__isnull=True).update(unit_price=product_price)
+        model.objects.filter(line_total__isnull=True).update(
+            line_total=F("unit_price") * F("quantity")
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0008_alter_product_price"),
+        ("transactions", "0012_order_unit_price_order_line_total_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_prices, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.0.3 on 2026-10-19 15:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0013_backfill_order_prices"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="order",
+            name="unit_price",
+            field=models.IntegerField(
+                help_text="The product price when the order was placed.",
+                verbose_name="Unit price",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="order",
+            name="line_total",
+            field=models.IntegerField(
+                help_text="The unit price times the quantity.",
+                verbose_name="Line total",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="archivedorder",
+            name="unit_price",
+            field=models.IntegerField(verbose_name="Unit price"),
+        ),
+        migrations.AlterField(
+            model_name="archivedorder",
+            name="line_total",
+            field=models.IntegerField(verbose_name="Line total"),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.3 on 2026-10-19 16:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0008_alter_product_price"),
+        ("tables", "0002_alter_table_code"),
+        ("transactions", "0014_alter_order_unit_price_alter_order_line_total_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["status", "created_at"], name="transactions_order_queue_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["updated_at"], name="transactions_order_updated_idx"
+            ),
+        ),
+    ]
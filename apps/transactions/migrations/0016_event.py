@@ -0,0 +1,51 @@
+# Generated by Django 5.0.3 on 2026-10-19 16:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0015_order_queue_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Event",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[
+                            ("order.created", "Order created"),
+                            ("order.updated", "Order updated"),
+                            ("payment.created", "Payment created"),
+                            ("payment.updated", "Payment updated"),
+                        ],
+                        max_length=16,
+                        verbose_name="Type",
+                    ),
+                ),
+                (
+                    "code",
+                    models.CharField(
+                        max_length=6, verbose_name="Order or payment code"
+                    ),
+                ),
+                ("payload", models.JSONField(default=dict, verbose_name="Payload")),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, db_index=True, verbose_name="Created"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Event",
+                "verbose_name_plural": "Events",
+                "permissions": [("list_event", "List events")],
+                "default_permissions": (),
+            },
+        ),
+    ]
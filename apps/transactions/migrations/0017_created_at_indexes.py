@@ -0,0 +1,35 @@
+# Generated by Django 5.0.3 on 2026-10-19 16:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0008_alter_product_price"),
+        ("tables", "0002_alter_table_code"),
+        ("transactions", "0016_event"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="archivedorder",
+            index=models.Index(
+                fields=["created_at", "code"], name="transactions_archive_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["created_at", "code"], name="transactions_order_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="payment",
+            index=models.Index(
+                fields=["created_at", "code"], name="transactions_payment_date_idx"
+            ),
+        ),
+    ]
@@ -9,3 +9,5 @@ from apps.transactions.models.payment import (  # noqa
     PaymentType,
     PaymentStatus,
 )
+from apps.transactions.models.archived_order import ArchivedOrder  # noqa
+from apps.transactions.models.event import Event, EventType  # noqa
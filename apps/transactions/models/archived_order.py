@@ -0,0 +1,72 @@
+# Libs
+from django.db import models
+
+# Apps
+from apps.tables.models import Table
+from apps.products.models import Product
+from apps.transactions.models.order import CODE_LENGTH, OrderStatus
+from apps.transactions.models.payment import Payment
+
+# Global
+from common.models import BaseModel
+
+
+class ArchivedOrder(BaseModel):
+    """
+    An archived order db model.
+
+    Cold copy of the orders of old paid payments, moved out of the `Order`
+    table so the hot path only scans live orders. Columns mirror `Order`.
+    """
+
+    code = models.CharField(
+        primary_key=True,
+        max_length=CODE_LENGTH,
+    )
+    table = models.ForeignKey(
+        Table,
+        related_name="archived_orders",
+        on_delete=models.PROTECT,
+    )
+    product = models.ForeignKey(
+        Product,
+        related_name="archived_orders",
+        on_delete=models.PROTECT,
+    )
+    payment = models.ForeignKey(
+        Payment,
+        related_name="archived_orders",
+        on_delete=models.PROTECT,
+    )
+    quantity = models.IntegerField(
+        verbose_name="Quantity",
+    )
+    unit_price = models.IntegerField(
+        verbose_name="Unit price",
+    )
+    line_total = models.IntegerField(
+        verbose_name="Line total",
+    )
+    status = models.TextField(
+        verbose_name="Status",
+        choices=OrderStatus.choices,
+    )
+    is_closed = models.BooleanField(
+        verbose_name="Is the order close?",
+        default=True,
+    )
+    archived_at = models.DateTimeField(
+        verbose_name="Archived",
+        editable=False,
+    )
+
+    class Meta(BaseModel.Meta):
+        verbose_name = "Archived order"
+        verbose_name_plural = "Archived orders"
+        indexes = [
+            # Recent first searches and admin list.
+            models.Index(
+                name="%(app_label)s_archive_date_idx",
+                fields=["created_at", "code"],
+            ),
+        ]
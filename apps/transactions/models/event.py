@@ -0,0 +1,56 @@
+# Libs
+from django.db import models
+
+# Apps
+from apps.transactions.models.order import CODE_LENGTH
+
+
+class EventType(models.TextChoices):
+    """Transaction event type."""
+
+    ORDER_CREATED = "order.created", "Order created"
+    ORDER_UPDATED = "order.updated", "Order updated"
+    PAYMENT_CREATED = "payment.created", "Payment created"
+    PAYMENT_UPDATED = "payment.updated", "Payment updated"
+
+
+class Event(models.Model):
+    """
+    A change of an order or a payment, in an append-only log (outbox).
+
+    Written in the transaction of the change by the transactions services.
+    The sequence `id` only grows, consumers read the events after the last
+    one they processed instead of scanning the orders and payments. The
+    payload holds the new row of a creation, and the changed columns of
+    an update.
+    """
+
+    id = models.BigAutoField(
+        primary_key=True,
+    )
+    type = models.CharField(
+        verbose_name="Type",
+        choices=EventType.choices,
+        max_length=16,
+    )
+    code = models.CharField(
+        verbose_name="Order or payment code",
+        max_length=CODE_LENGTH,
+    )
+    payload = models.JSONField(
+        verbose_name="Payload",
+        default=dict,
+    )
+    created_at = models.DateTimeField(
+        verbose_name="Created",
+        auto_now_add=True,
+        db_index=True,
+    )
+
+    class Meta:
+        verbose_name = "Event"
+        verbose_name_plural = "Events"
+        default_permissions = ()
+        permissions = [
+            ("list_event", "List events"),
+        ]
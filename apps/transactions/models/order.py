@@ -73,6 +73,14 @@ class Order(BaseModel):
             f"{MIN_QUANTITY} and {MAX_QUANTITY}"
         ),
     )
+    unit_price = models.IntegerField(
+        verbose_name="Unit price",
+        help_text="The product price when the order was placed.",
+    )
+    line_total = models.IntegerField(
+        verbose_name="Line total",
+        help_text="The unit price times the quantity.",
+    )
     status = models.TextField(
         verbose_name="Status",
         choices=OrderStatus.choices,
@@ -94,6 +102,23 @@ class Order(BaseModel):
             ("view_order", "View order"),
             ("change_order", "Update order"),
         ]
+        indexes = [
+            # Kitchen queue: the pending orders, oldest first.
+            models.Index(
+                name="%(app_label)s_%(class)s_queue_idx",
+                fields=["status", "created_at"],
+            ),
+            # Kitchen queue changes since a cursor.
+            models.Index(
+                name="%(app_label)s_%(class)s_updated_idx",
+                fields=["updated_at"],
+            ),
+            # Recent first searches and admin list.
+            models.Index(
+                name="%(app_label)s_%(class)s_date_idx",
+                fields=["created_at", "code"],
+            ),
+        ]
         constraints = [
             models.CheckConstraint(
                 name="%(app_label)s_%(class)s_code_valid",
@@ -113,6 +138,11 @@ class Order(BaseModel):
             ),
         ]
 
+    def set_line_total(self) -> None:
+        """Compute the line total from the unit price and the quantity."""
+
+        self.line_total = self.unit_price * self.quantity
+
     @property
     def is_pending(self):
         """Return True if the order is pending."""
@@ -67,6 +67,13 @@ class Payment(BaseModel):
             ("view_payment", "View payment"),
             ("change_payment", "Change payment"),
         ]
+        indexes = [
+            # History searches by date and admin list, recent first.
+            models.Index(
+                name="%(app_label)s_%(class)s_date_idx",
+                fields=["created_at", "code"],
+            ),
+        ]
         constraints = [
             models.CheckConstraint(
                 name="%(app_label)s_%(class)s_code_valid",
@@ -0,0 +1,42 @@
+# Libs
+from rest_framework import serializers as srz
+
+# Apps
+from apps.transactions.models import EventType
+
+# Global
+from common.serializers import Serializer
+
+
+class EventInfoSerializer(Serializer):
+    """An event info output serializer."""
+
+    id = srz.IntegerField(
+        help_text="Sequence ID.",
+    )
+    type = srz.ChoiceField(
+        choices=EventType.choices,
+        help_text="Event type.",
+    )
+    code = srz.CharField(
+        help_text="Order or payment code.",
+    )
+    payload = srz.JSONField(
+        help_text="New order or payment, or its changed columns.",
+    )
+    created_at = srz.DateTimeField(help_text="Created at time.")
+
+
+class EventBatchSerializer(Serializer):
+    """An events batch output serializer."""
+
+    events = EventInfoSerializer(
+        many=True,
+        help_text="Events, oldest first.",
+    )
+    next = srz.IntegerField(
+        help_text="Sequence ID to read the next batch after.",
+    )
+    has_more = srz.BooleanField(
+        help_text="Do more events follow this batch?",
+    )
@@ -8,6 +8,9 @@ from apps.products.models import Product
 from apps.tables.serializers.table import TableInfoSerializer
 from apps.products.serializers.product import ProductInfoSerializer
 from apps.transactions.models import MIN_QUANTITY, MAX_QUANTITY, OrderStatus
+from apps.transactions.models.order import CODE_LENGTH
+from apps.transactions.serializers.payment import PaymentInfoSerializer
+from apps.users.serializers.audit import AuditUserField
 
 # Global
 from common.serializers import Serializer
@@ -35,7 +38,9 @@ class OrderInfoSerializer(Serializer):
         help_text="Product quantity.",
     )
     created_at = srz.DateTimeField(help_text="Created at time.")
+    created_by = AuditUserField(source="created_by_id", help_text="Created by.")
     updated_at = srz.DateTimeField(help_text="Updated at time.")
+    updated_by = AuditUserField(source="updated_by_id", help_text="Updated by.")
 
 
 class OrderProductsInfoSerializer(Serializer):
@@ -92,6 +97,70 @@ class OrderStateInfoSerializer(Serializer):
     )
 
 
+class TableDashboardSerializer(Serializer):
+    """A table dashboard output serializer."""
+
+    state = OrderStateInfoSerializer(
+        help_text="Order state.",
+    )
+    count = srz.IntegerField(
+        help_text="Count the number of orders associated with a table.",
+    )
+    products = OrderProductsInfoSerializer(
+        many=True,
+        help_text="Order products.",
+    )
+    payment = PaymentInfoSerializer(
+        allow_null=True,
+        help_text="Pending payment, null if there is none.",
+    )
+
+
+class KitchenQueueItemSerializer(Serializer):
+    """A kitchen queue item output serializer."""
+
+    code = srz.CharField(
+        help_text="Order code.",
+    )
+    table_code = srz.CharField(
+        help_text="Table code.",
+    )
+    product_id = srz.IntegerField(
+        help_text="Product ID.",
+    )
+    product_name = srz.CharField(
+        help_text="Product name.",
+    )
+    quantity = srz.IntegerField(
+        help_text="Product quantity.",
+    )
+    created_at = srz.DateTimeField(help_text="Created at time.")
+    updated_at = srz.DateTimeField(help_text="Updated at time.")
+
+
+class KitchenQueueSerializer(Serializer):
+    """A kitchen queue output serializer."""
+
+    cursor = srz.CharField(
+        help_text="Cursor of the next request, to only get the changes.",
+    )
+    reset = srz.BooleanField(
+        help_text="Is it the whole queue? The previous items must be dropped.",
+    )
+    added = KitchenQueueItemSerializer(
+        many=True,
+        help_text="Orders added to the queue, oldest first.",
+    )
+    changed = KitchenQueueItemSerializer(
+        many=True,
+        help_text="Orders of the queue changed, oldest first.",
+    )
+    removed = srz.ListField(
+        child=srz.CharField(),
+        help_text="Codes of the orders removed from the queue.",
+    )
+
+
 class OrderCountSerializer(Serializer):
     """An order counting output serializer."""
 
@@ -156,3 +225,48 @@ class OrderUpdateSerializer(Serializer):
         validators=[MinValueValidator(MIN_QUANTITY), MaxValueValidator(MAX_QUANTITY)],
         required=False,
     )
+
+
+MAX_BULK_STATUS_CODES = 500
+
+
+class OrderBulkStatusUpdateSerializer(Serializer):
+    """Bulk order status update input serializer."""
+
+    status = srz.ChoiceField(
+        choices=OrderStatus.choices,
+        help_text="Target order status.",
+    )
+    codes = srz.ListField(
+        child=srz.CharField(max_length=CODE_LENGTH),
+        help_text="Order codes to update.",
+        allow_empty=False,
+        max_length=MAX_BULK_STATUS_CODES,
+        required=False,
+    )
+    table = srz.CharField(
+        help_text="Table code. Updates all its pending orders.",
+        required=False,
+    )
+
+    def validate(self, attrs):
+        """Check that exactly one order selection is given."""
+
+        if ("codes" in attrs) == ("table" in attrs):
+            raise srz.ValidationError("Either `codes` or `table` is required.")
+        return attrs
+
+
+class OrderStatusResultSerializer(Serializer):
+    """An order status transition result output serializer."""
+
+    code = srz.CharField(
+        help_text="Order code.",
+    )
+    updated = srz.BooleanField(
+        help_text="Was the order status changed?",
+    )
+    error = srz.CharField(
+        help_text="Reason why the order could not be updated.",
+        required=False,
+    )
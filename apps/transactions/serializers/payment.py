@@ -3,6 +3,7 @@ from rest_framework import serializers as srz
 
 # Apps
 from apps.transactions.models import PaymentType
+from apps.users.serializers.audit import AuditUserField
 
 # Global
 from common.serializers import Serializer
@@ -29,6 +30,8 @@ class PaymentInfoSerializer(Serializer):
     created_at = srz.DateTimeField(
         help_text="Created at",
     )
+    created_by = AuditUserField(source="created_by_id", help_text="Created by.")
+    updated_by = AuditUserField(source="updated_by_id", help_text="Updated by.")
 
 
 class PaymentOrdersInfoSerializer(Serializer):
@@ -0,0 +1,121 @@
+# Libs
+from rest_framework import serializers as srz
+
+# Apps
+from apps.transactions.models import PaymentType
+
+# Global
+from common.serializers import Serializer
+
+
+class HourlySalesSerializer(Serializer):
+    """An hour of day sales output serializer."""
+
+    hour = srz.IntegerField(
+        help_text="Hour of day (0 - 23), local time.",
+    )
+    payments = srz.IntegerField(
+        help_text="Number of payments.",
+    )
+    revenue = srz.IntegerField(
+        help_text="Revenue in dollar cents.",
+    )
+
+
+class PaymentTypeSalesSerializer(Serializer):
+    """A payment type sales output serializer."""
+
+    type = srz.ChoiceField(
+        choices=PaymentType.choices,
+        help_text="Payment type.",
+    )
+    payments = srz.IntegerField(
+        help_text="Number of payments.",
+    )
+    revenue = srz.IntegerField(
+        help_text="Revenue in dollar cents.",
+    )
+    share = srz.FloatField(
+        help_text="Share of the revenue (0.0 - 1.0).",
+    )
+
+
+class ProductSalesSerializer(Serializer):
+    """A product sales output serializer."""
+
+    product_id = srz.IntegerField(
+        help_text="Product ID.",
+    )
+    name = srz.CharField(
+        help_text="Product name.",
+    )
+    quantity = srz.IntegerField(
+        help_text="Quantity sold.",
+    )
+    revenue = srz.IntegerField(
+        help_text="Revenue in dollar cents.",
+    )
+
+
+class DistributionSerializer(Serializer):
+    """A values distribution output serializer."""
+
+    mean = srz.FloatField(help_text="Mean.", allow_null=True)
+    max = srz.IntegerField(help_text="Maximum.", allow_null=True)
+    p50 = srz.FloatField(help_text="Median.", allow_null=True)
+    p90 = srz.FloatField(help_text="90th percentile.", allow_null=True)
+    p99 = srz.FloatField(help_text="99th percentile.", allow_null=True)
+
+
+class BasketSizeSerializer(Serializer):
+    """A basket size bucket output serializer."""
+
+    items = srz.IntegerField(
+        help_text="Products per payment.",
+    )
+    payments = srz.IntegerField(
+        help_text="Number of payments.",
+    )
+
+
+class BasketSalesSerializer(Serializer):
+    """A basket sales output serializer."""
+
+    items = DistributionSerializer(
+        help_text="Products per payment.",
+    )
+    total = DistributionSerializer(
+        help_text="Payment total, in dollar cents.",
+    )
+    histogram = BasketSizeSerializer(
+        many=True,
+        help_text="Payments by number of products.",
+    )
+
+
+class SalesReportSerializer(Serializer):
+    """A sales report output serializer."""
+
+    since = srz.DateField(help_text="First reported day.")
+    until = srz.DateField(help_text="Last reported day.")
+    payments = srz.IntegerField(
+        help_text="Number of paid payments.",
+    )
+    revenue = srz.IntegerField(
+        help_text="Revenue in dollar cents.",
+    )
+    hourly = HourlySalesSerializer(
+        many=True,
+        help_text="Sales by hour of day.",
+    )
+    payment_types = PaymentTypeSalesSerializer(
+        many=True,
+        help_text="Sales by payment type.",
+    )
+    top_products = ProductSalesSerializer(
+        many=True,
+        help_text="Best selling products, by revenue.",
+    )
+    basket = BasketSalesSerializer(
+        help_text="Basket size distribution.",
+    )
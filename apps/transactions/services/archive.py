@@ -0,0 +1,81 @@
+# Core
+import heapq
+from datetime import timedelta
+from operator import attrgetter
+from typing import Iterator
+
+# Libs
+from django.db import transaction
+from django.conf import settings
+from django.utils.timezone import now
+from django.db.models import Exists, OuterRef, QuerySet
+
+# Apps
+from apps.transactions.models import ArchivedOrder, Order, Payment, PaymentStatus
+
+# Global
+from common.streaming import iterate_rows
+
+# Columns copied as is from `Order` to `ArchivedOrder`.
+_COPIED_FIELDS = [field.attname for field in Order._meta.concrete_fields]
+
+
+def archivable_payments(*, days: int) -> QuerySet[Payment]:
+    """Return the paid payments older than `days` still holding live orders."""
+
+    return Payment.objects.filter(
+        Exists(Order.objects.filter(payment=OuterRef("pk"))),
+        status=PaymentStatus.PAID,
+        updated_at__lt=now() - timedelta(days=days),
+    )
+
+
+@transaction.atomic
+def archive_payments_orders(*, payment_codes: list[str]) -> int:
+    """Move the orders of some payments to the archive, return the count."""
+
+    orders = Order.objects.filter(payment_id__in=payment_codes)
+    archived_at = now()
+    archived = ArchivedOrder.objects.bulk_create(
+        [
+            ArchivedOrder(**values, archived_at=archived_at)
+            for values in orders.values(*_COPIED_FIELDS)
+        ]
+    )
+    orders.delete()
+    return len(archived)
+
+
+def archive_orders(*, days: int = None, batch_size: int = None) -> int:
+    """
+    Archive the orders of old paid payments, return the count.
+
+    Each batch of payments is moved in its own transaction, so the orders of
+    a payment are either all live or all archived.
+    """
+
+    days = settings.ORDER_ARCHIVE["AFTER_DAYS"] if days is None else days
+    batch_size = batch_size or settings.ORDER_ARCHIVE["BATCH_SIZE"]
+
+    total = 0
+    while True:
+        payment_codes = list(
+            archivable_payments(days=days).values_list("code", flat=True)[:batch_size]
+        )
+        if not payment_codes:
+            return total
+        total += archive_payments_orders(payment_codes=payment_codes)
+
+
+def merge_recent_first(*querysets: QuerySet) -> Iterator:
+    """
+    Merge querysets each ordered by `-created_at`, keeping the order.
+
+    The querysets are fetched by chunks, as the merge is consumed.
+    """
+
+    return heapq.merge(
+        *(iterate_rows(queryset) for queryset in querysets),
+        key=attrgetter("created_at"),
+        reverse=True,
+    )
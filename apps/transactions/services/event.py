@@ -0,0 +1,115 @@
+# Core
+from datetime import timedelta
+from typing import Iterable
+
+# Libs
+from django.db import transaction
+from django.conf import settings
+from django.utils.timezone import now
+
+# Apps
+from apps.transactions.models import Event, EventType, Order, Payment
+
+
+def record_events(events: Iterable[tuple[str, str, dict]]) -> None:
+    """
+    Append `(type, code, payload)` events to the log.
+
+    Must run in the transaction of the changes, so that the events are
+    committed, or rolled back, with them.
+    """
+
+    if not transaction.get_connection().in_atomic_block:
+        raise RuntimeError("Events must be recorded in a transaction.")
+    Event.objects.bulk_create(
+        [Event(type=type, code=code, payload=payload) for type, code, payload in events]
+    )
+
+
+def record_order_created(order: Order) -> None:
+    """Record the creation of an order."""
+
+    record_events([(EventType.ORDER_CREATED, order.code, _order_payload(order))])
+
+
+def record_orders_created(orders: Iterable[Order]) -> None:
+    """Record the creation of orders."""
+
+    record_events(
+        (EventType.ORDER_CREATED, order.code, _order_payload(order)) for order in orders
+    )
+
+
+def record_orders_updated(codes: Iterable[str], **changes) -> None:
+    """Record the same changes of several orders."""
+
+    record_events((EventType.ORDER_UPDATED, code, changes) for code in codes)
+
+
+def record_payment_created(payment: Payment) -> None:
+    """Record the creation of a payment."""
+
+    record_events(
+        [
+            (
+                EventType.PAYMENT_CREATED,
+                payment.code,
+                {
+                    "table": payment.table.code,
+                    "type": payment.type,
+                    "status": payment.status,
+                    "total": payment.total,
+                },
+            )
+        ]
+    )
+
+
+def record_payment_updated(payment: Payment, **changes) -> None:
+    """Record changes of a payment."""
+
+    record_events([(EventType.PAYMENT_UPDATED, payment.code, changes)])
+
+
+def _order_payload(order: Order) -> dict:
+    """Return the event payload of a new order."""
+
+    return {
+        "table": order.table.code,
+        "product": order.product_id,
+        "status": order.status,
+        "quantity": order.quantity,
+        "unit_price": order.unit_price,
+        "line_total": order.line_total,
+    }
+
+
+def read_events(
+    *, after: int = 0, limit: int = None, types: Iterable[str] = None
+) -> tuple[list[dict], bool]:
+    """
+    Return the events following the `after` sequence id, oldest first, and
+    whether more follow the batch.
+    """
+
+    limit = limit or settings.TRANSACTION_EVENTS["BATCH_SIZE"]
+    events = Event.objects.filter(id__gt=after)
+    if types:
+        events = events.filter(type__in=types)
+
+    batch = list(
+        events.order_by("id").values("id", "type", "code", "payload", "created_at")[
+            : limit + 1
+        ]
+    )
+    return batch[:limit], len(batch) > limit
+
+
+def purge_events(*, days: int = None) -> int:
+    """Delete the events older than `days`, return how many were removed."""
+
+    days = settings.TRANSACTION_EVENTS["RETENTION_DAYS"] if days is None else days
+    deleted, _ = Event.objects.filter(
+        created_at__lt=now() - timedelta(days=days)
+    ).delete()
+    return deleted
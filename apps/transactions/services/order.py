@@ -1,8 +1,20 @@
 # Core
-from typing import List, TypedDict, Required, NotRequired
+from datetime import datetime
+from collections import Counter
+from operator import attrgetter
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    TypedDict,
+    Required,
+    NotRequired,
+)
 
 # Libs
 from django.db import transaction
+from django.conf import settings
 from django.utils.timezone import now
 from django.db.models.functions import Concat
 from django.shortcuts import get_object_or_404
@@ -24,11 +36,17 @@ from django.db.models import (
 from apps.users.models import User
 from apps.tables.models import Table
 from apps.products.models import Product
-from apps.transactions.services.payment import pending_payment_exists
+from apps.transactions.metrics import ORDERS_CREATED
+from apps.transactions.services.archive import merge_recent_first
+from apps.transactions.services import event as events
+from apps.transactions.services.payment import get_payment, pending_payment_exists
 
 from apps.transactions.models import (
+    ArchivedOrder,
     Order,
     OrderStatus,
+    Payment,
+    PaymentStatus,
     MAX_QUANTITY,
     MIN_QUANTITY,
 )
@@ -59,6 +77,25 @@ class _OrderUpdateT(TypedDict):
     quantity: NotRequired[int]
 
 
+class _OrderStatusResultT(TypedDict):
+    """An order status transition result type."""
+
+    code: Required[str]
+    updated: Required[bool]
+    error: NotRequired[str]
+
+
+DASHBOARD_FIELDS = ("state", "count", "products", "payment")
+
+# Order columns whose changes are recorded as events.
+EVENT_FIELDS = ("status", "quantity", "line_total")
+
+PENDING_PAYMENT_UPDATE_MSG = (
+    "This order can't be updated because it has a pending payment registered."
+)
+CANCELED_STATUS_UPDATE_MSG = "Cannot update status of a canceled order."
+
+
 def _validate_order_context(user: User, fields: _OrderRegisterT) -> None:
     """Validate an order context consistency."""
 
@@ -105,7 +142,7 @@ def get_order_state(table_code: str) -> dict:
         Order.objects.not_closed()
         .filter(Q(table__code=table_code) & ~Q(status=OrderStatus.CANCELED))
         .aggregate(
-            total_price=Sum(F("product__price") * F("quantity")),
+            total_price=Sum("line_total"),
             count_pending=Count("code", filter=Q(status=OrderStatus.PENDING)),
             count_delivered=Count("code", filter=Q(status=OrderStatus.DELIVERED)),
         )
@@ -142,7 +179,7 @@ def list_order_products(table_code: str) -> list[Order]:
                 F("product__image"),
                 output_field=CharField(),
             ),
-            product_price=F("product__price"),
+            product_price=F("unit_price"),
             product_category=F("product__category__name"),
             max_qty=Value(MAX_QUANTITY),
             min_qty=Value(MIN_QUANTITY),
@@ -152,32 +189,199 @@ def list_order_products(table_code: str) -> list[Order]:
     return order_products.order_by("-status", "-created_at")
 
 
+def get_table_dashboard(table_code: str, fields: Iterable[str] = None) -> dict:
+    """
+    Return the order state, order count, order products and pending payment
+    of a table at once.
+
+    The open orders are loaded once and every order payload is computed
+    from the same rows. `fields` restricts the payloads to compute.
+    """
+
+    fields = set(DASHBOARD_FIELDS if fields is None else fields)
+    dashboard = {}
+
+    if fields & {"state", "count", "products"}:
+        orders = list(
+            Order.objects.not_closed()
+            .filter(table__code=table_code)
+            .select_related("product__category")
+            .only(
+                "code",
+                "status",
+                "is_closed",
+                "quantity",
+                "unit_price",
+                "line_total",
+                "created_at",
+                "updated_at",
+                "product__name",
+                "product__image",
+                "product__category__name",
+            )
+        )
+
+        if "count" in fields:
+            dashboard["count"] = len(orders)
+
+        if "state" in fields:
+            statuses = Counter(order.status for order in orders)
+            line_totals = [
+                order.line_total
+                for order in orders
+                if order.status != OrderStatus.CANCELED
+            ]
+            dashboard["state"] = {
+                "total_price": sum(line_totals) if line_totals else None,
+                "count_pending": statuses[OrderStatus.PENDING],
+                "count_delivered": statuses[OrderStatus.DELIVERED],
+            }
+
+        if "products" in fields:
+            status_labels = dict(OrderStatus.choices)
+            orders.sort(key=attrgetter("status", "created_at"), reverse=True)
+            dashboard["products"] = [
+                {
+                    "code": order.code,
+                    "status_label": status_labels[order.status],
+                    "product_id": order.product_id,
+                    "product_name": order.product.name,
+                    "product_image": f"uploads/{order.product.image}",
+                    "product_category": order.product.category.name,
+                    "product_price": order.unit_price,
+                    "is_closed": order.is_closed,
+                    "quantity": order.quantity,
+                    "max_qty": MAX_QUANTITY,
+                    "min_qty": MIN_QUANTITY,
+                    "created_at": order.created_at,
+                    "updated_at": order.updated_at,
+                }
+                for order in orders
+            ]
+
+    if "payment" in fields:
+        dashboard["payment"] = get_payment(table_code)
+
+    return dashboard
+
+
+def get_kitchen_queue(since: datetime = None) -> dict:
+    """
+    Return the pending orders of all the tables, oldest first.
+
+    Given the `cursor` time of a previous response as `since`, only the
+    changes are returned: the orders `added` to or `changed` in the queue,
+    and the codes of the ones `removed` from it. Otherwise, or when the
+    cursor is too old, the whole queue is `added`, with `reset` set.
+    """
+
+    cursor = now()
+    reset = since is None or cursor - since > settings.KITCHEN_QUEUE["CURSOR_MAX_AGE"]
+    queue = Order.objects.not_closed().filter(status=OrderStatus.PENDING)
+
+    removed = []
+    if not reset:
+        since -= settings.KITCHEN_QUEUE["CURSOR_OVERLAP"]
+        queue = queue.filter(updated_at__gt=since)
+        removed = list(
+            Order.objects.filter(updated_at__gt=since)
+            .exclude(status=OrderStatus.PENDING, is_closed=False)
+            .values_list("code", flat=True)
+        )
+
+    items = queue.order_by("created_at", "code").values(
+        "code",
+        "quantity",
+        "product_id",
+        "created_at",
+        "updated_at",
+        table_code=F("table__code"),
+        product_name=F("product__name"),
+    )
+    added, changed = [], []
+    for item in items:
+        (added if reset or item["created_at"] > since else changed).append(item)
+
+    return {
+        "cursor": cursor,
+        "reset": reset,
+        "added": added,
+        "changed": changed,
+        "removed": removed,
+    }
+
+
+def warm_orders() -> None:
+    """Run the hot order queries of a table and the kitchen, a warm-up task."""
+
+    get_kitchen_queue()
+    table_code = Table.objects.values_list("code", flat=True).first()
+    if table_code is not None:
+        get_order_state(table_code)
+        get_table_dashboard(table_code)
+
+
+def _keep_queryset(queryset: QuerySet, **kwargs) -> QuerySet:
+    """Return a queryset unchanged."""
+
+    return queryset
+
+
 def search_orders(
     table_id: int = None,
     status: str = None,
     close: bool = False,
-) -> QuerySet:
-    """Return an order by table id, status, or close."""
-    orders = Order.objects.select_related("table", "product", "product__category")
+    shape: Callable[..., QuerySet] = None,
+) -> QuerySet | Iterator[Order | ArchivedOrder]:
+    """
+    Return an order by table id, status, or close.
+
+    Closed orders searches also include the archived orders. `shape`
+    restricts the loaded columns, see `Serializer.shape_queryset`.
+    """
 
+    lookups = {}
     if table_id:
-        orders = orders.filter(table_id=table_id)
+        lookups["table_id"] = table_id
     if status:
-        orders = orders.filter(status=status)
-    if close:
-        orders = orders.filter(is_closed=close)
-
-    return orders.order_by("-created_at")
+        lookups["status"] = status
+
+    if shape is None:
+        shape = _keep_queryset
+
+    orders = shape(
+        Order.objects.select_related("table", "product", "product__category"),
+        keep=["created_at"],
+    ).filter(**lookups)
+    if not close:
+        return orders.order_by("-created_at")
+
+    archived_orders = shape(
+        ArchivedOrder.objects.select_related("table", "product", "product__category"),
+        keep=["created_at"],
+    ).filter(**lookups)
+    return merge_recent_first(
+        orders.filter(is_closed=close).order_by("-created_at"),
+        archived_orders.order_by("-created_at"),
+    )
 
 
+@transaction.atomic
 def register_order(*, user: User, fields: _OrderRegisterT) -> None:
     """Register an order."""
 
     _validate_order_context(user, fields)
 
-    order = Order(code=generate_random_code(), **fields)
+    order = Order(
+        code=generate_random_code(),
+        unit_price=fields["product"].price,
+        **fields,
+    )
+    order.set_line_total()
     order.full_clean()
     order.save(user.id)
+    events.record_order_created(order)
+    transaction.on_commit(ORDERS_CREATED.inc)
 
 
 @transaction.atomic
@@ -204,31 +408,36 @@ def register_bulk_orders(*, user: User, fields: _BulkOrderRegisterT) -> None:
                 table=fields["table"],
                 product=item["product"],
                 quantity=item["quantity"],
+                unit_price=item["product"].price,
+                line_total=item["product"].price * item["quantity"],
                 created_at=now(),
                 updated_at=now(),
-                created_by=user,
-                updated_by=user,
+                created_by_id=user.id,
+                updated_by_id=user.id,
             )
         )
 
     # Save orders.
     Order.objects.bulk_create(objs=orders, batch_size=len(orders))
+    events.record_orders_created(orders)
+    transaction.on_commit(lambda: ORDERS_CREATED.inc(len(orders)))
 
 
+@transaction.atomic
 def update_order(*, order: Order, user: User, **fields: _OrderUpdateT) -> Order:
     """Update an order."""
 
+    previous = {field: getattr(order, field) for field in EVENT_FIELDS}
     previous_qty = order.quantity
     previous_status = order.status
     changed_fields = order.update_fields(**fields)
 
     # Check payment integrity.
     if pending_payment_exists(table=order.table):
-        msg = "This order can't be updated because it has a pending payment registered."
-        raise ValidationError({"order": msg})
+        raise ValidationError({"order": PENDING_PAYMENT_UPDATE_MSG})
 
     if "status" in changed_fields and previous_status == OrderStatus.CANCELED:
-        raise ValidationError({"status": "Cannot update status of a canceled order."})
+        raise ValidationError({"status": CANCELED_STATUS_UPDATE_MSG})
 
     if "quantity" in changed_fields:
         if order.is_canceled:
@@ -246,12 +455,97 @@ def update_order(*, order: Order, user: User, **fields: _OrderUpdateT) -> Order:
             order.status = OrderStatus.PENDING
             order.save(user.id, update_fields=["status"])
 
+    if "quantity" in changed_fields:
+        order.set_line_total()
+        changed_fields.append("line_total")
+
     if changed_fields:
         order.full_clean()
         order.save(user.id, update_fields=changed_fields)
+
+    changes = {
+        field: getattr(order, field)
+        for field in EVENT_FIELDS
+        if getattr(order, field) != previous[field]
+    }
+    if changes:
+        events.record_orders_updated([order.code], **changes)
     return order
 
 
+@transaction.atomic
+def update_orders_status_bulk(
+    *,
+    user: User,
+    status: str,
+    codes: List[str] = None,
+    table: Table = None,
+) -> List[_OrderStatusResultT]:
+    """
+    Update the status of several orders at once.
+
+    Orders are selected by `codes`, or all pending orders of a `table`.
+    Transitions are checked with the same rules as `update_order` in a
+    single pass, then valid ones are applied with one UPDATE. Invalid
+    transitions are reported per order code and left unchanged.
+    """
+
+    if table is not None:
+        orders = table.orders.not_closed().filter(status=OrderStatus.PENDING)
+    else:
+        orders = Order.objects.filter(code__in=codes)
+
+    rows = {
+        code: (previous_status, table_id)
+        for code, previous_status, table_id in orders.values_list(
+            "code", "status", "table_id"
+        )
+    }
+    if table is not None:
+        codes = list(rows)
+
+    tables_with_pending_payment = set(
+        Payment.objects.filter(
+            table_id__in={table_id for _, table_id in rows.values()},
+            status=PaymentStatus.PENDING,
+        ).values_list("table_id", flat=True)
+    )
+
+    results: List[_OrderStatusResultT] = []
+    to_update: List[str] = []
+
+    for code in dict.fromkeys(codes):
+        if code not in rows:
+            results.append({"code": code, "updated": False, "error": "Not found."})
+            continue
+
+        previous_status, table_id = rows[code]
+        if table_id in tables_with_pending_payment:
+            error = PENDING_PAYMENT_UPDATE_MSG
+        elif previous_status == status:
+            results.append({"code": code, "updated": False})
+            continue
+        elif previous_status == OrderStatus.CANCELED:
+            error = CANCELED_STATUS_UPDATE_MSG
+        else:
+            to_update.append(code)
+            results.append({"code": code, "updated": True})
+            continue
+
+        results.append({"code": code, "updated": False, "error": error})
+
+    if to_update:
+        Order.objects.filter(code__in=to_update).update(
+            status=status,
+            updated_at=now(),
+            updated_by_id=user.id,
+        )
+        events.record_orders_updated(to_update, status=status)
+
+    return results
+
+
+@transaction.atomic
 def close_orders_bulk(*, user: User, table: Table) -> None:
     """Close an orders."""
 
@@ -267,8 +561,10 @@ def close_orders_bulk(*, user: User, table: Table) -> None:
         )
 
     # Close associated table orders.
+    codes = list(orders.not_closed().values_list("code", flat=True))
     orders.update(
         is_closed=True,
         updated_at=now(),
         updated_by_id=user.id,
     )
+    events.record_orders_updated(codes, is_closed=True)
@@ -14,7 +14,15 @@ from django.db.models import QuerySet, F, Sum, Value, CharField
 from apps.users.models import User
 from apps.tables.models import Table
 from apps.tables.services.table import get_table_by_code
-from apps.transactions.models import Order, OrderStatus, Payment, PaymentStatus
+from apps.transactions.models import (
+    ArchivedOrder,
+    Order,
+    OrderStatus,
+    Payment,
+    PaymentStatus,
+)
+from apps.transactions.metrics import PAYMENTS_CLOSED, PAYMENTS_REGISTERED
+from apps.transactions.services import event as events
 
 # Global
 from common import functions as fn
@@ -76,26 +84,31 @@ def get_payment(table_code: str) -> Payment | None:
         return None
 
 
-def list_orders_by_payment(code: str) -> QuerySet[Order]:
-    """Return a list of orders by payment."""
+def _annotate_payment_orders(orders: QuerySet) -> QuerySet:
+    """Annotate the product info of payment orders."""
 
-    payment = get_object_or_404(Payment, pk=code)
-    orders = (
-        payment.orders.filter(is_closed=True)
-        .only("quantity", "product")
-        .annotate(
-            product_name=F("product__name"),
-            product_image=Concat(
-                Value("uploads/"),
-                F("product__image"),
-                output_field=CharField(),
-            ),
-            product_price=F("product__price"),
-            product_category=F("product__category__name"),
-        )
+    return orders.only("quantity", "product").annotate(
+        product_name=F("product__name"),
+        product_image=Concat(
+            Value("uploads/"),
+            F("product__image"),
+            output_field=CharField(),
+        ),
+        product_price=F("unit_price"),
+        product_category=F("product__category__name"),
     )
 
-    return orders
+
+def list_orders_by_payment(code: str) -> list[Order] | QuerySet[ArchivedOrder]:
+    """Return a list of orders by payment, from the archive once archived."""
+
+    payment = get_object_or_404(Payment, pk=code)
+    orders = list(_annotate_payment_orders(payment.orders.filter(is_closed=True)))
+    if orders or payment.status != PaymentStatus.PAID:
+        return orders
+
+    # A payment orders are archived all together.
+    return _annotate_payment_orders(payment.archived_orders.all())
 
 
 def search_payments(
@@ -138,9 +151,7 @@ def register_payment(*, user: User, fields: _PaymentRegisterT) -> None:
             .filter(
                 status=OrderStatus.DELIVERED,
             )
-            .aggregate(total_price=Sum(F("product__price") * F("quantity")))[
-                "total_price"
-            ]
+            .aggregate(total_price=Sum("line_total"))["total_price"]
         )
 
         # Save payment.
@@ -151,6 +162,8 @@ def register_payment(*, user: User, fields: _PaymentRegisterT) -> None:
         )
         payment.full_clean()
         payment.save(user.id)
+        events.record_payment_created(payment)
+        transaction.on_commit(lambda: PAYMENTS_REGISTERED.inc(type=payment.type))
 
 
 def close_payment(*, user: User, table: Table) -> None:
@@ -161,11 +174,18 @@ def close_payment(*, user: User, table: Table) -> None:
         pending_payment = table.payments.get(status=PaymentStatus.PENDING)
         pending_payment.status = PaymentStatus.PAID
         pending_payment.save(user.id, update_fields=["status"])
+        events.record_payment_updated(pending_payment, status=PaymentStatus.PAID)
 
         # Close associated table orders.
-        table.orders.not_closed().update(
+        orders = table.orders.not_closed()
+        codes = list(orders.values_list("code", flat=True))
+        orders.update(
             is_closed=True,
             payment=pending_payment,
             updated_at=now(),
             updated_by_id=user.id,
         )
+        events.record_orders_updated(
+            codes, is_closed=True, payment=pending_payment.code
+        )
+        transaction.on_commit(PAYMENTS_CLOSED.inc)
@@ -0,0 +1,202 @@
+# Core
+from datetime import date, datetime, time, timedelta
+from typing import Iterable
+
+# Libs
+from django.conf import settings
+from django.utils.timezone import get_current_timezone
+from django.db.models.functions import Coalesce, ExtractHour
+from django.db.models import (
+    Case,
+    IntegerField,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+
+# Apps
+from apps.products.models import Product
+from apps.transactions.models import (
+    ArchivedOrder,
+    Order,
+    OrderStatus,
+    Payment,
+    PaymentStatus,
+    PaymentType,
+)
+
+# Global
+from common import columns as cl
+
+SALES_REPORTS = ("hourly", "payment_types", "top_products", "basket")
+
+BASKET_PERCENTILES = (50, 90, 99)
+
+
+def _date_range(since: date, until: date) -> tuple[datetime, datetime]:
+    """Return the local bounds of a date range, the end excluded."""
+
+    timezone = get_current_timezone()
+    return (
+        datetime.combine(since, time.min, tzinfo=timezone),
+        datetime.combine(until + timedelta(days=1), time.min, tzinfo=timezone),
+    )
+
+
+def _payment_orders_quantity(model: type[Order | ArchivedOrder]) -> Coalesce:
+    """Return the products quantity of a payment orders, as a subquery."""
+
+    quantities = (
+        model.objects.filter(payment=OuterRef("pk"))
+        .exclude(status=OrderStatus.CANCELED)
+        .values("payment")
+        .annotate(quantity=Sum("quantity"))
+        .values("quantity")
+    )
+    return Coalesce(Subquery(quantities), Value(0))
+
+
+def _paid_orders(
+    model: type[Order | ArchivedOrder], start: datetime, end: datetime
+) -> QuerySet:
+    """Return the delivered orders of the payments paid in a range."""
+
+    return model.objects.filter(
+        payment__status=PaymentStatus.PAID,
+        payment__created_at__gte=start,
+        payment__created_at__lt=end,
+    ).exclude(status=OrderStatus.CANCELED)
+
+
+def get_sales_report(
+    *,
+    since: date,
+    until: date,
+    reports: Iterable[str] = None,
+    top: int = 10,
+) -> dict:
+    """
+    Return the sales analytics of the payments paid between two dates.
+
+    The payments and orders columns are scanned once into arrays, see
+    `common.columns`, and aggregated in memory. `reports` restricts the
+    reports to compute, and so the columns to scan: the revenue by hour of
+    day, the payment type mix, the `top` products, and the basket size
+    (products per payment) distribution.
+    """
+
+    reports = set(SALES_REPORTS if reports is None else reports)
+    chunk_size = settings.SALES_REPORTS["CHUNK_SIZE"]
+    start, end = _date_range(since, until)
+
+    payment_types = PaymentType.values
+    payments = Payment.objects.filter(
+        status=PaymentStatus.PAID,
+        created_at__gte=start,
+        created_at__lt=end,
+    ).annotate(
+        hour=ExtractHour("created_at"),
+        type_index=Case(
+            *[
+                When(type=value, then=index)
+                for index, value in enumerate(payment_types)
+            ],
+            output_field=IntegerField(),
+        ),
+        items=_payment_orders_quantity(Order) + _payment_orders_quantity(ArchivedOrder),
+    )
+    columns = {"total": "q"}
+    if "hourly" in reports:
+        columns["hour"] = "b"
+    if "payment_types" in reports:
+        columns["type_index"] = "b"
+    if "basket" in reports:
+        columns["items"] = "q"
+    payment_columns = cl.load_columns(payments, columns=columns, chunk_size=chunk_size)
+
+    totals = payment_columns["total"]
+    revenue = sum(totals)
+    report = {
+        "since": since,
+        "until": until,
+        "payments": len(totals),
+        "revenue": revenue,
+    }
+
+    if "hourly" in reports:
+        hours = payment_columns["hour"]
+        counts = cl.group_sum(hours, size=24)
+        revenues = cl.group_sum(hours, totals, size=24)
+        report["hourly"] = [
+            {"hour": hour, "payments": counts[hour], "revenue": revenues[hour]}
+            for hour in range(24)
+        ]
+
+    if "payment_types" in reports:
+        indexes = payment_columns["type_index"]
+        counts = cl.group_sum(indexes, size=len(payment_types))
+        revenues = cl.group_sum(indexes, totals, size=len(payment_types))
+        report["payment_types"] = [
+            {
+                "type": value,
+                "payments": counts[index],
+                "revenue": revenues[index],
+                "share": revenues[index] / revenue if revenue else 0.0,
+            }
+            for index, value in enumerate(payment_types)
+        ]
+
+    if "top_products" in reports:
+        order_columns = cl.load_columns(
+            _paid_orders(Order, start, end),
+            _paid_orders(ArchivedOrder, start, end),
+            columns={"product_id": "q", "quantity": "q", "line_total": "q"},
+            chunk_size=chunk_size,
+        )
+        product_ids = order_columns["product_id"]
+        size = max(product_ids, default=-1) + 1
+        quantities = cl.group_sum(product_ids, order_columns["quantity"], size=size)
+        revenues = cl.group_sum(product_ids, order_columns["line_total"], size=size)
+        top_ids = sorted(
+            (product_id for product_id in range(size) if quantities[product_id]),
+            key=lambda product_id: (-revenues[product_id], product_id),
+        )[:top]
+        names = dict(Product.objects.filter(id__in=top_ids).values_list("id", "name"))
+        report["top_products"] = [
+            {
+                "product_id": product_id,
+                "name": names.get(product_id),
+                "quantity": quantities[product_id],
+                "revenue": revenues[product_id],
+            }
+            for product_id in top_ids
+        ]
+
+    if "basket" in reports:
+        items = payment_columns["items"]
+        counts = cl.group_sum(items, size=max(items, default=-1) + 1)
+        report["basket"] = {
+            "items": _distribution(items),
+            "total": _distribution(totals),
+            "histogram": [
+                {"items": size, "payments": count}
+                for size, count in enumerate(counts)
+                if count
+            ],
+        }
+
+    return report
+
+
+def _distribution(values) -> dict:
+    """Return the mean, max and percentiles of the values."""
+
+    distribution = {"mean": cl.mean(values), "max": max(values, default=None)}
+    for percent, value in zip(
+        BASKET_PERCENTILES, cl.percentiles(values, BASKET_PERCENTILES)
+    ):
+        distribution[f"p{percent}"] = value
+    return distribution
@@ -0,0 +1,57 @@
+# Libs
+from django.db.models.functions import Coalesce
+from django.db.models import F, OuterRef, QuerySet, Subquery, Sum, Value
+
+# Apps
+from apps.transactions.models import (
+    ArchivedOrder,
+    Order,
+    OrderStatus,
+    Payment,
+    PaymentStatus,
+)
+
+ORDER_MODELS = (Order, ArchivedOrder)
+
+
+def inconsistent_line_totals(model: type[Order | ArchivedOrder]) -> QuerySet:
+    """Return the orders whose line total is not unit price times quantity."""
+
+    return model.objects.exclude(line_total=F("unit_price") * F("quantity"))
+
+
+def fix_line_totals() -> int:
+    """Recompute the inconsistent line totals, return the fixed count."""
+
+    return sum(
+        inconsistent_line_totals(model).update(
+            line_total=F("unit_price") * F("quantity")
+        )
+        for model in ORDER_MODELS
+    )
+
+
+def _payment_orders_total(model: type[Order | ArchivedOrder]) -> Coalesce:
+    """Return the line totals sum of a payment orders, as a subquery."""
+
+    totals = (
+        model.objects.filter(payment=OuterRef("pk"))
+        .exclude(status=OrderStatus.CANCELED)
+        .values("payment")
+        .annotate(total=Sum("line_total"))
+        .values("total")
+    )
+    return Coalesce(Subquery(totals), Value(0))
+
+
+def inconsistent_payment_totals() -> QuerySet[Payment]:
+    """Return the paid payments whose total differs from their orders total."""
+
+    live_total = _payment_orders_total(Order)
+    archived_total = _payment_orders_total(ArchivedOrder)
+    return (
+        Payment.objects.filter(status=PaymentStatus.PAID)
+        .annotate(orders_total=live_total + archived_total)
+        .exclude(total=F("orders_total"))
+        .order_by("-created_at")
+    )
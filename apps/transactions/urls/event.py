@@ -0,0 +1,9 @@
+# Libs
+from django.urls import path
+
+# Apps
+import apps.transactions.apis.event as api
+
+api_patterns = [
+    path("list/", api.read_events, name="list"),
+]
@@ -6,8 +6,10 @@ import apps.transactions.apis.order as api
 
 api_patterns = [
     path("search/", api.search_orders, name="search"),
+    path("kitchen/", api.get_kitchen_queue, name="kitchen"),
     path("register/", api.register_order, name="register"),
     path("register/bulk/", api.register_bulk_orders, name="register_bulk"),
+    path("status/bulk/", api.update_orders_status_bulk, name="update_status_bulk"),
     path(
         "<str:order_code>/",
         include(
@@ -23,6 +25,7 @@ api_patterns = [
                 path("count/", api.get_order_count, name="count"),
                 path("state/", api.get_order_state, name="state"),
                 path("products/", api.list_order_products, name="list"),
+                path("dashboard/", api.get_table_dashboard, name="dashboard"),
                 path("close_bulk/", api.close_orders, name="close"),
             ]
         ),
@@ -0,0 +1,9 @@
+# Libs
+from django.urls import path
+
+# Apps
+import apps.transactions.apis.report as api
+
+api_patterns = [
+    path("sales/", api.get_sales_report, name="sales"),
+]
@@ -2,6 +2,9 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 
 from apps.users.models.user import User
+from apps.users.services.audit import get_audit_identity
+
+from common.admin import ModelAdmin
 
 # Admin panel customization
 admin.site.site_title = "Admin"
@@ -12,3 +15,24 @@ admin.site.index_title = "BlueWave"
 @admin.register(User)
 class ModelNameAdmin(BaseUserAdmin):
     """Register user admin."""
+
+
+class AuditModelAdmin(ModelAdmin):
+    """
+    Define admin base for models with audit fields.
+
+    The audit users are displayed from the audit identities cache, see
+    `apps.users.services.audit`, without loading the users rows.
+    """
+
+    readonly_fields = ("created_at", "created_by_name", "updated_at", "updated_by_name")
+
+    @admin.display(description="Created by", ordering="created_by_id")
+    def created_by_name(self, obj) -> str | None:
+        """Return the creator display name."""
+        return get_audit_identity(obj.created_by_id)
+
+    @admin.display(description="Updated by", ordering="updated_by_id")
+    def updated_by_name(self, obj) -> str | None:
+        """Return the last updater display name."""
+        return get_audit_identity(obj.updated_by_id)
@@ -10,7 +10,10 @@ from rest_framework_simplejwt.views import (
     TokenVerifyView as _TokenVerifyView,
 )
 
-from drf_spectacular.utils import OpenApiResponse, extend_schema, inline_serializer
+from drf_spectacular.utils import OpenApiResponse, inline_serializer
+
+# Global
+from common.schema import extend_schema
 
 
 _auth_api_schema = partial(extend_schema, tags=["Auth"])
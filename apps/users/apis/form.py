@@ -8,13 +8,14 @@ from rest_framework.response import Response
 from rest_framework.status import HTTP_200_OK
 from rest_framework.decorators import api_view, authentication_classes
 
-from drf_spectacular.utils import OpenApiResponse, extend_schema
+from drf_spectacular.utils import OpenApiResponse
 
 # Apps
 from apps.users import forms as fr
 from apps.users.services import user as sv
 
 # Global
+from common.schema import extend_schema
 from common.functions import form_to_api_schema
 
 _user_form_api_schema = partial(extend_schema, tags=["Forms"])
@@ -30,8 +31,8 @@ _user_form_api_schema = partial(extend_schema, tags=["Forms"])
         description="Auth form successfully retrieved.",
     ),
 )
-@authentication_classes(None)
 @api_view(["GET"])
+@authentication_classes([])
 def get_auth_form(request) -> Response:
     """Return an auth form schema."""
     form = form_to_api_schema(form=fr.AuthFormSchema)
@@ -48,8 +49,8 @@ def get_auth_form(request) -> Response:
         description="Create user form successfully retrieved.",
     ),
 )
-@authentication_classes(None)
 @api_view(["GET"])
+@authentication_classes([])
 def get_create_user_form(request) -> Response:
     """Return a user create form schema."""
     form = form_to_api_schema(form=fr.UserCreateForm)
@@ -63,8 +64,8 @@ def get_create_user_form(request) -> Response:
         description="Update user form successfully retrieved.",
     ),
 )
-@authentication_classes(None)
 @api_view(["GET"])
+@authentication_classes([])
 def get_update_user_form(request, user_id: int) -> Response:
     """Return a user update form schema."""
     user_data = model_to_dict(sv.get_user(user_id))
@@ -5,16 +5,18 @@ from functools import partial
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
 from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED
-from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse
 
 # Apps
 from apps.users.services import user as sv
 from apps.users.serializers import user as srz
 
 # Global
+from common.schema import extend_schema
 from common import functions as fn
 from common.api import filter_parameter_spec
 from common.decorators import permission_required
+from common.streaming import stream_list_response
 from common.api import id_response_spec, empty_response_spec
 
 
@@ -59,14 +61,14 @@ def get_user(request, user_id: int) -> Response:
 def get_users(request) -> Response:
     """Return a list users."""
     filter_by = fn.validate_filter_query_param(request.query_params)
-    output = srz.UserInfoSerializer(
+    return stream_list_response(
+        request,
         sv.get_users(
             user=request.user,
             filter_by=filter_by,
         ),
-        many=True,
+        serializer_class=srz.UserInfoSerializer,
     )
-    return Response(data=output.data, status=HTTP_200_OK)
 
 
 @_user_api_schema(
@@ -7,3 +7,18 @@ class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.users"
     verbose_name = "Users"
+
+    def ready(self):
+        """Extend to invalidate the cached audit identities of changed users."""
+        from django.db.models.signals import post_delete, post_save
+
+        post_save.connect(_invalidate_audit_identity, sender="users.User")
+        post_delete.connect(_invalidate_audit_identity, sender="users.User")
+
+
+# noinspection PyUnusedLocal
+def _invalidate_audit_identity(sender, instance, **kwargs) -> None:
+    """Remove a saved or deleted user from the audit identities cache."""
+    from apps.users.services.audit import invalidate_audit_identity
+
+    invalidate_audit_identity(instance.pk)
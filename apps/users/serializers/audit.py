@@ -0,0 +1,44 @@
+# Libs
+from rest_framework import serializers as srz
+from drf_spectacular.utils import extend_schema_field
+
+# Apps
+from apps.users.services.audit import get_audit_identities, get_audit_identity
+
+# Global
+from common.serializers import Serializer
+
+
+class AuditUserSerializer(Serializer):
+    """An audit user output serializer."""
+
+    id = srz.IntegerField(help_text="User ID.")
+    username = srz.CharField(help_text="Username.")
+    name = srz.CharField(help_text="Display name, the username when unnamed.")
+
+
+@extend_schema_field(AuditUserSerializer(allow_null=True))
+class AuditUserField(srz.Field):
+    """
+    An audit user (`created_by`, `updated_by`) output field.
+
+    Rendered from the audit identities cache by the user ID, e.g. the
+    `created_by_id` source, without loading the user. In lists, the users
+    missing from the cache are loaded in a single query.
+    """
+
+    def __init__(self, **kwargs):
+        """Initialize read only field."""
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def prefetch(self, instances: list) -> None:
+        """Load the users of many instances in the cache at once."""
+        get_audit_identities(self.get_attribute(instance) for instance in instances)
+
+    def to_representation(self, value):
+        """Return the user identity."""
+        identity = get_audit_identity(value)
+        if identity is None:
+            return None
+        return {"id": identity.id, "username": identity.username, "name": identity.name}
@@ -0,0 +1,128 @@
+# Core
+import threading
+from time import monotonic
+from collections import OrderedDict
+from typing import Iterable
+
+# Libs
+from django.conf import settings
+from django.db.models import F
+
+# Apps
+from apps.users.models import User
+
+# Process-local cache of the users shown in audit fields (`created_by`,
+# `updated_by`): only their ID, username and display name, loaded for many
+# users in one query. Saving or deleting a user invalidates its entry in the
+# process; the entries also expire, for the changes made by other processes.
+
+
+class AuditIdentity:
+    """The identity of a user in audit fields."""
+
+    __slots__ = ("id", "username", "name", "expires")
+
+    def __init__(self, id: int, username: str, name: str, expires: float):
+        """Initialize identity."""
+
+        self.id = id
+        self.username = username
+        self.name = name
+        self.expires = expires
+
+    def __str__(self) -> str:
+        """Return the display name."""
+
+        return self.name
+
+    def __repr__(self) -> str:
+        """Return the identity representation."""
+
+        return f"<AuditIdentity {self.id} {self.username!r}>"
+
+
+_identities: OrderedDict[int, AuditIdentity] = OrderedDict()
+_lock = threading.Lock()
+
+
+def _display_name(username: str, first_name: str, last_name: str) -> str:
+    """Return a user display name, its username when it has no name."""
+
+    return f"{first_name} {last_name}".strip() or username
+
+
+def get_audit_identities(user_ids: Iterable[int]) -> dict[int, AuditIdentity]:
+    """
+    Return the identities of users by ID, from the cache.
+
+    The missing ones are loaded in a single query. Unknown IDs are left out.
+    """
+
+    config = settings.AUDIT_IDENTITIES
+    now = monotonic()
+    found, missing = {}, set()
+    with _lock:
+        for user_id in set(user_ids):
+            if user_id is None:
+                continue
+            identity = _identities.get(user_id)
+            if identity is None or identity.expires <= now:
+                missing.add(user_id)
+            else:
+                _identities.move_to_end(user_id)
+                found[user_id] = identity
+    if not missing:
+        return found
+
+    rows = User.objects.filter(id__in=missing).values_list(
+        "id", "username", "first_name", "last_name"
+    )
+    expires = now + config["TTL"].total_seconds()
+    loaded = {
+        user_id: AuditIdentity(
+            user_id,
+            username,
+            _display_name(username, first_name, last_name),
+            expires,
+        )
+        for user_id, username, first_name, last_name in rows
+    }
+    with _lock:
+        _identities.update(loaded)
+        for user_id in loaded:
+            _identities.move_to_end(user_id)
+        while len(_identities) > config["CACHE_SIZE"]:
+            _identities.popitem(last=False)
+    found.update(loaded)
+    return found
+
+
+def get_audit_identity(user_id: int | None) -> AuditIdentity | None:
+    """Return the identity of a user, None if unknown."""
+
+    return get_audit_identities([user_id]).get(user_id)
+
+
+def warm_audit_identities() -> None:
+    """Load the last active users in the cache, a warm-up task."""
+
+    user_ids = (
+        User.objects.filter(is_active=True)
+        .order_by(F("last_login").desc(nulls_last=True))
+        .values_list("id", flat=True)
+    )
+    get_audit_identities(user_ids[: settings.AUDIT_IDENTITIES["CACHE_SIZE"]])
+
+
+def invalidate_audit_identity(user_id: int) -> None:
+    """Remove a user from the cache."""
+
+    with _lock:
+        _identities.pop(user_id, None)
+
+
+def clear_audit_identities() -> None:
+    """Empty the cache."""
+
+    with _lock:
+        _identities.clear()
@@ -9,6 +9,8 @@ from django.core.exceptions import ValidationError
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import Permission, Group
 
+from rest_framework_simplejwt.tokens import AccessToken
+
 # Apps
 from apps.users.models.user import User
 
@@ -95,3 +97,12 @@ def update_user(*, user: User, request_user: User, **fields: dict) -> None:
     user.updated_by = request_user
     user.full_clean()
     user.save(update_fields=changed_fields + ["updated_by", "updated_at"])
+
+
+def warm_authentication() -> None:
+    """Sign and verify a token, and load a user permissions, a warm-up task."""
+
+    AccessToken(str(AccessToken()))
+    user = User.objects.filter(is_active=True, is_superuser=False).first()
+    if user is not None:
+        user.get_all_permissions()
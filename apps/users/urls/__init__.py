@@ -1,12 +1,27 @@
-from django.urls import path, include
+from django.urls import path
 
-from apps.users.urls.auth import auth_patterns
-from apps.users.urls.user import users_patterns
+from common.urls import lazy_include
 
 app_name = "users"
 
 
 urlpatterns = [
-    path("auth/", include((auth_patterns, app_name), namespace="auth")),
-    path("user/", include((users_patterns, app_name), namespace="user")),
+    path(
+        "auth/",
+        lazy_include(
+            "apps.users.urls.auth",
+            "auth_patterns",
+            app_name=app_name,
+            namespace="auth",
+        ),
+    ),
+    path(
+        "user/",
+        lazy_include(
+            "apps.users.urls.user",
+            "users_patterns",
+            app_name=app_name,
+            namespace="user",
+        ),
+    ),
 ]
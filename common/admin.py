@@ -0,0 +1,177 @@
+# Core
+from datetime import datetime, timedelta
+
+# Libs
+from django.conf import settings
+from django.contrib import admin
+from django.db import connections
+from django.core.paginator import Paginator
+from django.db.models import Max, Min, Model, QuerySet
+from django.utils.functional import cached_property
+from django.utils.timezone import get_current_timezone, localtime
+
+# Admin change lists of large tables.
+#
+# The default change list counts all the rows twice (`COUNT(*)` of the page
+# and of the unfiltered table), and its date hierarchy truncates the dates
+# of every row to list the years, months or days. Here unfiltered tables
+# are counted from the database statistics, and the date hierarchy probes
+# each period with an index range query.
+
+
+def estimate_count(model: type[Model], using: str = "default") -> int | None:
+    """
+    Return the estimated rows of a model table, None if unknown.
+
+    Read from the table statistics (`ANALYZE`) on PostgreSQL and SQLite,
+    SQLite tables never analyzed are estimated by their largest rowid.
+    """
+
+    connection = connections[using]
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(table)],
+            )
+        elif connection.vendor == "sqlite":
+            cursor.execute("SELECT name FROM sqlite_master WHERE name = 'sqlite_stat1'")
+            if cursor.fetchone():
+                cursor.execute(
+                    "SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1", [table]
+                )
+                row = cursor.fetchone()
+                if row:
+                    return int(row[0].split()[0])
+            cursor.execute(
+                f"SELECT MAX(_rowid_) FROM {connection.ops.quote_name(table)}"
+            )
+        else:
+            return None
+        row = cursor.fetchone()
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    A paginator of querysets counting the unfiltered large tables.
+
+    Unfiltered querysets of tables estimated over `EXACT_COUNT_MAX` rows
+    use the estimate, the other querysets are counted.
+    """
+
+    @cached_property
+    def count(self) -> int:
+        """Extend to estimate the count of unfiltered querysets."""
+        queryset = self.object_list
+        if isinstance(queryset, QuerySet) and not queryset.query.where:
+            estimate = estimate_count(queryset.model, queryset.db)
+            if estimate is not None and (
+                estimate > settings.ADMIN_CHANGELIST["EXACT_COUNT_MAX"]
+            ):
+                return estimate
+        return super().count
+
+
+def _next_period(start: datetime, kind: str) -> datetime:
+    """Return the start of the year, month or day following another."""
+
+    if kind == "year":
+        return start.replace(year=start.year + 1)
+    if kind == "month":
+        return start.replace(
+            year=start.year + start.month // 12,
+            month=start.month % 12 + 1,
+        )
+    # Wall clock arithmetic: the next midnight, across DST changes too.
+    return start + timedelta(days=1)
+
+
+class PeriodProbeQuerySet(QuerySet):
+    """
+    A queryset listing its years, months and days with index range queries.
+
+    `datetimes()` checks each period between the first and the last date
+    with an `EXISTS` query, a range of the field index, instead of
+    truncating the date of every row. Used by the date hierarchy.
+    """
+
+    def aggregate(self, *args, **kwargs):
+        """
+        Extend to read several `Min` and `Max` in separate queries.
+
+        SQLite reads a single `Min` or `Max` from an index, in a query of its
+        own; together they scan the whole index.
+        """
+        if args or len(kwargs) < 2:
+            return super().aggregate(*args, **kwargs)
+        if not all(isinstance(value, (Min, Max)) for value in kwargs.values()):
+            return super().aggregate(*args, **kwargs)
+
+        result = {}
+        for name, value in kwargs.items():
+            result.update(super().aggregate(**{name: value}))
+        return result
+
+    def datetimes(self, field_name, kind, order="ASC", tzinfo=None):
+        """Extend to probe the years, months and days."""
+        if kind not in ("year", "month", "day"):
+            return super().datetimes(field_name, kind, order, tzinfo)
+
+        tzinfo = tzinfo or get_current_timezone()
+        bounds = self.aggregate(first=Min(field_name), last=Max(field_name))
+        if bounds["first"] is None:
+            return []
+
+        first = localtime(bounds["first"], tzinfo)
+        last = localtime(bounds["last"], tzinfo)
+        start = datetime(
+            first.year,
+            1 if kind == "year" else first.month,
+            first.day if kind == "day" else 1,
+            tzinfo=tzinfo,
+        )
+        periods = []
+        while start <= last:
+            end = _next_period(start, kind)
+            lookups = {f"{field_name}__gte": start, f"{field_name}__lt": end}
+            # The period range first: SQLite searches an index with the first
+            # range of a column, e.g. not with the year of the hierarchy.
+            period = self.model._base_manager.filter(**lookups)
+            if (period & self).exists():
+                periods.append(start)
+            start = end
+        return periods[::-1] if order == "DESC" else periods
+
+
+class ModelAdmin(admin.ModelAdmin):
+    """
+    Define admin base for large tables.
+
+    The changelist counts the unfiltered table from its statistics and not
+    the full result again, its date hierarchy probes the periods with index
+    range queries. Subclasses should order by, and build the date hierarchy
+    on, indexed columns, load the displayed relations with
+    `list_select_related` and edit relations with `raw_id_fields`.
+    Instances are saved with their audit user.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 50
+
+    def get_queryset(self, request) -> QuerySet:
+        """Extend to probe the date hierarchy periods."""
+        queryset = super().get_queryset(request)
+        if self.date_hierarchy:
+            queryset = PeriodProbeQuerySet(
+                queryset.model, query=queryset.query, using=queryset._db
+            )
+        return queryset
+
+    def save_model(self, request, obj, form, change) -> None:
+        """Save the instance with its audit user."""
+        obj.save(request.user.id)
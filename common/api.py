@@ -1,13 +1,14 @@
 from django.core import exceptions
 from django.http import Http404, HttpResponse
 from django.db.models import IntegerField
-from django.utils.crypto import get_random_string
 from drf_spectacular.utils import OpenApiResponse, inline_serializer, OpenApiParameter
 
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 from rest_framework.serializers import as_serializer_error
 from rest_framework.views import exception_handler
 
+from common.imports import ImportRowsError
+
 
 def api_exception_http(exc, context) -> HttpResponse:
     """
@@ -18,6 +19,8 @@ def api_exception_http(exc, context) -> HttpResponse:
     """
     if isinstance(exc, exceptions.ValidationError):
         exc = ValidationError(as_serializer_error(exc))
+    if isinstance(exc, ImportRowsError):
+        exc = ValidationError({"rows": exc.errors})
     if isinstance(exc, Http404):
         exc = NotFound(exc)
     if isinstance(exc, exceptions.PermissionDenied):
@@ -47,6 +50,55 @@ def filter_parameter_spec(*, scope: str) -> OpenApiParameter:
     )
 
 
+def selection_parameter_specs() -> list[OpenApiParameter]:
+    """Return the Open Api sparse fieldset parameters specification."""
+    return [
+        OpenApiParameter(
+            "fields",
+            description="Comma separated fields to return, all by default.",
+        ),
+        OpenApiParameter(
+            "expand",
+            description=(
+                "Comma separated nested objects to return in full, the other "
+                "nested objects are returned as their ID. All nested objects "
+                "are returned in full when omitted."
+            ),
+        ),
+    ]
+
+
+def idempotency_key_parameter_spec() -> OpenApiParameter:
+    """Return an Open Api `Idempotency-Key` header specification."""
+    return OpenApiParameter(
+        "Idempotency-Key",
+        location=OpenApiParameter.HEADER,
+        required=False,
+        description=(
+            "Unique key (max. 64 characters) to safely retry the request. "
+            "A retry with the same key returns the original response "
+            "without processing the request again."
+        ),
+    )
+
+
+def import_request_spec(serializer_class: type) -> dict:
+    """Return an API specification bulk import request (JSON or CSV)."""
+    return {
+        "application/json": serializer_class(many=True),
+        "multipart/form-data": {
+            "type": "object",
+            "properties": {
+                "file": {
+                    "type": "string",
+                    "format": "binary",
+                    "description": "CSV file, with a header line of field names.",
+                },
+            },
+        },
+    }
+
+
 def id_response_spec(
     name: str,
     description: str,
@@ -55,7 +107,7 @@ def id_response_spec(
     # noinspection PyTypeChecker
     return OpenApiResponse(
         response=inline_serializer(
-            name=f"_InstanceID{get_random_string(5)}",
+            name=f"{name.replace(' ', '')}IDSerializer",
             fields={"id": IntegerField(help_text=f"{name} ID.")},
         ),
         description=description,
@@ -0,0 +1,29 @@
+# Libs
+from django.core.cache.backends.filebased import FileBasedCache
+
+
+class SharedFileCache(FileBasedCache):
+    """
+    A file based cache of small entries shared by the server processes.
+
+    Meant for a memory backed directory (tmpfs, e.g. `/dev/shm`), where an
+    entry costs a file open without any disk I/O. The default file cache
+    lists the whole directory on every write to cull it, here it is culled
+    once every `CULL_EVERY` writes of a process (`OPTIONS`), so
+    `MAX_ENTRIES` may be exceeded by that many writes per process.
+    """
+
+    def __init__(self, dir, params):
+        """Initialize cache."""
+
+        super().__init__(dir, params)
+        self._cull_every = int(params.get("OPTIONS", {}).get("CULL_EVERY", 1000))
+        self._writes = 0
+
+    def _cull(self) -> None:
+        """Extend to cull once every `CULL_EVERY` writes."""
+
+        self._writes += 1
+        if self._writes >= self._cull_every:
+            self._writes = 0
+            super()._cull()
@@ -117,6 +117,16 @@ def validate_filter_query_param(
     return filter_by
 
 
+def validate_selection_query_params(query_params: QueryDict) -> dict:
+    """Return the `fields` and `expand` sparse fieldset query params."""
+    selection = {}
+    for param in ("fields", "expand"):
+        value = query_params.get(param)
+        if value is not None:
+            selection[param] = [n.strip() for n in value.split(",") if n.strip()]
+    return selection
+
+
 def generate_random_code(length=6) -> str:
     """Return a random code."""
     characters = string.ascii_letters + string.digits
@@ -0,0 +1,211 @@
+# Core
+import io
+import csv
+from collections import defaultdict
+
+# Libs
+from django.db import models, transaction
+from django.utils.timezone import now
+from django.core.exceptions import ValidationError
+
+from rest_framework.request import Request
+
+MAX_IMPORT_ROWS = 1000
+
+# Fields never read from import rows.
+_AUDIT_FIELDS = ("created_at", "created_by", "updated_at", "updated_by")
+
+
+class ImportRowsError(Exception):
+    """Invalid import rows, by row number (starting at 1)."""
+
+    def __init__(self, errors: dict[int, dict[str, list[str]]]):
+        """Keep the errors of every invalid row."""
+
+        super().__init__("Invalid import rows.")
+        self.errors = errors
+
+
+class RowErrors:
+    """Collect the errors of import rows."""
+
+    def __init__(self):
+        """Initialize state."""
+
+        self._errors = defaultdict(lambda: defaultdict(list))
+
+    def add(self, number: int, field: str, message: str) -> None:
+        """Add an error to a row field."""
+
+        self._errors[number][field].append(message)
+
+    def extend(self, number: int, error: ValidationError) -> None:
+        """Add the errors of a model validation error to a row."""
+
+        for field, messages in error.message_dict.items():
+            self._errors[number][field].extend(messages)
+
+    def raise_if_any(self) -> None:
+        """Raise the collected errors, if any."""
+
+        if self._errors:
+            raise ImportRowsError(
+                {
+                    number: dict(fields)
+                    for number, fields in sorted(self._errors.items())
+                }
+            )
+
+
+def parse_import_rows(request: Request) -> list[dict]:
+    """
+    Return the import rows of a request.
+
+    Rows are sent either as a JSON list of objects, or as a CSV `file` with a
+    header line. Empty CSV cells are left out, so defaults apply.
+    """
+
+    upload = request.FILES.get("file")
+    if upload is not None:
+        try:
+            content = io.TextIOWrapper(upload.file, encoding="utf-8-sig")
+            rows = [
+                {key.strip(): value.strip() for key, value in row.items() if value}
+                for row in csv.DictReader(content)
+            ]
+        except (UnicodeDecodeError, csv.Error, AttributeError):
+            raise ValidationError({"file": "Invalid CSV file."})
+    else:
+        rows = request.data
+        if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+            raise ValidationError(
+                {"rows": "Expected a list of objects, or a CSV `file`."}
+            )
+
+    if not rows:
+        raise ValidationError({"rows": "No rows to import."})
+    if len(rows) > MAX_IMPORT_ROWS:
+        raise ValidationError({"rows": f"Max. {MAX_IMPORT_ROWS} rows per import."})
+    return rows
+
+
+def validate_import_rows(serializer_class: type, rows: list[dict]) -> list[dict]:
+    """Return the validated data of the rows, or raise the invalid rows."""
+
+    payload = serializer_class(data=rows, many=True)
+    if not payload.is_valid():
+        raise ImportRowsError(
+            {number: error for number, error in enumerate(payload.errors, 1) if error}
+        )
+    return payload.validated_data
+
+
+def build_import_instances(
+    model: type[models.Model],
+    *,
+    rows: list[dict],
+    errors: RowErrors,
+) -> tuple[dict[int, models.Model], set[str]]:
+    """
+    Return the instances of the rows by row number, and the updated fields.
+
+    Rows with an `id` update that instance, the others create one. Fields
+    are validated without hitting the database, relations and uniqueness
+    are left to set-based checks.
+    """
+
+    existing = model.objects.in_bulk({row["id"] for row in rows if "id" in row})
+    exclude = [
+        field.name
+        for field in model._meta.concrete_fields
+        if field.is_relation or field.name in _AUDIT_FIELDS
+    ]
+
+    instances = {}
+    updated_fields = set()
+    rows_by_pk = {}
+    for number, row in enumerate(rows, 1):
+        fields = dict(row)
+        pk = fields.pop("id", None)
+        if pk is None:
+            instance = model(**fields)
+        else:
+            instance = existing.get(pk)
+            if instance is None:
+                errors.add(number, "id", "Not found.")
+                continue
+            if pk in rows_by_pk:
+                errors.add(number, "id", f"Duplicated in row {rows_by_pk[pk]}.")
+                continue
+            rows_by_pk[pk] = number
+            updated_fields.update(instance.update_fields(**fields))
+
+        try:
+            instance.clean_fields(exclude=exclude)
+            instance.clean()
+        except ValidationError as error:
+            errors.extend(number, error)
+            continue
+        instances[number] = instance
+
+    return instances, updated_fields
+
+
+def check_unique_values(
+    model: type[models.Model],
+    *,
+    field: str,
+    instances: dict[int, models.Model],
+    errors: RowErrors,
+) -> None:
+    """Check a unique field across the rows and the existing rows, at once."""
+
+    rows_by_value = {}
+    for number, instance in instances.items():
+        value = getattr(instance, field)
+        value = getattr(value, "name", value)  # File fields.
+        if value in rows_by_value:
+            errors.add(number, field, f"Duplicated in row {rows_by_value[value]}.")
+        else:
+            rows_by_value[value] = number
+
+    taken = (
+        model.objects.filter(**{f"{field}__in": rows_by_value})
+        .exclude(pk__in=[i.pk for i in instances.values() if i.pk is not None])
+        .values_list(field, flat=True)
+    )
+    for value in taken:
+        errors.add(rows_by_value[value], field, "Already exists.")
+
+
+def save_import_instances(
+    model: type[models.Model],
+    *,
+    user_id: int,
+    instances: dict[int, models.Model],
+    updated_fields: set[str],
+) -> dict[str, list[int]]:
+    """Insert and update the instances in bulk, return their ids."""
+
+    timestamp = now()
+    created = [i for i in instances.values() if i.pk is None]
+    updated = [i for i in instances.values() if i.pk is not None]
+    for instance in created:
+        instance.created_at = instance.updated_at = timestamp
+        instance.created_by_id = instance.updated_by_id = user_id
+    for instance in updated:
+        instance.updated_at = timestamp
+        instance.updated_by_id = user_id
+
+    with transaction.atomic():
+        model.objects.bulk_create(created)
+        if updated:
+            model.objects.bulk_update(
+                updated,
+                [*updated_fields, "updated_at", "updated_by_id"],
+            )
+
+    return {
+        "created": [i.pk for i in created],
+        "updated": [i.pk for i in updated],
+    }
@@ -0,0 +1,29 @@
+# Core
+import json
+import logging
+from datetime import datetime, timezone
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Format log records as single-line JSON objects.
+
+    Structured fields are passed through the `data` extra, e.g.
+    `logger.info("request", extra={"data": {...}})`.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Return the JSON representation of a record."""
+
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "data", {}))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, separators=(",", ":"))
@@ -0,0 +1,345 @@
+# Core
+import os
+import json
+import mmap
+import struct
+import threading
+from bisect import bisect_left
+from pathlib import Path
+from collections import defaultdict
+from typing import Callable, Iterable, Iterator
+
+# Libs
+from django.conf import settings
+
+# In-process metrics shared across worker processes.
+#
+# Every process writes its samples to its own memory mapped file inside
+# `settings.METRICS["DIR"]`, so recording a value is a lock-protected
+# in-memory float update with no IPC. The exposition aggregates the files
+# of all the processes, the way the Prometheus multiprocess mode does.
+#
+# File layout: an 8 bytes header holding the used size, followed by
+# entries of `key length (uint32) | key (utf-8, 8 bytes aligned) | value
+# (float64)`.
+
+_INITIAL_SIZE = 1 << 16
+_HEADER = struct.Struct("<I4x")
+_KEY_LENGTH = struct.Struct("<I")
+_VALUE = struct.Struct("<d")
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _read_entries(data) -> Iterator[tuple[str, float, int]]:
+    """Yield the `(key, value, value position)` entries of a values file."""
+
+    used = _HEADER.unpack_from(data, 0)[0]
+    pos = _HEADER.size
+    while pos < used:
+        length = _KEY_LENGTH.unpack_from(data, pos)[0]
+        key_start = pos + _KEY_LENGTH.size
+        value_pos = key_start + length + (-(_KEY_LENGTH.size + length) % 8)
+        key = bytes(data[key_start : key_start + length]).decode()
+        yield key, _VALUE.unpack_from(data, value_pos)[0], value_pos
+        pos = value_pos + _VALUE.size
+
+
+class _ValuesFile:
+    """The memory mapped values file of a single process."""
+
+    def __init__(self, path: Path):
+        """Open (or create) the file and index its entries."""
+
+        self._file = open(path, "a+b")
+        fd = self._file.fileno()
+        size = os.fstat(fd).st_size
+        if size == 0:
+            size = _INITIAL_SIZE
+            os.ftruncate(fd, size)
+        self._mmap = mmap.mmap(fd, size)
+        self._used = _HEADER.unpack_from(self._mmap, 0)[0] or _HEADER.size
+        self._positions = {
+            key: value_pos for key, _, value_pos in _read_entries(self._mmap)
+        }
+
+    def add(self, key: str, amount: float) -> None:
+        """Add an amount to the value of a key."""
+
+        pos = self._positions.get(key)
+        if pos is None:
+            pos = self._allocate(key)
+        current = _VALUE.unpack_from(self._mmap, pos)[0]
+        _VALUE.pack_into(self._mmap, pos, current + amount)
+
+    def _allocate(self, key: str) -> int:
+        """Append a zero valued entry for a key and return its position."""
+
+        encoded = key.encode()
+        padding = -(_KEY_LENGTH.size + len(encoded)) % 8
+        entry_size = _KEY_LENGTH.size + len(encoded) + padding + _VALUE.size
+
+        if self._used + entry_size > len(self._mmap):
+            new_size = len(self._mmap) * 2
+            while self._used + entry_size > new_size:
+                new_size *= 2
+            self._mmap.close()
+            os.ftruncate(self._file.fileno(), new_size)
+            self._mmap = mmap.mmap(self._file.fileno(), new_size)
+
+        pos = self._used
+        _KEY_LENGTH.pack_into(self._mmap, pos, len(encoded))
+        key_start = pos + _KEY_LENGTH.size
+        self._mmap[key_start : key_start + len(encoded)] = encoded
+        value_pos = key_start + len(encoded) + padding
+        _VALUE.pack_into(self._mmap, value_pos, 0.0)
+
+        # Publish the entry once it is complete.
+        self._used += entry_size
+        _HEADER.pack_into(self._mmap, 0, self._used)
+        self._positions[key] = value_pos
+        return value_pos
+
+
+class _ProcessValues:
+    """Lazily open the values file of the current process."""
+
+    def __init__(self):
+        """Initialize state."""
+
+        self._lock = threading.Lock()
+        self._pid = None
+        self._file = None
+
+    def add(self, *items: tuple[str, float]) -> None:
+        """Add amounts to keys in the current process file."""
+
+        with self._lock:
+            if self._pid != os.getpid():
+                # First use, or a forked child writing through its parent file.
+                self._pid = os.getpid()
+                directory = metrics_dir()
+                directory.mkdir(parents=True, exist_ok=True)
+                self._file = _ValuesFile(directory / f"{self._pid}.db")
+            for key, amount in items:
+                self._file.add(key, amount)
+
+
+_values = _ProcessValues()
+
+
+def metrics_dir() -> Path:
+    """Return the directory holding the processes values files."""
+
+    return Path(settings.METRICS["DIR"])
+
+
+def clear_metrics_dir() -> None:
+    """Remove the values files, e.g. when a server (re)starts."""
+
+    for path in metrics_dir().glob("*.db"):
+        path.unlink(missing_ok=True)
+
+
+class _Metric:
+    """Base metric."""
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable = ()):
+        """Register the metric."""
+
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._keys = {}
+        REGISTRY[name] = self
+
+    def _key(self, suffix: str, labels: dict, le: str = None) -> str:
+        """Return the storage key of a sample."""
+
+        cache_key = (suffix, le, *(labels[name] for name in self.labelnames))
+        key = self._keys.get(cache_key)
+        if key is None:
+            pairs = [[name, str(labels[name])] for name in self.labelnames]
+            key = json.dumps([self.name, suffix, pairs, le])
+            self._keys[cache_key] = key
+        return key
+
+
+class Counter(_Metric):
+    """A monotonically increasing counter."""
+
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        """Increment the counter."""
+
+        _values.add((self._key("", labels), amount))
+
+
+class Histogram(_Metric):
+    """A histogram with fixed buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable = (),
+        buckets: tuple = DEFAULT_BUCKETS,
+    ):
+        """Register the metric and its buckets."""
+
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        self._bucket_labels = [repr(float(b)) for b in self.buckets] + ["+Inf"]
+
+    def observe(self, value: float, **labels) -> None:
+        """Record an observation."""
+
+        le = self._bucket_labels[bisect_left(self.buckets, value)]
+        _values.add(
+            (self._key("_bucket", labels, le), 1),
+            (self._key("_sum", labels), value),
+            (self._key("_count", labels), 1),
+        )
+
+
+class GaugeCollector:
+    """A gauge computed when the metrics are exposed."""
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], float | Iterable[tuple[dict, float]]],
+    ):
+        """Register the collector."""
+
+        self.name = name
+        self.documentation = documentation
+        self.collect = collect
+        REGISTRY[name] = self
+
+
+REGISTRY: dict[str, _Metric | GaugeCollector] = {}
+
+# **=========== Common metrics ===========**
+
+HTTP_REQUESTS = Counter(
+    "bluewave_http_requests_total",
+    "HTTP requests served.",
+    ["endpoint", "method", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "bluewave_http_request_duration_seconds",
+    "HTTP request latency.",
+    ["endpoint"],
+)
+DB_QUERIES = Counter(
+    "bluewave_db_queries_total",
+    "Database queries executed.",
+    ["endpoint"],
+)
+HTTP_REJECTED = Counter(
+    "bluewave_http_rejected_total",
+    "HTTP requests rejected by reason (`throttled`, `queue_depth`, `latency`).",
+    ["endpoint", "reason"],
+)
+CACHE_REQUESTS = Counter(
+    "bluewave_cache_requests_total",
+    "Cache lookups by result (`hit` or `miss`).",
+    ["cache", "result"],
+)
+
+
+# **=========== Exposition ===========**
+
+
+def _format_labels(pairs: list) -> str:
+    """Return the text format of a label set."""
+
+    if not pairs:
+        return ""
+    content = ",".join(
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in pairs
+    )
+    return f"{{{content}}}"
+
+
+def _format_value(value: float) -> str:
+    """Return the text format of a sample value."""
+
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _aggregate() -> dict[str, float]:
+    """Return the sum of every key across the processes files."""
+
+    totals = defaultdict(float)
+    for path in metrics_dir().glob("*.db"):
+        with open(path, "rb") as values_file:
+            data = values_file.read()
+        if len(data) < _HEADER.size:
+            continue
+        for key, value, _ in _read_entries(data):
+            totals[key] += value
+    return totals
+
+
+def render_metrics() -> str:
+    """Return all the metrics in the Prometheus text format."""
+
+    samples = defaultdict(list)
+    for key, value in _aggregate().items():
+        name, suffix, pairs, le = json.loads(key)
+        samples[name].append((suffix, pairs, le, value))
+
+    lines = []
+    for name, metric in sorted(REGISTRY.items()):
+        lines.append(f"# HELP {name} {metric.documentation}")
+        lines.append(f"# TYPE {name} {metric.type}")
+
+        if isinstance(metric, GaugeCollector):
+            collected = metric.collect()
+            if isinstance(collected, (int, float)):
+                collected = [({}, collected)]
+            for labels, value in collected:
+                labels = _format_labels([[k, str(v)] for k, v in labels.items()])
+                lines.append(f"{name}{labels} {_format_value(float(value))}")
+            continue
+
+        if isinstance(metric, Histogram):
+            buckets = defaultdict(lambda: defaultdict(float))
+            totals = []
+            for suffix, pairs, le, value in samples[name]:
+                if suffix == "_bucket":
+                    buckets[json.dumps(pairs)][le] += value
+                else:
+                    totals.append(
+                        f"{name}{suffix}{_format_labels(pairs)} {_format_value(value)}"
+                    )
+            for pairs, counts in buckets.items():
+                pairs = json.loads(pairs)
+                cumulative = 0.0
+                for le in metric._bucket_labels:
+                    cumulative += counts.get(le, 0.0)
+                    labels = _format_labels(pairs + [["le", le]])
+                    lines.append(f"{name}_bucket{labels} {_format_value(cumulative)}")
+            lines.extend(sorted(totals))
+            continue
+
+        for suffix, pairs, _, value in samples[name]:
+            lines.append(
+                f"{name}{suffix}{_format_labels(pairs)} {_format_value(value)}"
+            )
+
+    return "\n".join(lines) + "\n"
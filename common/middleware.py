@@ -0,0 +1,703 @@
+# Core
+import os
+import functools
+import math
+import zlib
+import random
+import logging
+import cProfile
+from pathlib import Path
+from time import perf_counter
+from contextlib import contextmanager, nullcontext
+
+# Libs
+from django.conf import settings
+from django.db import connection
+from django.http import JsonResponse
+from django.core.cache import caches
+from django.urls import Resolver404, resolve
+from django.utils.cache import patch_vary_headers
+from django.utils.timezone import now
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Global
+from common import metrics
+from common.server import QUEUE_DEPTH_ENVIRON
+from common.throttling import LatencyWindow, TokenBucket, parse_rate
+
+request_logger = logging.getLogger("bluewave.requests")
+slow_query_logger = logging.getLogger("bluewave.db.slow")
+
+
+def endpoint_name(request) -> str:
+    """Return the URL name of the view serving a request."""
+
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unresolved"
+    return match.view_name or match._func_path
+
+
+class _MeasuredStream:
+    """
+    The streaming content of a response, measured while it is sent.
+
+    Each chunk is produced within `context()`, e.g. a query hook, and
+    `finish` is called once when the response is closed, i.e. sent or
+    abandoned by the client.
+    """
+
+    _done = object()
+
+    def __init__(self, chunks, finish, context=nullcontext):
+        """Wrap the chunks."""
+
+        self._chunks = iter(chunks)
+        self._finish = finish
+        self._context = context
+
+    def __iter__(self):
+        """Return the stream."""
+
+        return self
+
+    def __next__(self) -> bytes:
+        """Produce the next chunk within the context."""
+
+        with self._context():
+            chunk = next(self._chunks, self._done)
+        if chunk is self._done:
+            raise StopIteration
+        return chunk
+
+    def close(self) -> None:
+        """Call `finish`, once (response closer)."""
+
+        finish, self._finish = self._finish, None
+        if finish is not None:
+            finish()
+
+
+def on_response_sent(response, finish, context=nullcontext) -> None:
+    """
+    Call `finish` once a response is sent.
+
+    A streaming response runs its queries and serialization while sent,
+    after the middleware returned: its chunks are produced within
+    `context()` and `finish` is called when it is closed. Otherwise, and for
+    async streams, `finish` is called right away.
+    """
+
+    if response.streaming and not response.is_async:
+        response.streaming_content = _MeasuredStream(
+            response.streaming_content, finish, context
+        )
+    else:
+        finish()
+
+
+class _RequestTimer:
+    """Collect the timings of a single request."""
+
+    __slots__ = (
+        "request",
+        "slow_query_threshold",
+        "db_time",
+        "db_queries",
+        "render_start",
+        "render_time",
+    )
+
+    def __init__(self, request, slow_query_threshold: float):
+        """Initialize counters."""
+
+        self.request = request
+        self.slow_query_threshold = slow_query_threshold
+        self.db_time = 0.0
+        self.db_queries = 0
+        self.render_start = None
+        self.render_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        """Time a database query (`connection.execute_wrapper` hook)."""
+
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = perf_counter() - start
+            self.db_time += duration
+            self.db_queries += 1
+            if self.slow_query_threshold and duration >= self.slow_query_threshold:
+                slow_query_logger.warning(
+                    "slow query",
+                    extra={
+                        "data": {
+                            "endpoint": endpoint_name(self.request),
+                            "duration_ms": round(duration * 1000, 3),
+                            "sql": sql,
+                            "many": many,
+                        }
+                    },
+                )
+
+    def render_done(self, response) -> None:
+        """Record the response rendering time (post render callback)."""
+
+        self.render_time = perf_counter() - self.render_start
+
+    @contextmanager
+    def stream_chunk(self):
+        """Time a chunk of a streaming response, as serialization."""
+
+        start, db_time = perf_counter(), self.db_time
+        try:
+            with connection.execute_wrapper(self):
+                yield
+        finally:
+            self.render_time += perf_counter() - start - (self.db_time - db_time)
+
+
+class RequestTimingMiddleware:
+    """
+    Log sampled request timings and slow database queries.
+
+    A sampled request logs its total time split into database time,
+    serialization time (response rendering) and the remaining view time.
+    A streaming response is logged once sent, its chunks are timed as
+    serialization. Queries slower than the configured threshold are logged
+    for every request. When both features are disabled the request is
+    passed through untouched.
+    """
+
+    def __init__(self, get_response):
+        """Read the instrumentation settings once."""
+
+        self.get_response = get_response
+        config = settings.REQUEST_TIMING
+        self.sample_rate = config["SAMPLE_RATE"]
+        self.slow_query_threshold = config["SLOW_QUERY_MS"] / 1000
+
+    def __call__(self, request):
+        """Time the request if sampled."""
+
+        sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        if not sampled and not self.slow_query_threshold:
+            return self.get_response(request)
+
+        timer = _RequestTimer(request, self.slow_query_threshold)
+        if sampled:
+            request._timer = timer
+
+        start = perf_counter()
+        with connection.execute_wrapper(timer):
+            response = self.get_response(request)
+
+        def finish():
+            if sampled:
+                self._log(request, response, timer, perf_counter() - start)
+
+        on_response_sent(response, finish, timer.stream_chunk)
+        return response
+
+    @staticmethod
+    def _log(request, response, timer: _RequestTimer, total: float) -> None:
+        """Log the timings of a sampled request."""
+
+        request_logger.info(
+            "request",
+            extra={
+                "data": {
+                    "endpoint": endpoint_name(request),
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    "total_ms": round(total * 1000, 3),
+                    "db_ms": round(timer.db_time * 1000, 3),
+                    "db_queries": timer.db_queries,
+                    "serialization_ms": round(timer.render_time * 1000, 3),
+                    "view_ms": round(
+                        (total - timer.db_time - timer.render_time) * 1000, 3
+                    ),
+                }
+            },
+        )
+
+    def process_template_response(self, request, response):
+        """Start timing the response rendering of sampled requests."""
+
+        timer = getattr(request, "_timer", None)
+        if timer is not None:
+            timer.render_start = perf_counter()
+            response.add_post_render_callback(timer.render_done)
+        return response
+
+
+class MetricsMiddleware:
+    """
+    Record request count, latency and database queries per endpoint.
+
+    A streaming response is measured until sent.
+    """
+
+    def __init__(self, get_response):
+        """Initialize middleware."""
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Measure the request."""
+
+        queries = [0]
+
+        def count_query(execute, sql, params, many, context):
+            queries[0] += 1
+            return execute(sql, params, many, context)
+
+        start = perf_counter()
+        with connection.execute_wrapper(count_query):
+            response = self.get_response(request)
+
+        def finish():
+            duration = perf_counter() - start
+            endpoint = endpoint_name(request)
+            metrics.HTTP_REQUESTS.inc(
+                endpoint=endpoint,
+                method=request.method,
+                status=response.status_code,
+            )
+            metrics.HTTP_REQUEST_DURATION.observe(duration, endpoint=endpoint)
+            if queries[0]:
+                metrics.DB_QUERIES.inc(queries[0], endpoint=endpoint)
+
+        on_response_sent(
+            response, finish, functools.partial(connection.execute_wrapper, count_query)
+        )
+        return response
+
+
+_RESOLVED_NAME = "_resolved_name"
+
+
+def _resolved_name(request) -> str | None:
+    """
+    Return the URL name of a request path, None if not found.
+
+    Resolved ahead of the handler, once per request.
+    """
+
+    try:
+        return getattr(request, _RESOLVED_NAME)
+    except AttributeError:
+        pass
+    try:
+        name = resolve(request.path_info).view_name
+    except Resolver404:
+        name = None
+    setattr(request, _RESOLVED_NAME, name)
+    return name
+
+
+def closest_name(name: str | None, names) -> str | None:
+    """
+    Return the closest of some URL names or namespaces to a URL name.
+
+    E.g. `api:forms:user` for `api:forms:user`, else `api:forms`, else `api`.
+    """
+
+    while name:
+        if name in names:
+            return name
+        name = name.rpartition(":")[0]
+    return None
+
+
+def rejection_response(status: int, detail: str, retry_after: float) -> JsonResponse:
+    """Return an API error response asking the client to retry later."""
+
+    return JsonResponse(
+        {"errors": {"detail": detail}},
+        status=status,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+def client_address(request, num_proxies: int = 0) -> str:
+    """
+    Return the address of the client of a request.
+
+    Behind `num_proxies` reverse proxies, the address the first of them
+    appended to `X-Forwarded-For`.
+    """
+
+    if num_proxies:
+        forwarded = request.META.get("HTTP_X_FORWARDED_FOR", "").split(",")
+        if len(forwarded) >= num_proxies:
+            return forwarded[-num_proxies].strip()
+    return request.META.get("REMOTE_ADDR", "")
+
+
+class LoadSheddingMiddleware:
+    """
+    Reject requests with a 503 while the server is overloaded.
+
+    The server is overloaded when more connections wait to be accepted than
+    `MAX_QUEUE_DEPTH` (the `serve` server, on Linux), or when the p99
+    latency of the requests served by the process in the last
+    `WINDOW_SECONDS` is over `MAX_P99_MS`, streaming responses until sent.
+    The long running endpoints (`UNMEASURED`, URL names or namespaces),
+    e.g. the reports and imports, are not measured: a few legitimate slow
+    requests must not shed every request. Shed requests are not measured:
+    the slow latencies leave the window and the requests are served again.
+    The health check and metrics endpoints are never shed.
+    """
+
+    exempt_endpoints = ("api:health", "api:metrics")
+
+    def __init__(self, get_response):
+        """Read the load shedding settings once."""
+
+        self.get_response = get_response
+        config = settings.LOAD_SHEDDING
+        self.max_queue_depth = config["MAX_QUEUE_DEPTH"]
+        self.max_p99 = config["MAX_P99_MS"] / 1000
+        self.retry_after = config["RETRY_AFTER"]
+        self.latencies = LatencyWindow(
+            config["WINDOW_SECONDS"], min_samples=config["MIN_SAMPLES"]
+        )
+        self.unmeasured = frozenset(config["UNMEASURED"])
+
+    def __call__(self, request):
+        """Serve the request unless overloaded."""
+
+        reason = self._overload(request)
+        if reason is not None and not self._is_exempt(request):
+            metrics.HTTP_REJECTED.inc(
+                endpoint=_resolved_name(request) or "unresolved", reason=reason
+            )
+            return rejection_response(
+                503, "Server overloaded, retry later.", self.retry_after
+            )
+
+        start = perf_counter()
+        response = self.get_response(request)
+        if self.max_p99 and not self._is_unmeasured(request):
+            on_response_sent(
+                response, lambda: self.latencies.add(perf_counter() - start)
+            )
+        return response
+
+    def _overload(self, request) -> str | None:
+        """Return the overload reason, None if not overloaded."""
+
+        # Set by the `serve` server, a callable.
+        queue_depth = request.META.get(QUEUE_DEPTH_ENVIRON)
+        if self.max_queue_depth and queue_depth is not None:
+            depth = queue_depth()
+            if depth is not None and depth > self.max_queue_depth:
+                return "queue_depth"
+        if self.max_p99 and self.latencies.p99() > self.max_p99:
+            return "latency"
+        return None
+
+    def _is_exempt(self, request) -> bool:
+        """Return whether a request is never shed."""
+
+        return _resolved_name(request) in self.exempt_endpoints
+
+    def _is_unmeasured(self, request) -> bool:
+        """Return whether a request is left out of the latency window."""
+
+        return closest_name(_resolved_name(request), self.unmeasured) is not None
+
+
+class ThrottleMiddleware:
+    """
+    Rate limit the endpoints by client address, with a 429.
+
+    `THROTTLING["RATES"]` maps URL names or namespaces (e.g. `api:forms`)
+    to a `<requests>/<period>` rate; an endpoint is limited by its closest
+    rate. The token buckets are shared by the processes in the `CACHE`
+    cache, and taken before the view authenticates or reads anything.
+    """
+
+    def __init__(self, get_response):
+        """Read the throttling settings once."""
+
+        self.get_response = get_response
+        config = settings.THROTTLING
+        cache = caches[config["CACHE"]]
+        self.buckets = {
+            name: TokenBucket(cache, *parse_rate(rate))
+            for name, rate in config["RATES"].items()
+        }
+        self.num_proxies = config["NUM_PROXIES"]
+
+    def __call__(self, request):
+        """Serve the request unless rate limited."""
+
+        if not self.buckets:
+            return self.get_response(request)
+        name = _resolved_name(request)
+        scope = closest_name(name, self.buckets)
+        if scope is not None:
+            client = client_address(request, self.num_proxies)
+            wait = self.buckets[scope].take(f"throttle:{scope}:{client}")
+            if wait:
+                metrics.HTTP_REJECTED.inc(endpoint=name, reason="throttled")
+                return rejection_response(429, "Too many requests, retry later.", wait)
+        return self.get_response(request)
+
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+def profile_path(endpoint: str) -> Path:
+    """Return the path of a new request profile."""
+
+    directory = Path(settings.PROFILING["DIR"])
+    timestamp = now().strftime("%Y%m%d%H%M%S%f")
+    return directory / f"{endpoint.replace(':', '.')}-{timestamp}-{os.getpid()}.prof"
+
+
+def save_profile(profiler: cProfile.Profile, path: Path) -> None:
+    """Dump a request profile to the profiles directory."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(path)
+
+
+@contextmanager
+def _profiling(profiler: cProfile.Profile):
+    """Profile a block, e.g. a chunk of a streaming response."""
+
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+
+
+class ProfilingMiddleware:
+    """
+    Capture a cProfile profile of selected requests.
+
+    A request is profiled when it is sampled (`PROFILING["SAMPLE_RATE"]`)
+    or when a staff user sends the `X-Profile` header, the response then
+    includes the profile file name in `X-Profile-Id`. The header is ignored
+    for other users. Profiles are stored in `PROFILING["DIR"]`, see the
+    `profiles` command to inspect them.
+    """
+
+    def __init__(self, get_response):
+        """Read the profiling settings once."""
+
+        self.get_response = get_response
+        self.sample_rate = settings.PROFILING["SAMPLE_RATE"]
+        self.authentication = JWTAuthentication()
+
+    def __call__(self, request):
+        """Profile the request if requested or sampled."""
+
+        requested = PROFILE_HEADER in request.headers
+        sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        # Decided before profiling, the header must not let anyone slow the
+        # server down.
+        is_staff = requested and self._is_staff(request)
+        if not is_staff and not sampled:
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is already active on this thread.
+            return self.get_response(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+
+        # Named before a streaming response is sent, and saved once sent.
+        path = profile_path(endpoint_name(request))
+        if is_staff:
+            response[PROFILE_ID_HEADER] = path.name
+        on_response_sent(
+            response,
+            lambda: save_profile(profiler, path),
+            functools.partial(_profiling, profiler),
+        )
+        return response
+
+    def _is_staff(self, request) -> bool:
+        """
+        Return whether a request is authenticated as a staff user.
+
+        The API user is authenticated ahead of the view, from its bearer
+        token.
+        """
+
+        try:
+            authenticated = self.authentication.authenticate(request)
+        except AuthenticationFailed:
+            return False
+        return authenticated is not None and authenticated[0].is_staff
+
+
+class _GzipCompressor:
+    """A streaming gzip compressor."""
+
+    def __init__(self, level: int):
+        """Start a gzip stream."""
+
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk, and flush it so it can be sent right away."""
+
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        """End the stream."""
+
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    """A streaming brotli compressor."""
+
+    def __init__(self, quality: int):
+        """Start a brotli stream."""
+
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk, and flush it so it can be sent right away."""
+
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        """End the stream."""
+
+        return self._compressor.finish()
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """Return the supported content encodings, by preference."""
+
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """Return the preferred supported encoding of an `Accept-Encoding`."""
+
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding.strip().lower()] = quality
+
+    for encoding in supported_encodings():
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def compressor(encoding: str) -> _GzipCompressor | _BrotliCompressor:
+    """Return a new streaming compressor of a supported encoding."""
+
+    config = settings.RESPONSE_COMPRESSION
+    if encoding == "br":
+        return _BrotliCompressor(config["BROTLI_QUALITY"])
+    return _GzipCompressor(config["GZIP_LEVEL"])
+
+
+def compress(content: bytes, encoding: str) -> bytes:
+    """Compress a whole content."""
+
+    stream = compressor(encoding)
+    return stream.compress(content) + stream.finish()
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with brotli (when installed) or gzip.
+
+    The encoding is negotiated from `Accept-Encoding`. Responses of the
+    configured content types are compressed above `MIN_SIZE` bytes,
+    streaming responses chunk by chunk as they are sent.
+    """
+
+    def __init__(self, get_response):
+        """Read the compression settings once."""
+
+        self.get_response = get_response
+        config = settings.RESPONSE_COMPRESSION
+        self.min_size = config["MIN_SIZE"]
+        self.content_types = tuple(config["CONTENT_TYPES"])
+
+    def __call__(self, request):
+        """Compress the response if accepted."""
+
+        response = self.get_response(request)
+        if response.has_header("Content-Encoding"):
+            return response
+        if not response.get("Content-Type", "").startswith(self.content_types):
+            return response
+        if response.streaming and response.is_async:
+            return response
+        if not response.streaming and len(response.content) < self.min_size:
+            return response
+
+        # Set even when not compressed, caches key on `Accept-Encoding`.
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = negotiate_encoding(request.headers.get("Accept-Encoding", ""))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            response.streaming_content = self._compress_stream(
+                response.streaming_content, encoding
+            )
+            del response.headers["Content-Length"]
+        else:
+            content = compress(response.content, encoding)
+            if len(content) >= len(response.content):
+                return response
+            response.content = content
+            response.headers["Content-Length"] = str(len(content))
+
+        # The content differs from the identity one, a strong ETag no longer
+        # matches it.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    @staticmethod
+    def _compress_stream(chunks, encoding: str):
+        """Yield the compressed chunks of a streaming content."""
+
+        stream = compressor(encoding)
+        for chunk in chunks:
+            data = stream.compress(chunk)
+            if data:
+                yield data
+        yield stream.finish()
@@ -0,0 +1,41 @@
+# Libs
+from rest_framework import renderers
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_encoder = JSONEncoder()
+
+_LINE_SEPARATOR = "\u2028".encode()
+_PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """
+    JSON renderer using `orjson` when it is installed.
+
+    Falls back to the DRF renderer (stdlib `json`) when `orjson` is
+    missing and for indented output, e.g. the browsable API. Values
+    `orjson` does not serialize the DRF way (dates, decimals, lazy
+    strings...) go through the DRF encoder, so both outputs match.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Extend to encode with `orjson`."""
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        content = orjson.dumps(
+            data,
+            default=_encoder.default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+        # Escaped by the DRF renderer too, they are invalid in JavaScript.
+        return content.replace(_LINE_SEPARATOR, b"\\u2028").replace(
+            _PARAGRAPH_SEPARATOR, b"\\u2029"
+        )
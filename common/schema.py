@@ -0,0 +1,38 @@
+# Core
+from typing import Callable
+
+# Libs
+from django.urls import get_resolver
+
+# Views and arguments of the `extend_schema` decorations to apply.
+_deferred: list[tuple[Callable, dict]] = []
+
+
+def extend_schema(**kwargs) -> Callable:
+    """
+    Defer a drf-spectacular `extend_schema` decoration to schema generation.
+
+    Applying it imports the whole drf-spectacular inspection machinery, on
+    every worker start. Deferred decorations are applied, in order, by
+    `apply_deferred_schemas`.
+    """
+
+    def decorator(view: Callable) -> Callable:
+        _deferred.append((view, kwargs))
+        return view
+
+    return decorator
+
+
+def apply_deferred_schemas() -> None:
+    """Apply the deferred `extend_schema` decorations of all the views."""
+
+    from drf_spectacular.utils import extend_schema as _extend_schema
+
+    # Import the lazily included URL confs, and so every API module.
+    get_resolver().reverse_dict
+
+    decorations = list(_deferred)
+    _deferred.clear()
+    for view, kwargs in decorations:
+        _extend_schema(**kwargs)(view)
@@ -1,6 +1,25 @@
+from typing import Iterable
+
+from django.db.models import Manager, Model, QuerySet
+from django.core.exceptions import FieldDoesNotExist
 from rest_framework import serializers
 
 
+class ListSerializer(serializers.ListSerializer):
+    """
+    Define API base list serializer.
+
+    The child serializer prefetches what its fields need for all the items
+    at once, see `Serializer.prefetch`.
+    """
+
+    def to_representation(self, data):
+        """Extend to prefetch the fields data of all the items."""
+        items = list(data.all() if isinstance(data, Manager) else data)
+        self.child.prefetch(items)
+        return super().to_representation(items)
+
+
 class Serializer(serializers.Serializer):
     """
     Define API base serializer.
@@ -9,8 +28,99 @@ class Serializer(serializers.Serializer):
     overridden to exclude business logic, which should reside
     in the models for simple cases or services for more complex
     scenarios.
+
+    Output serializers accept a sparse fieldset: `fields` keeps only
+    those fields, and when `expand` is given, nested serializers not
+    listed in it are rendered as the related object ID.
+
+    Fields with a `prefetch(instances)` method load their data for many
+    instances at once, before the instances are rendered.
     """
 
+    class Meta:
+        list_serializer_class = ListSerializer
+
+    def __init__(
+        self,
+        *args,
+        fields: Iterable[str] = None,
+        expand: Iterable[str] = None,
+        **kwargs,
+    ):
+        """Extend to keep the requested fieldset."""
+        self._selected_fields = None if fields is None else set(fields)
+        self._expanded_fields = None if expand is None else set(expand)
+        super().__init__(*args, **kwargs)
+
+    def get_fields(self) -> dict:
+        """Extend to apply the requested fieldset."""
+        fields = super().get_fields()
+
+        if self._selected_fields is not None:
+            unknown = self._selected_fields.difference(fields)
+            if unknown:
+                msg = "Unknown field(s): {}.".format(", ".join(sorted(unknown)))
+                raise serializers.ValidationError({"fields": msg})
+            fields = {
+                name: field
+                for name, field in fields.items()
+                if name in self._selected_fields
+            }
+
+        if self._expanded_fields is not None:
+            nested = {
+                name
+                for name, field in fields.items()
+                if isinstance(field, serializers.Serializer)
+            }
+            unknown = self._expanded_fields.difference(nested)
+            if unknown:
+                msg = "Unknown nested field(s): {}.".format(", ".join(sorted(unknown)))
+                raise serializers.ValidationError({"expand": msg})
+            for name in nested.difference(self._expanded_fields):
+                source = fields[name].source or name
+                fields[name] = serializers.ReadOnlyField(source=f"{source}_id")
+
+        return fields
+
+    def prefetch(self, instances: list) -> None:
+        """Let the fields load their data for many instances at once."""
+        for field in self.fields.values():
+            prefetch = getattr(field, "prefetch", None)
+            if prefetch is not None:
+                prefetch(instances)
+
+    @classmethod
+    def shape_queryset(
+        cls,
+        queryset: QuerySet,
+        *,
+        fields: Iterable[str] = None,
+        expand: Iterable[str] = None,
+        keep: Iterable[str] = (),
+    ) -> QuerySet:
+        """
+        Restrict a queryset to the columns and joins of a fieldset.
+
+        `keep` lists model fields loaded anyway, e.g. ordering keys. The
+        queryset is returned unchanged when no fieldset is requested.
+        """
+        if fields is None and expand is None:
+            return queryset
+
+        only, related = list(keep), []
+        _collect_queryset_paths(
+            cls(fields=fields, expand=expand),
+            queryset.model,
+            prefix="",
+            only=only,
+            related=related,
+        )
+        queryset = queryset.select_related(None)
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset.only(*only)
+
     def create(self, validated_data):
         """Invalidate serializer instance creation."""
         raise NotImplementedError()
@@ -24,6 +134,42 @@ class Serializer(serializers.Serializer):
         self.is_valid(raise_exception=True)
 
 
+def _collect_queryset_paths(
+    serializer: serializers.Serializer,
+    model: type[Model],
+    *,
+    prefix: str,
+    only: list[str],
+    related: list[str],
+) -> None:
+    """Collect the model fields and relations rendered by a serializer."""
+    for field in serializer.fields.values():
+        if field.source == "*" or isinstance(field, serializers.ListSerializer):
+            continue
+        name = field.source.split(".")[0]
+        try:
+            model_field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            # Annotations and properties.
+            continue
+        if not model_field.concrete:
+            continue
+
+        only.append(f"{prefix}{model_field.name}")
+        if not model_field.is_relation or name == model_field.attname:
+            continue
+
+        related.append(f"{prefix}{name}")
+        if isinstance(field, serializers.Serializer):
+            _collect_queryset_paths(
+                field,
+                model_field.related_model,
+                prefix=f"{prefix}{name}__",
+                only=only,
+                related=related,
+            )
+
+
 def inline_serializer(
     *,
     name: str,
@@ -33,3 +179,49 @@ def inline_serializer(
 ):
     """Return a nested inlined serializer."""
     return type(name, (base,), fields)(**kwargs)
+
+
+class ImportRowSerializer(Serializer):
+    """
+    Define bulk import row base serializer.
+
+    Rows with an `id` update that instance, the other rows create an
+    instance and require the `create_required` fields.
+    """
+
+    id = serializers.IntegerField(
+        help_text="ID of the instance to update, omit it to create one.",
+        min_value=1,
+        required=False,
+    )
+
+    create_required: tuple[str, ...] = ()
+
+    def __init__(self, *args, **kwargs):
+        """Extend to make fields not required."""
+        super().__init__(*args, **kwargs)
+        for field in self.fields:
+            self.fields[field].required = False
+
+    def validate(self, attrs: dict) -> dict:
+        """Check the fields required to create an instance."""
+        if "id" not in attrs:
+            missing = [name for name in self.create_required if name not in attrs]
+            if missing:
+                raise serializers.ValidationError(
+                    {name: "This field is required." for name in missing}
+                )
+        return attrs
+
+
+class ImportResultSerializer(Serializer):
+    """A bulk import output serializer."""
+
+    created = serializers.ListField(
+        child=serializers.IntegerField(),
+        help_text="IDs of the created instances.",
+    )
+    updated = serializers.ListField(
+        child=serializers.IntegerField(),
+        help_text="IDs of the updated instances.",
+    )
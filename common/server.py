@@ -0,0 +1,458 @@
+# Core
+import gc
+import os
+import sys
+import math
+import time
+import random
+import select
+import signal
+import socket
+import struct
+import logging
+import tempfile
+
+# Libs
+from django.db import connections
+from django.urls import get_resolver
+from django.core.servers.basehttp import WSGIServer, WSGIRequestHandler
+
+logger = logging.getLogger("bluewave.server")
+
+# Hand the listening socket and the running workers over to the master
+# re-executed on reload.
+LISTEN_FD_ENV = "BLUEWAVE_SERVER_FD"
+WORKERS_ENV = "BLUEWAVE_SERVER_WORKERS"
+
+# WSGI environ key of a callable returning the accept queue depth.
+QUEUE_DEPTH_ENVIRON = "bluewave.queue_depth"
+
+# `tcpi_unacked` of the Linux `tcp_info`, the accept queue length of a
+# listening socket.
+_TCP_INFO_SIZE = 104
+_TCP_INFO_QUEUE = struct.Struct("<24xI")
+
+
+def parse_bind(bind: str) -> tuple[str, int]:
+    """Return the `(host, port)` of a `host:port` address."""
+
+    host, _, port = bind.rpartition(":")
+    return host.strip("[]") or "0.0.0.0", int(port)
+
+
+def accept_queue_depth(sock: socket.socket) -> int | None:
+    """
+    Return the connections waiting to be accepted on a listening socket.
+
+    Only known on Linux, None elsewhere.
+    """
+
+    try:
+        info = sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_INFO, _TCP_INFO_SIZE)
+    except (AttributeError, OSError):
+        return None
+    return _TCP_INFO_QUEUE.unpack_from(info)[0]
+
+
+def preload_application():
+    """
+    Return the WSGI application, with every URL conf and view imported.
+
+    Imported by the master before forking, the workers share the loaded
+    modules copy-on-write instead of each importing them.
+    """
+
+    from config.wsgi import application
+
+    get_resolver().reverse_dict
+    connections.close_all()
+    # Keep the preloaded objects out of the collections: a collection
+    # writes to every tracked object, which copies its memory page.
+    gc.collect()
+    gc.freeze()
+    return application
+
+
+class _WorkerRequestHandler(WSGIRequestHandler):
+    """
+    Request handler serving a single request per connection.
+
+    A worker serves one connection at a time: a connection reads and
+    writes with the `read_timeout` of the server, and is closed once its
+    request is served, never kept alive.
+    """
+
+    def setup(self):
+        """Extend to time out the connection."""
+
+        self.timeout = self.server.read_timeout
+        super().setup()
+
+    def handle(self):
+        """Serve a request, then close the connection."""
+
+        self.close_connection = True
+        try:
+            self.handle_one_request()
+        except TimeoutError:
+            logger.warning(
+                "Connection from %s timed out, closed.", self.client_address[0]
+            )
+            return
+        try:
+            self.connection.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass
+
+
+class _WorkerWSGIServer(WSGIServer):
+    """WSGI server accepting from the listening socket of the master."""
+
+    def __init__(self, sock: socket.socket, application, *, read_timeout: float):
+        """Serve the application on an already listening socket."""
+
+        super().__init__(
+            sock.getsockname()[:2],
+            _WorkerRequestHandler,
+            ipv6=sock.family == socket.AF_INET6,
+            bind_and_activate=False,
+        )
+        self.socket.close()
+        self.socket = sock
+        host, self.server_port = sock.getsockname()[:2]
+        self.server_name = socket.getfqdn(host)
+        self.setup_environ()
+        self.base_environ[QUEUE_DEPTH_ENVIRON] = lambda: accept_queue_depth(sock)
+        self.set_app(application)
+        self.read_timeout = read_timeout
+        self.handled = 0
+
+    def handle_request(self):
+        """
+        Override to wait for a connection up to `timeout`.
+
+        The shared listening socket is non-blocking, the default would not
+        wait at all and the worker would spin.
+        """
+
+        if select.select([self.socket], [], [], self.timeout)[0]:
+            self._handle_request_noblock()
+        else:
+            self.handle_timeout()
+
+    def process_request(self, request, client_address):
+        """Extend to count the requests."""
+
+        self.handled += 1
+        super().process_request(request, client_address)
+
+
+class Worker:
+    """A forked process serving requests until stopped or recycled."""
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        application,
+        *,
+        max_requests: int,
+        read_timeout: float,
+    ):
+        """Initialize state, the heartbeat file is watched by the master."""
+
+        self.sock = sock
+        self.application = application
+        self.max_requests = max_requests
+        self.read_timeout = read_timeout
+        self.heartbeat = tempfile.TemporaryFile()
+        self.alive = True
+
+    def last_heartbeat(self) -> float:
+        """Return the time of the last worker heartbeat."""
+
+        return os.fstat(self.heartbeat.fileno()).st_mtime
+
+    def run(self) -> None:
+        """Serve requests, in the forked process."""
+
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self._stop)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
+        server = _WorkerWSGIServer(
+            self.sock, self.application, read_timeout=self.read_timeout
+        )
+        # Wakes up to heartbeat, and to notice a stop within half a second.
+        server.timeout = 0.5
+        while self.alive:
+            os.utime(self.heartbeat.fileno())
+            server.handle_request()
+            if self.max_requests and server.handled >= self.max_requests:
+                logger.info(
+                    "Worker %s recycled after %s requests.", os.getpid(), server.handled
+                )
+                break
+        connections.close_all()
+
+    def _stop(self, signum, frame) -> None:
+        """Stop once the current request is served."""
+
+        self.alive = False
+
+
+class PreforkServer:
+    """
+    Pre-fork WSGI server.
+
+    The master imports the application once, listens and forks the workers,
+    which all accept from the shared socket. The master restarts the workers
+    that exit, e.g. once recycled after `max_requests`, and kills the ones
+    missing their heartbeat for `timeout` seconds. A worker serves one
+    request per connection, and closes the connections idle for
+    `read_timeout` seconds, which must be shorter than `timeout`. On Linux,
+    connections are only accepted once they sent data.
+
+    Signals: `SIGTERM` and `SIGINT` stop gracefully. `SIGHUP` reloads the
+    code with no downtime: the master re-executes itself, keeping its PID
+    and listening socket, forks new workers from the new code and only
+    then stops the old ones gracefully.
+    """
+
+    def __init__(
+        self,
+        application,
+        *,
+        bind: str,
+        workers: int,
+        max_requests: int = 0,
+        max_requests_jitter: int = 0,
+        timeout: float = 30,
+        read_timeout: float = 10,
+        graceful_timeout: float = 30,
+        backlog: int = 2048,
+    ):
+        """Initialize state."""
+
+        self.application = application
+        self.bind = bind
+        self.num_workers = workers
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.timeout = timeout
+        self.read_timeout = read_timeout
+        self.graceful_timeout = graceful_timeout
+        self.backlog = backlog
+
+        self.sock = None
+        self.workers: dict[int, Worker] = {}
+        # Workers being stopped, by PID, with their kill deadline.
+        self.stopping: dict[int, float] = {}
+        self._signals = []
+        self._wakeup = None
+
+    def run(self) -> None:
+        """Listen, fork the workers and supervise them until stopped."""
+
+        inherited = os.environ.pop(WORKERS_ENV, "")
+        self.sock = self._listen()
+        self._install_signals()
+        logger.info(
+            "Master %s listening on %s with %s workers.",
+            os.getpid(),
+            self.bind,
+            self.num_workers,
+        )
+
+        self._spawn_workers()
+        # Reloaded: the new workers now accept, stop the old ones.
+        for pid in filter(None, inherited.split(",")):
+            self._stop_worker(int(pid))
+
+        while True:
+            self._wait()
+            for signum in self._take_signals():
+                if signum == signal.SIGHUP:
+                    self._reload()
+                elif signum in (signal.SIGTERM, signal.SIGINT):
+                    self._shutdown()
+                    return
+            self._reap_workers()
+            self._kill_late_workers()
+            self._spawn_workers()
+
+    def _listen(self) -> socket.socket:
+        """Return the listening socket, inherited when reloaded."""
+
+        fd = os.environ.pop(LISTEN_FD_ENV, None)
+        if fd is not None:
+            sock = socket.socket(fileno=int(fd))
+            os.set_inheritable(sock.fileno(), False)
+        else:
+            host, port = parse_bind(self.bind)
+            family = socket.AF_INET6 if ":" in host else socket.AF_INET
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((host, port))
+            sock.listen(self.backlog)
+        # Every worker is woken up by a connection, the ones not accepting
+        # it must not block.
+        sock.setblocking(False)
+        if hasattr(socket, "TCP_DEFER_ACCEPT"):
+            # Linux: a connection is only accepted once it sent its request,
+            # idle connections do not even take a worker.
+            sock.setsockopt(
+                socket.IPPROTO_TCP,
+                socket.TCP_DEFER_ACCEPT,
+                max(math.ceil(self.read_timeout), 1),
+            )
+        return sock
+
+    def _install_signals(self) -> None:
+        """Queue the handled signals, waking up the master loop."""
+
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        self._wakeup = read_fd
+        signal.set_wakeup_fd(write_fd)
+        for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP, signal.SIGCHLD):
+            signal.signal(signum, self._queue_signal)
+
+    def _queue_signal(self, signum, frame) -> None:
+        """Queue a signal for the master loop."""
+
+        if signum != signal.SIGCHLD:
+            self._signals.append(signum)
+
+    def _take_signals(self) -> list[int]:
+        """Return and clear the queued signals."""
+
+        signals, self._signals = self._signals, []
+        return signals
+
+    def _wait(self) -> None:
+        """Sleep until a signal is received, or for a second."""
+
+        if select.select([self._wakeup], [], [], 1.0)[0]:
+            while True:
+                try:
+                    if not os.read(self._wakeup, 512):
+                        break
+                except BlockingIOError:
+                    break
+
+    def _spawn_workers(self) -> None:
+        """Fork workers up to the configured number."""
+
+        while len(self.workers) < self.num_workers:
+            max_requests = self.max_requests
+            if max_requests:
+                # Jittered, so that the workers are not all recycled at once.
+                max_requests += random.randint(0, self.max_requests_jitter)
+            worker = Worker(
+                self.sock,
+                self.application,
+                max_requests=max_requests,
+                read_timeout=self.read_timeout,
+            )
+
+            pid = os.fork()
+            if pid:
+                self.workers[pid] = worker
+                continue
+
+            # Worker process: serve, then exit without returning to the caller.
+            status = 0
+            try:
+                os.close(self._wakeup)
+                signal.set_wakeup_fd(-1)
+                worker.run()
+            except BaseException:
+                logger.exception("Worker %s failed.", os.getpid())
+                status = 1
+            finally:
+                os._exit(status)
+
+    def _stop_worker(self, pid: int) -> None:
+        """Ask a worker to stop once its current request is served."""
+
+        worker = self.workers.pop(pid, None)
+        if worker is not None:
+            worker.heartbeat.close()
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+        self.stopping[pid] = time.monotonic() + self.graceful_timeout
+
+    def _reap_workers(self) -> None:
+        """Collect the exited workers."""
+
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if not pid:
+                return
+            self.stopping.pop(pid, None)
+            worker = self.workers.pop(pid, None)
+            if worker is not None:
+                worker.heartbeat.close()
+                if os.waitstatus_to_exitcode(status):
+                    logger.warning(
+                        "Worker %s exited with status %s.",
+                        pid,
+                        os.waitstatus_to_exitcode(status),
+                    )
+
+    def _kill_late_workers(self) -> None:
+        """Kill the hung workers, and the ones too slow to stop."""
+
+        now = time.time()
+        for pid, worker in list(self.workers.items()):
+            if now - worker.last_heartbeat() > self.timeout:
+                logger.error("Worker %s timed out, killed.", pid)
+                self._kill(pid)
+
+        now = time.monotonic()
+        for pid, deadline in list(self.stopping.items()):
+            if now > deadline:
+                logger.warning("Worker %s did not stop in time, killed.", pid)
+                self._kill(pid)
+                del self.stopping[pid]
+
+    def _kill(self, pid: int) -> None:
+        """Kill a worker, it is reaped and replaced by the master loop."""
+
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    def _reload(self) -> None:
+        """Re-execute the master, handing over the socket and the workers."""
+
+        logger.info("Master %s reloading.", os.getpid())
+        os.set_inheritable(self.sock.fileno(), True)
+        os.environ[LISTEN_FD_ENV] = str(self.sock.fileno())
+        os.environ[WORKERS_ENV] = ",".join(map(str, [*self.workers, *self.stopping]))
+        # Ignored dispositions survive `exec`: a reload requested while the
+        # new code is loading must not kill the master.
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execv(sys.executable, [sys.executable, *sys.argv])
+
+    def _shutdown(self) -> None:
+        """Stop the workers gracefully, killing the late ones."""
+
+        logger.info("Master %s stopping.", os.getpid())
+        for pid in list(self.workers):
+            self._stop_worker(pid)
+        while self.stopping:
+            self._reap_workers()
+            self._kill_late_workers()
+            time.sleep(0.1)
+        self.sock.close()
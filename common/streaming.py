@@ -0,0 +1,170 @@
+# Core
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+# Libs
+from django.conf import settings
+from django.db.models import F, Q, QuerySet
+from django.http import StreamingHttpResponse
+from rest_framework.response import Response
+from rest_framework.status import HTTP_200_OK
+
+# Global
+from common.renderers import JSONRenderer
+
+# Bounded memory list responses.
+#
+# A list is read from the database in chunks, each row is mapped to its
+# output dict by the serializer, and each chunk of dicts is encoded and sent
+# before the next one is read: whatever the number of rows, at most one
+# chunk of instances, dicts and JSON is held in memory.
+#
+# Each chunk is read by its own query, which is finished before the chunk is
+# sent: an open SQLite read would lock out every write until the client got
+# the whole list. The chunks are paginated by keyset, the next chunk
+# starting after the ordering values of the last row of the previous one.
+
+_renderer = JSONRenderer()
+
+# Annotations holding the ordering values of the rows.
+_KEY_PREFIX = "_stream_key_"
+
+
+def _keyset_ordering(queryset: QuerySet) -> list[tuple[str, bool]]:
+    """Return the `(field, descending)` ordering of a queryset, ending by pk."""
+
+    query = queryset.query
+    ordering = query.order_by
+    if not ordering and query.default_ordering:
+        ordering = queryset.model._meta.ordering
+    pk = queryset.model._meta.pk.name
+    keys = []
+    for item in ordering:
+        if not isinstance(item, str) or item == "?":
+            raise ValueError(f"Cannot read rows ordered by {item!r} by chunks.")
+        name = item.removeprefix("-")
+        keys.append((pk if name == "pk" else name, item.startswith("-")))
+        if keys[-1][0] == pk:
+            # Unique, the next fields never apply.
+            return keys
+    return keys + [(pk, False)]
+
+
+def _after(keys: list[tuple[str, bool]], values: list) -> Q:
+    """Return the condition of the rows ordered after some ordering values."""
+
+    condition = Q()
+    for index, (name, descending) in enumerate(keys):
+        lookup = f"{name}__lt" if descending else f"{name}__gt"
+        condition |= Q(
+            *(Q(**{key: value}) for (key, _), value in zip(keys, values[:index])),
+            **{lookup: values[index]},
+        )
+    return condition
+
+
+def _iterate_keyset(
+    queryset: QuerySet, keys: list[tuple[str, bool]], chunk_size: int
+) -> Iterator:
+    """Yield the rows of a queryset, read by chunks of `chunk_size`."""
+
+    aliases = [f"{_KEY_PREFIX}{index}" for index in range(len(keys))]
+    queryset = queryset.annotate(
+        **{alias: F(name) for alias, (name, _) in zip(aliases, keys)}
+    ).order_by(*(f"-{name}" if descending else name for name, descending in keys))
+
+    page = queryset
+    while True:
+        rows = list(page[:chunk_size])
+        yield from rows
+        if len(rows) < chunk_size:
+            return
+        values = [getattr(rows[-1], alias) for alias in aliases]
+        page = queryset.filter(_after(keys, values))
+
+
+def iterate_rows(rows: QuerySet | Iterable, chunk_size: int = None) -> Iterator:
+    """
+    Return an iterator of the rows, a queryset read by chunks.
+
+    The chunks of a queryset of model instances are paginated by its
+    ordering fields and pk, which must not be null. A sliced queryset is
+    read at once.
+    """
+
+    if not isinstance(rows, QuerySet):
+        return iter(rows)
+    if rows.query.is_sliced:
+        return iter(list(rows))
+    # Checked before iterating, e.g. before a response is streamed.
+    keys = _keyset_ordering(rows)
+    return _iterate_keyset(rows, keys, chunk_size or settings.STREAMING["CHUNK_SIZE"])
+
+
+def iterate_chunks(rows: QuerySet | Iterable, chunk_size: int = None) -> Iterator[list]:
+    """Yield the rows by lists of `chunk_size`, a queryset fetched by chunks."""
+
+    chunk_size = chunk_size or settings.STREAMING["CHUNK_SIZE"]
+    rows = iterate_rows(rows, chunk_size)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+def encode_json_array(chunks: Iterable[list]) -> Iterator[bytes]:
+    """Encode chunks of items as a single JSON array, a chunk at a time."""
+
+    yield b"["
+    separator = b""
+    for chunk in chunks:
+        if chunk:
+            # The chunk encoded as an array, without its brackets.
+            yield separator + _renderer.render(chunk)[1:-1]
+            separator = b","
+    yield b"]"
+
+
+def map_chunks(
+    chunks: Iterable[list], mapper: Callable, prepare: Callable = None
+) -> Iterator[list]:
+    """Yield the chunks with each row mapped, after `prepare(chunk)` if given."""
+
+    for chunk in chunks:
+        if prepare is not None:
+            prepare(chunk)
+        yield [mapper(row) for row in chunk]
+
+
+def stream_list_response(
+    request,
+    rows: QuerySet | Iterable,
+    *,
+    serializer_class: type,
+    chunk_size: int = None,
+    **kwargs,
+) -> StreamingHttpResponse | Response:
+    """
+    Return a list response streamed as a JSON array.
+
+    The rows are serialized by `serializer_class`, built with `kwargs`, e.g.
+    a sparse fieldset. Other renderers than JSON, e.g. the browsable API,
+    get a regular response. As the status is sent before the rows are read,
+    the rows should not raise client errors.
+    """
+
+    serializer = serializer_class(**kwargs)
+    # Checked before streaming, e.g. the fieldset.
+    serializer.fields
+    if request.accepted_renderer.format != "json":
+        output = serializer_class(iterate_rows(rows), many=True, **kwargs)
+        return Response(data=output.data, status=HTTP_200_OK)
+
+    chunks = map_chunks(
+        iterate_chunks(rows, chunk_size),
+        serializer.to_representation,
+        prepare=getattr(serializer, "prefetch", None),
+    )
+    return StreamingHttpResponse(
+        encode_json_array(chunks),
+        status=HTTP_200_OK,
+        content_type="application/json",
+    )
@@ -0,0 +1,130 @@
+# Core
+import math
+import time
+import threading
+from collections import deque
+
+# Libs
+from django.core.cache.backends.base import BaseCache
+from django.core.exceptions import ImproperlyConfigured
+
+# Rate limiting and load shedding.
+#
+# Each throttled endpoint has a token bucket per client, kept in a cache
+# shared by the server processes: a request takes a token, and the tokens
+# are refilled at the endpoint rate up to its burst capacity. The load of a
+# process is tracked by a window of its recent request latencies.
+
+RATE_PERIODS = {
+    "s": 1,
+    "sec": 1,
+    "second": 1,
+    "m": 60,
+    "min": 60,
+    "minute": 60,
+    "h": 3600,
+    "hour": 3600,
+    "d": 86400,
+    "day": 86400,
+}
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    """Return the `(requests, seconds)` of a `<requests>/<period>` rate."""
+
+    requests, _, period = rate.partition("/")
+    try:
+        requests = int(requests)
+        seconds = RATE_PERIODS[period.strip().lower()]
+    except (ValueError, KeyError):
+        raise ImproperlyConfigured(f"Invalid rate {rate!r}, e.g. '10/min'.")
+    if requests < 1:
+        raise ImproperlyConfigured(f"Invalid rate {rate!r}, at least 1 request.")
+    return requests, seconds
+
+
+class TokenBucket:
+    """
+    The token buckets of a rate, by key.
+
+    A bucket holds up to `capacity` tokens and is refilled with `capacity`
+    tokens per `period` seconds: bursts of `capacity` requests, then the
+    average rate. A bucket is a cache entry read and written on each taken
+    token, not locked: concurrent requests of the same key may take the
+    same token, letting a few extra requests through.
+    """
+
+    def __init__(self, cache: BaseCache, capacity: int, period: int):
+        """Initialize buckets."""
+
+        self.cache = cache
+        self.capacity = capacity
+        self.period = period
+        self.refill_rate = capacity / period
+
+    def take(self, key: str) -> float:
+        """Take a token, return 0 or the seconds until a token is available."""
+
+        now = time.time()
+        tokens = self.capacity
+        state = self.cache.get(key)
+        if state is not None:
+            tokens, updated = state
+            tokens = min(self.capacity, tokens + (now - updated) * self.refill_rate)
+        if tokens < 1:
+            return (1 - tokens) / self.refill_rate
+        # A bucket left alone for a period is full, as if missing.
+        self.cache.set(key, (tokens - 1, now), timeout=self.period)
+        return 0.0
+
+
+class LatencyWindow:
+    """
+    The request latencies of the last `seconds`, and their p99.
+
+    The p99 is computed again at most every `refresh` seconds, and is 0
+    until `min_samples` latencies are in the window.
+    """
+
+    def __init__(
+        self,
+        seconds: float,
+        min_samples: int,
+        refresh: float = 0.5,
+        max_samples: int = 10000,
+    ):
+        """Initialize window."""
+
+        self.seconds = seconds
+        self.min_samples = min_samples
+        self.refresh = refresh
+        self._samples = deque(maxlen=max_samples)
+        self._p99 = 0.0
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, latency: float) -> None:
+        """Record a request latency, in seconds."""
+
+        self._samples.append((time.monotonic(), latency))
+
+    def p99(self) -> float:
+        """Return the 99th percentile latency of the window, in seconds."""
+
+        now = time.monotonic()
+        if now < self._expires:
+            return self._p99
+
+        with self._lock:
+            start = now - self.seconds
+            samples = self._samples
+            while samples and samples[0][0] < start:
+                samples.popleft()
+            latencies = sorted(latency for _, latency in list(samples))
+            if len(latencies) < self.min_samples:
+                self._p99 = 0.0
+            else:
+                # Nearest rank.
+                self._p99 = latencies[math.ceil(len(latencies) * 0.99) - 1]
+            self._expires = now + self.refresh
+        return self._p99
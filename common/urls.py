@@ -0,0 +1,90 @@
+# Core
+from importlib import import_module
+from functools import cached_property
+
+# Libs
+from django.utils.module_loading import import_string
+
+
+class _LazyURLConf:
+    """URL patterns of a module attribute, imported when first resolved."""
+
+    def __init__(self, module: str, attribute: str):
+        """Keep the patterns location."""
+
+        self.module = module
+        self.attribute = attribute
+
+    def __repr__(self) -> str:
+        """Return the patterns location."""
+
+        return f"<{self.module}.{self.attribute}>"
+
+    @cached_property
+    def urlpatterns(self) -> list:
+        """Import the patterns."""
+
+        return getattr(import_module(self.module), self.attribute)
+
+
+def lazy_include(
+    module: str,
+    attribute: str = "urlpatterns",
+    *,
+    app_name: str,
+    namespace: str,
+) -> tuple:
+    """
+    Include the URL patterns of a module like `include`, but lazily.
+
+    The module is imported when a request path first resolves under it
+    (or on `reverse`), instead of when the including URL conf is, so a
+    fresh process only imports the APIs it serves.
+    """
+
+    return _LazyURLConf(module, attribute), app_name, namespace
+
+
+class _LazyView:
+    """A view imported when first called."""
+
+    def __init__(self, dotted_path: str, **initkwargs):
+        """Keep the view location."""
+
+        self.dotted_path = dotted_path
+        self.initkwargs = initkwargs
+
+    def __repr__(self) -> str:
+        """Return the view location."""
+
+        return f"<{self.dotted_path}>"
+
+    @cached_property
+    def view(self):
+        """Import the view, class based views are set up once."""
+
+        view = import_string(self.dotted_path)
+        if isinstance(view, type):
+            view = view.as_view(**self.initkwargs)
+        return view
+
+    def __call__(self, request, *args, **kwargs):
+        """Serve the request."""
+
+        return self.view(request, *args, **kwargs)
+
+    def __getattr__(self, name: str):
+        """Expose the view attributes, e.g. `csrf_exempt`."""
+
+        return getattr(self.view, name)
+
+
+def lazy_view(dotted_path: str, **initkwargs) -> _LazyView:
+    """
+    Return a view imported on its first request.
+
+    For views whose module is expensive to import and seldom requested,
+    e.g. the schema views and drf-spectacular.
+    """
+
+    return _LazyView(dotted_path, **initkwargs)
@@ -0,0 +1,161 @@
+# Core
+import logging
+from time import perf_counter
+
+# Libs
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+from django.urls import get_resolver
+from django.utils.module_loading import import_string
+
+# Global
+from common import metrics
+
+logger = logging.getLogger("bluewave.warmup")
+
+# Start-up warm-up of a server process.
+#
+# The first requests of a fresh process fill the lazy caches of Django and
+# the project: model metadata, the URL resolver, the serializer and form
+# classes, the permission content types, the database pages of the hot
+# queries. The warm-up tasks (`WARMUP["TASKS"]`, dotted paths of functions
+# taking no argument) fill them before serving. Run by `config.wsgi`, i.e.
+# by the `serve` master before forking, its workers start warm.
+
+WARMUP_DURATION = metrics.Counter(
+    "bluewave_warmup_seconds_total",
+    "Time spent warming up the server processes, by task.",
+    ["task"],
+)
+
+
+def run_warmup(tasks: list[str] = None) -> dict[str, float | None]:
+    """
+    Run the warm-up tasks, return their durations in seconds by task.
+
+    A failed task is logged, its duration is None, and the next tasks run.
+    The database connections are closed afterwards: they must not be
+    shared by processes forked later.
+    """
+
+    config = settings.WARMUP
+    if tasks is None:
+        tasks = config["TASKS"] if config["ENABLED"] else []
+
+    durations = {}
+    start = perf_counter()
+    for task in tasks:
+        task_start = perf_counter()
+        try:
+            import_string(task)()
+        except Exception:
+            logger.exception("Warm-up task %s failed.", task)
+            durations[task] = None
+            continue
+        durations[task] = perf_counter() - task_start
+        WARMUP_DURATION.inc(durations[task], task=task)
+    connections.close_all()
+
+    if tasks:
+        logger.info(
+            "Warmed up in %.1f ms.",
+            (perf_counter() - start) * 1000,
+            extra={
+                "data": {
+                    task: None if duration is None else round(duration * 1000, 3)
+                    for task, duration in durations.items()
+                }
+            },
+        )
+    return durations
+
+
+# **=========== Tasks ===========**
+
+
+def warm_models() -> None:
+    """Fill the model metadata caches, e.g. the fields and relations."""
+
+    from django.contrib.contenttypes.models import ContentType
+
+    models = apps.get_models()
+    for model in models:
+        model._meta.get_fields()
+        model._meta._forward_fields_map
+        model._meta.fields_map
+    # The content types of the permission checks.
+    ContentType.objects.get_for_models(*models)
+
+
+def warm_urls() -> None:
+    """Import every URL conf and view, and compile the URL patterns."""
+
+    resolver = get_resolver()
+    resolver.reverse_dict
+    pending = [resolver]
+    while pending:
+        pattern = pending.pop()
+        # Compiled on first use.
+        pattern.pattern.regex
+        pending.extend(getattr(pattern, "url_patterns", ()))
+
+
+def warm_api() -> None:
+    """Import the REST framework classes used by the requests."""
+
+    from rest_framework.settings import api_settings
+
+    for name in api_settings.defaults:
+        getattr(api_settings, name)
+    for authentication in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        authentication()
+    for renderer in api_settings.DEFAULT_RENDERER_CLASSES:
+        renderer()
+
+
+def warm_middleware() -> None:
+    """Import the backends loaded by the middleware, and open the caches."""
+
+    from django.core.cache import caches
+
+    import_string(settings.MESSAGE_STORAGE)
+    import_string(settings.SESSION_ENGINE + ".SessionStore")
+    import_string(settings.SESSION_SERIALIZER)
+    for alias in settings.CACHES:
+        caches[alias].get("warmup")
+
+
+def warm_forms() -> None:
+    """Build the API schema of every project form once."""
+
+    from django import forms
+    from common.functions import form_to_api_schema
+
+    pending = [forms.BaseForm]
+    while pending:
+        form_class = pending.pop()
+        pending.extend(form_class.__subclasses__())
+        if not form_class.__module__.startswith("apps."):
+            continue
+        try:
+            form_to_api_schema(form=form_class())
+        except Exception:
+            # Forms requiring arguments are built by their requests.
+            continue
+
+
+def warm_serializers() -> None:
+    """Build the fields of every output serializer once."""
+
+    from common.serializers import Serializer
+
+    pending = [Serializer]
+    while pending:
+        serializer_class = pending.pop()
+        pending.extend(serializer_class.__subclasses__())
+        try:
+            serializer_class().fields
+        except Exception:
+            # Serializers requiring arguments are built by their requests.
+            continue
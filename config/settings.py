@@ -1,5 +1,6 @@
 import os
 import tomllib
+import tempfile
 from pathlib import Path
 from datetime import timedelta
 
@@ -50,6 +51,12 @@ INSTALLED_APPS = [
 # HTTP
 
 MIDDLEWARE = [
+    "common.middleware.MetricsMiddleware",
+    "common.middleware.LoadSheddingMiddleware",
+    "common.middleware.ThrottleMiddleware",
+    "common.middleware.RequestTimingMiddleware",
+    "common.middleware.ProfilingMiddleware",
+    "common.middleware.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -93,6 +100,25 @@ DATABASES = {
     }
 }
 
+# CACHES
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Shared by all the worker processes of a server, e.g. the rate limits.
+    "shared": env.get("caches", {}).get(
+        "shared",
+        {
+            "BACKEND": "common.cache.SharedFileCache",
+            "LOCATION": os.path.join(
+                "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(),
+                "bluewave-cache",
+            ),
+            "OPTIONS": {"MAX_ENTRIES": 100000, "CULL_EVERY": 1000},
+        },
+    ),
+}
+
 # GLOBALIZATION
 
 LANGUAGE_CODE = "en-us"
@@ -130,15 +156,26 @@ LOGGING = {
     },
     "formatters": {
         "rich": {"datefmt": "[%X]"},
+        "json": {"()": "common.log.JSONFormatter"},
     },
     "handlers": {
-        "console": {
-            "class": "rich.logging.RichHandler",
-            "filters": ["require_debug_true"],
-            "formatter": "rich",
-            "level": "DEBUG",
-            "rich_tracebacks": True,
-            "tracebacks_show_locals": True,
+        # Rich is only imported when debugging, the handler discards the
+        # records otherwise.
+        "console": (
+            {
+                "class": "rich.logging.RichHandler",
+                "filters": ["require_debug_true"],
+                "formatter": "rich",
+                "level": "DEBUG",
+                "rich_tracebacks": True,
+                "tracebacks_show_locals": True,
+            }
+            if DEBUG
+            else {"class": "logging.NullHandler"}
+        ),
+        "structured": {
+            "class": "logging.StreamHandler",
+            "formatter": "json",
         },
     },
     "loggers": {
@@ -150,6 +187,21 @@ LOGGING = {
             "handlers": ["console"],
             # "level": "DEBUG",  # TODO: remove on prod.
         },
+        "bluewave.requests": {
+            "handlers": ["structured"],
+            "level": "INFO",
+            "propagate": False,
+        },
+        "bluewave.db.slow": {
+            "handlers": ["structured"],
+            "level": "WARNING",
+            "propagate": False,
+        },
+        "bluewave.server": {
+            "handlers": ["structured"],
+            "level": "INFO",
+            "propagate": False,
+        },
     },
     "root": {
         "handlers": ["console"],
@@ -196,6 +248,10 @@ REST_FRAMEWORK = {
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
     "EXCEPTION_HANDLER": "common.api.api_exception_http",
+    "DEFAULT_RENDERER_CLASSES": (
+        "common.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
     "DATETIME_INPUT_FORMATS": ["%Y-%m-%dT%I:%M:%S %p", "iso-8601"],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
@@ -239,7 +295,15 @@ SPECTACULAR_SETTINGS = {
     },
     "REDOC_DIST": "SIDECAR",
     "SORT_OPERATIONS": False,
+    "DEFAULT_GENERATOR_CLASS": "apps.api.services.schema.SchemaGenerator",
     "ENUM_ADD_EXPLICIT_BLANK_NULL_CHOICE": False,
+    # Component names of the choice sets of same name fields, which would be
+    # generated from a hash otherwise. `TypeEnum` is the established name of
+    # the payment types.
+    "ENUM_NAME_OVERRIDES": {
+        "TypeEnum": "apps.transactions.models.PaymentType",
+        "EventInfoTypeEnum": "apps.transactions.models.EventType",
+    },
     "TAGS": [
         {"name": "Auth", "description": "Authentication actions endpoints."},
         {"name": "Users", "description": "Users actions endpoints."},
@@ -266,3 +330,238 @@ SPECTACULAR_SETTINGS = {
 # ----------------------------------------------------------------------
 
 API_URL = "/api/"
+
+# Client user the tables log in as.
+TABLE_CLIENT = {
+    "USERNAME": "bluewave",
+    "PASSWORD": env["core"]["user_client_password"],
+}
+
+# Session tokens of the tables, see `apps.tables.authentication`.
+TABLE_SESSION = {
+    "LIFETIME": timedelta(
+        hours=env.get("table_session", {}).get("lifetime_hours", 24),
+    ),
+    # Permissions of a session, on the endpoints open to table sessions.
+    "SCOPE": [
+        "products.list_product",
+        "transactions.create_order",
+        "transactions.view_order",
+    ],
+}
+
+# SERVER
+
+# Pre-fork server of the `serve` command.
+SERVER = {
+    "BIND": env.get("server", {}).get("bind", "127.0.0.1:8000"),
+    "WORKERS": env.get("server", {}).get("workers", os.cpu_count() or 1),
+    # Requests served by a worker before it is replaced, 0 never replaces.
+    # Each worker adds a random jitter, up to `MAX_REQUESTS_JITTER`.
+    "MAX_REQUESTS": env.get("server", {}).get("max_requests", 1000),
+    "MAX_REQUESTS_JITTER": env.get("server", {}).get("max_requests_jitter", 100),
+    # Seconds a worker may hang on a request before it is killed.
+    "TIMEOUT": env.get("server", {}).get("timeout", 30),
+    # Seconds a connection may stay idle, sending or receiving, before it is
+    # closed. Shorter than `TIMEOUT`: a worker serves one connection at a
+    # time, an idle client must not get it killed.
+    "READ_TIMEOUT": env.get("server", {}).get("read_timeout", 10),
+    # Seconds given to stopped workers to finish their requests.
+    "GRACEFUL_TIMEOUT": env.get("server", {}).get("graceful_timeout", 30),
+    "BACKLOG": env.get("server", {}).get("backlog", 2048),
+}
+
+# API SCHEMA
+
+API_SCHEMA = {
+    # Schema files generated by the `build_schema` command.
+    "DIR": env.get("schema", {}).get("dir", os.path.join(BASE_DIR, "build", "schema")),
+}
+
+# INSTRUMENTATION
+
+REQUEST_TIMING = {
+    # Fraction of requests (0.0 - 1.0) whose timings are logged.
+    "SAMPLE_RATE": env.get("instrumentation", {}).get("sample_rate", 0.0),
+    # Queries slower than this are logged, 0 disables the slow query log.
+    "SLOW_QUERY_MS": env.get("instrumentation", {}).get("slow_query_ms", 500),
+}
+
+# Cold start budgets of a fresh worker, see the `import_audit` command.
+STARTUP_TARGETS = {
+    "CHECK_MS": env.get("instrumentation", {}).get("check_target_ms", 1000),
+    "FIRST_REQUEST_MS": env.get("instrumentation", {}).get("request_target_ms", 750),
+}
+
+METRICS = {
+    # Shared by all the worker processes of a server, one file per process.
+    "DIR": env.get("metrics", {}).get(
+        "dir",
+        os.path.join(tempfile.gettempdir(), "bluewave-metrics"),
+    ),
+}
+
+PROFILING = {
+    # Fraction of requests (0.0 - 1.0) profiled, besides staff requests
+    # sent with the `X-Profile` header.
+    "SAMPLE_RATE": env.get("profiling", {}).get("sample_rate", 0.0),
+    "DIR": env.get("profiling", {}).get(
+        "dir",
+        os.path.join(tempfile.gettempdir(), "bluewave-profiles"),
+    ),
+}
+
+# COMPRESSION
+
+RESPONSE_COMPRESSION = {
+    # Smaller responses are sent uncompressed.
+    "MIN_SIZE": env.get("compression", {}).get("min_size", 1024),
+    "GZIP_LEVEL": env.get("compression", {}).get("gzip_level", 6),
+    # Brotli is preferred when the `brotli` package is installed.
+    "BROTLI_QUALITY": env.get("compression", {}).get("brotli_quality", 5),
+    "CONTENT_TYPES": (
+        "application/json",
+        "application/vnd.oai.openapi",
+        "text/",
+    ),
+}
+
+# STREAMING
+
+STREAMING = {
+    # Rows read per query and encoded at once by the streamed list responses.
+    "CHUNK_SIZE": env.get("streaming", {}).get("chunk_size", 500),
+}
+
+# AUDIT
+
+AUDIT_IDENTITIES = {
+    # Users kept in the audit identities cache of each process.
+    "CACHE_SIZE": env.get("audit", {}).get("cache_size", 1024),
+    # Changes of users made by other processes are seen after this delay.
+    "TTL": timedelta(seconds=env.get("audit", {}).get("ttl_seconds", 300)),
+}
+
+# ADMIN
+
+ADMIN_CHANGELIST = {
+    # Unfiltered change lists of larger tables show an estimated count.
+    "EXACT_COUNT_MAX": env.get("admin", {}).get("exact_count_max", 10000),
+}
+
+# THROTTLING
+
+THROTTLING = {
+    "CACHE": "shared",
+    # Requests per client address (`<requests>/<period>`), by URL name or
+    # namespace of the endpoints.
+    "RATES": env.get("throttling", {}).get(
+        "rates",
+        {
+            "api:tables:table:login": "10/min",
+            "api:users:auth:token_obtain_pair": "10/min",
+            "api:forms": "120/min",
+        },
+    ),
+    # Reverse proxies in front of the server, the client address is then
+    # read from `X-Forwarded-For`.
+    "NUM_PROXIES": env.get("throttling", {}).get("num_proxies", 0),
+}
+
+LOAD_SHEDDING = {
+    # Connections waiting to be accepted by the `serve` server, 0 disables.
+    "MAX_QUEUE_DEPTH": env.get("load_shedding", {}).get("max_queue_depth", 512),
+    # p99 latency of the requests of a process, 0 disables.
+    "MAX_P99_MS": env.get("load_shedding", {}).get("max_p99_ms", 5000),
+    "WINDOW_SECONDS": env.get("load_shedding", {}).get("window_seconds", 10),
+    # Fewer requests in the window never shed.
+    "MIN_SAMPLES": env.get("load_shedding", {}).get("min_samples", 100),
+    # URL names or namespaces of the long running endpoints, left out of
+    # the p99 latency.
+    "UNMEASURED": env.get("load_shedding", {}).get(
+        "unmeasured",
+        [
+            "api:reports",
+            "api:products:product:import",
+            "api:products:category:import",
+            "api:tables:table:import",
+            "api:orders:order:register_bulk",
+            "api:orders:order:update_status_bulk",
+        ],
+    ),
+    # Seconds clients are asked to wait before retrying.
+    "RETRY_AFTER": env.get("load_shedding", {}).get("retry_after", 1),
+}
+
+# WARMUP
+
+WARMUP = {
+    # Warm up when the WSGI application is loaded, e.g. by the `serve`
+    # master before forking the workers.
+    "ENABLED": env.get("warmup", {}).get("enabled", True),
+    # Functions run in order, see `common.warmup`.
+    "TASKS": env.get("warmup", {}).get(
+        "tasks",
+        [
+            "common.warmup.warm_urls",
+            "common.warmup.warm_models",
+            "common.warmup.warm_api",
+            "common.warmup.warm_middleware",
+            "common.warmup.warm_serializers",
+            "common.warmup.warm_forms",
+            "apps.products.services.product.warm_catalogue",
+            "apps.tables.services.table.warm_tables",
+            "apps.transactions.services.order.warm_orders",
+            "apps.users.services.user.warm_authentication",
+            "apps.users.services.audit.warm_audit_identities",
+        ],
+    ),
+}
+
+# IDEMPOTENCY
+
+IDEMPOTENCY_KEY_TTL = timedelta(
+    hours=env.get("idempotency", {}).get("ttl_hours", 24),
+)
+
+# KITCHEN QUEUE
+
+KITCHEN_QUEUE = {
+    # Changes up to this long before a cursor are sent again: a write
+    # committed after a response may carry an earlier timestamp.
+    "CURSOR_OVERLAP": timedelta(
+        seconds=env.get("kitchen", {}).get("cursor_overlap_seconds", 2),
+    ),
+    # Older cursors get the whole queue again.
+    "CURSOR_MAX_AGE": timedelta(
+        minutes=env.get("kitchen", {}).get("cursor_max_age_minutes", 60),
+    ),
+}
+
+# EVENTS
+
+TRANSACTION_EVENTS = {
+    # Events read per consumer request, by default and at most.
+    "BATCH_SIZE": env.get("events", {}).get("batch_size", 100),
+    "MAX_BATCH_SIZE": env.get("events", {}).get("max_batch_size", 1000),
+    # Events older than this are deleted by the `purge_events` command.
+    "RETENTION_DAYS": env.get("events", {}).get("retention_days", 30),
+}
+
+# REPORTS
+
+SALES_REPORTS = {
+    # Rows read per query by the report scans.
+    "CHUNK_SIZE": env.get("reports", {}).get("chunk_size", 10000),
+    # Longest reported date range, in days.
+    "MAX_DAYS": env.get("reports", {}).get("max_days", 366),
+}
+
+# ARCHIVE
+
+ORDER_ARCHIVE = {
+    # Orders of payments paid more than this many days ago are archived.
+    "AFTER_DAYS": env.get("archive", {}).get("after_days", 30),
+    # Payments moved per transaction.
+    "BATCH_SIZE": env.get("archive", {}).get("batch_size", 500),
+}
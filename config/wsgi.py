@@ -5,3 +5,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
+
+# Filled before serving, see `common.warmup`.
+from common.warmup import run_warmup  # noqa: E402
+
+run_warmup()